@@ -1,33 +1,249 @@
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+"""
+HTTP API for the frontend: the AI chat sidebar and freelancer matching.
+
+Development server:  python ai.py
+Production serving:  gunicorn -c gunicorn.conf.py ai:app
+
+Models are loaded when this module is imported. gunicorn's preload_app
+imports it once in the master, and the workers forked afterwards share the
+loaded pages copy-on-write.
+"""
+import os
 import sys
-sys.path.append('../python')
-from upworkModel import UpworkAI
+import uuid
+import logging
+import threading
+import concurrent.futures
+from dataclasses import asdict
+
+from flask import Flask, Response, request, jsonify
+from flask_cors import CORS
+
+PYTHON_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(PYTHON_DIR)
+import metrics
+from match_cache import DiskMatchCache, LocalMatchCache
+from sjm import Project
+from upworkModel import UpworkIntegrationModel, DEFAULT_INDEX_PATH, configure_logging
+
+try:
+    from upworkModel import UpworkAI
+except ImportError:
+    UpworkAI = None
+
+logger = logging.getLogger(__name__)
+
+CSV_PATH = os.getenv('UPWORK_CSV_PATH', os.path.join(PYTHON_DIR, 'upwork_freelancers.csv'))
+INDEX_PATH = os.getenv('UPWORK_INDEX_PATH', os.path.join(PYTHON_DIR, DEFAULT_INDEX_PATH))
+# Requests doing model work at once in one worker process; the rest wait for a slot
+MAX_CONCURRENT_REQUESTS = int(os.getenv('AI_MAX_CONCURRENT_REQUESTS', '4'))
+# Seconds a request may wait for a slot before it is turned away with 503
+QUEUE_TIMEOUT = float(os.getenv('AI_QUEUE_TIMEOUT', '5'))
+# Seconds of model work a request may take before it is answered with 504.
+# gunicorn's gthread timeout does not cover single requests, so this is the only deadline.
+REQUEST_TIMEOUT = float(os.getenv('AI_REQUEST_TIMEOUT', '20'))
+MAX_TOP_N = 50
+# Record per-stage timings and counters and serve them at /metrics.
+# Every gunicorn worker keeps its own, so scrape each worker or run one.
+METRICS_ENABLED = os.getenv('AI_METRICS', '0') == '1'
+# Match result cache: 'local' per worker, 'disk' shared by all workers through a SQLite file, or 'off'
+MATCH_CACHE = os.getenv('AI_MATCH_CACHE', 'local')
+MATCH_CACHE_PATH = os.getenv('AI_MATCH_CACHE_PATH', os.path.join(PYTHON_DIR, 'match_cache.sqlite3'))
+MATCH_CACHE_TTL = float(os.getenv('AI_MATCH_CACHE_TTL', '300'))
+
+configure_logging()
+
+
+def create_match_cache():
+    if MATCH_CACHE == 'local':
+        return LocalMatchCache(ttl=MATCH_CACHE_TTL)
+    if MATCH_CACHE == 'disk':
+        return DiskMatchCache(MATCH_CACHE_PATH, ttl=MATCH_CACHE_TTL)
+    if MATCH_CACHE != 'off':
+        raise ValueError(f"AI_MATCH_CACHE must be 'local', 'disk' or 'off', not {MATCH_CACHE!r}")
+    return None
+
 
 app = Flask(__name__)
 CORS(app)
 
-# Initialize the AI model
-ai_model = UpworkAI()
+# Initialize the AI models
+ai_model = UpworkAI() if UpworkAI is not None else None
+matching_model = UpworkIntegrationModel(CSV_PATH, index_path=INDEX_PATH, match_cache=create_match_cache())
+matching_model.initialize_matching_engine()
+
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+# One thread per slot; created on first use, so in each worker after the fork
+_model_pool = None
+_model_pool_lock = threading.Lock()
+metrics_sink = metrics.enable() if METRICS_ENABLED else None
+
+
+class ServerBusy(Exception):
+    """
+    No request slot became free within QUEUE_TIMEOUT.
+    """
+
+
+def run_model(fn, *args, **kwargs):
+    """
+    Run model work on one of the worker's request slots, waiting at most REQUEST_TIMEOUT for it.
+
+    Work that misses the deadline can't be interrupted; it keeps its slot
+    until it returns, so timed-out requests don't pile up past the cap.
+
+    Raises:
+        ServerBusy: If no slot frees up within QUEUE_TIMEOUT.
+        concurrent.futures.TimeoutError: If fn is still running at the deadline.
+    """
+    global _model_pool
+    if not _request_slots.acquire(timeout=QUEUE_TIMEOUT):
+        raise ServerBusy()
+    try:
+        with _model_pool_lock:
+            if _model_pool is None:
+                _model_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix='model'
+                )
+        future = _model_pool.submit(fn, *args, **kwargs)
+    except BaseException:
+        _request_slots.release()
+        raise
+    future.add_done_callback(lambda _: _request_slots.release())
+    return future.result(timeout=REQUEST_TIMEOUT)
+
+
+def busy_response():
+    return jsonify({'success': False, 'error': 'Server is busy, please retry'}), 503
+
+
+def timeout_response():
+    return jsonify({'success': False, 'error': f'Request took longer than {REQUEST_TIMEOUT:g}s'}), 504
+
+
+def parse_project(data) -> Project:
+    """
+    Build a Project from a /match request body.
+
+    Raises:
+        ValueError: If a field is missing or has the wrong type.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Request body must be a JSON object")
+
+    description = data.get('description')
+    if not isinstance(description, str) or not description.strip():
+        raise ValueError("'description' must be a non-empty string")
+
+    required_skills = data.get('required_skills', [])
+    if not isinstance(required_skills, list) or not all(isinstance(skill, str) for skill in required_skills):
+        raise ValueError("'required_skills' must be a list of strings")
+
+    budget_range = data.get('budget_range')
+    if (
+        not isinstance(budget_range, list) or len(budget_range) != 2
+        or not all(isinstance(bound, (int, float)) and not isinstance(bound, bool) for bound in budget_range)
+    ):
+        raise ValueError("'budget_range' must be a [min, max] pair of numbers")
+
+    complexity = data.get('complexity', 'medium')
+    if complexity not in ('low', 'medium', 'high'):
+        raise ValueError("'complexity' must be one of 'low', 'medium', 'high'")
+
+    timeline = data.get('timeline')
+    if timeline is not None and (not isinstance(timeline, int) or isinstance(timeline, bool)):
+        raise ValueError("'timeline' must be a number of days")
+
+    return Project(
+        id=str(data.get('id') or uuid.uuid4()),
+        description=description,
+        required_skills=required_skills,
+        budget_range=(float(budget_range[0]), float(budget_range[1])),
+        complexity=complexity,
+        timeline=timeline,
+    )
+
 
 @app.route('/ai/chat', methods=['POST'])
 def chat():
+    if ai_model is None:
+        return jsonify({'success': False, 'error': 'AI chat is not available'}), 503
     try:
         data = request.json
         message = data.get('message')
-        
+
         # Get response from your AI model
-        response = ai_model.get_response(message)
-        
+        response = run_model(ai_model.get_response, message)
+
         return jsonify({
             'success': True,
             'response': response
         })
+    except ServerBusy:
+        return busy_response()
+    except concurrent.futures.TimeoutError:
+        logger.warning(f"Chat response missed the {REQUEST_TIMEOUT:g}s deadline")
+        return timeout_response()
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+
+@app.route('/match', methods=['POST'])
+def match():
+    """
+    Top freelancer matches for a project.
+
+    Body: {"description": str, "budget_range": [min, max], "required_skills": [str],
+    "complexity": "low" | "medium" | "high", "timeline": int, "top_n": int}
+    """
+    data = request.get_json(silent=True)
+    try:
+        project = parse_project(data)
+        top_n = data.get('top_n', 5)
+        if not isinstance(top_n, int) or isinstance(top_n, bool) or not 1 <= top_n <= MAX_TOP_N:
+            raise ValueError(f"'top_n' must be an integer between 1 and {MAX_TOP_N}")
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    try:
+        matches = run_model(matching_model.find_top_matches, project, top_n=top_n)
+    except ServerBusy:
+        return busy_response()
+    except concurrent.futures.TimeoutError:
+        logger.warning(f"Matching project {project.id} missed the {REQUEST_TIMEOUT:g}s deadline")
+        return timeout_response()
+    except Exception as e:
+        logger.error(f"Matching failed for project {project.id}: {e}")
+        return jsonify({'success': False, 'error': 'Matching failed'}), 500
+
+    return jsonify({
+        'success': True,
+        'project_id': project.id,
+        'matches': [
+            {
+                'freelancer': asdict(match['freelancer']),
+                'combined_score': match['combined_score'],
+                'content_score': match['content_score'],
+                'collaborative_score': match['collaborative_score'],
+                'skill_overlap': match['skill_overlap'],
+            }
+            for match in matches
+        ],
+    })
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """
+    Pipeline stage histograms and counters in the Prometheus text format.
+    """
+    if metrics_sink is None:
+        return jsonify({'success': False, 'error': 'Metrics are disabled; set AI_METRICS=1'}), 404
+    return Response(metrics.prometheus_text(metrics_sink), mimetype='text/plain; version=0.0.4')
+
+
 if __name__ == '__main__':
-    app.run(port=5000)
\ No newline at end of file
+    app.run(port=5000, threaded=True)
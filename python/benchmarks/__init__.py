@@ -0,0 +1,10 @@
+"""
+Benchmarks for the matching pipeline.
+
+Run from the python/ directory:
+
+    python -m benchmarks.run --size 100k --output results/100k.json
+    python -m benchmarks.compare results/before.json results/after.json
+    python -m benchmarks.bench_retrieval
+    python -m benchmarks.bench_import
+"""
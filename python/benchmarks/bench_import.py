@@ -0,0 +1,87 @@
+"""
+Cold-start cost of the Python entry points.
+
+Each module is imported in a fresh interpreter several times, and the
+median wall time is reported with the slowest imports from `-X importtime`.
+Importing ai.py also loads the matching model, since that is what a
+serving worker pays before its first request.
+
+    python -m benchmarks.bench_import --runs 5
+"""
+import os
+import sys
+import argparse
+import subprocess
+import tempfile
+from typing import List, Tuple
+
+import numpy as np
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_POINTS = ['freelancer', 'upworkModel', 'ai']
+
+TIMED_IMPORT = (
+    "import time; start = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def _run(args: List[str], cwd: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=PYTHON_DIR, PYTHONDONTWRITEBYTECODE='')
+    return subprocess.run([sys.executable] + args, cwd=cwd, env=env, capture_output=True, text=True)
+
+
+def time_import(module: str, cwd: str) -> float:
+    result = _run(['-c', TIMED_IMPORT.format(module=module)], cwd)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(module: str, cwd: str, count: int) -> List[Tuple[float, str]]:
+    """
+    Imports pulled in by the module (two levels deep) with the largest cumulative time, in seconds.
+    """
+    result = _run(['-X', 'importtime', '-c', f"import {module}"], cwd)
+    packages = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue
+        # importtime indents each nesting level by two spaces after one separator space
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if 1 <= depth <= 2:
+            packages.append((int(cumulative) / 1e6, '  ' * (depth - 1) + name.strip()))
+    return sorted(packages, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=5, help="slowest imported packages to list per module")
+    parser.add_argument('modules', nargs='*', default=ENTRY_POINTS)
+    args = parser.parse_args()
+
+    # Run from a scratch directory so log files land outside the repository
+    with tempfile.TemporaryDirectory() as cwd:
+        # One untimed run warms the bytecode cache and the OS page cache
+        for module in args.modules:
+            time_import(module, cwd)
+
+        print(f"{'module':<14}{'median s':>10}{'min s':>10}{'max s':>10}")
+        breakdowns = {}
+        for module in args.modules:
+            timings = np.array([time_import(module, cwd) for _ in range(args.runs)])
+            print(f"{module:<14}{np.median(timings):>10.3f}{timings.min():>10.3f}{timings.max():>10.3f}")
+            breakdowns[module] = slowest_imports(module, cwd, args.top)
+
+        for module, packages in breakdowns.items():
+            print(f"\nslowest imports under {module}:")
+            for seconds, name in packages:
+                print(f"  {seconds:>8.3f}s  {name}")
+
+
+if __name__ == '__main__':
+    main()
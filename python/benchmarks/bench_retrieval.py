@@ -0,0 +1,77 @@
+"""
+Recall vs latency of the two-stage (retrieve, then re-rank) matching pipeline
+against exact scoring of the whole pool.
+
+    python -m benchmarks.bench_retrieval --pool 200000 --queries 50
+"""
+import time
+import argparse
+import logging
+from typing import List
+
+import numpy as np
+
+from sjm import CollaborativeModel, MatchingEngine, Project, SkillsExtract
+from benchmarks.generators import generate_freelancer_store, generate_projects
+
+
+def time_queries(run, projects: List[Project]):
+    latencies, results = [], []
+    for project in projects:
+        start = time.perf_counter()
+        results.append(run(project))
+        latencies.append(time.perf_counter() - start)
+    return np.array(latencies) * 1000, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pool', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=30)
+    parser.add_argument('--top-n', type=int, default=10)
+    parser.add_argument('--candidates', type=int, nargs='+', default=[250, 1000, 4000, 16000])
+    parser.add_argument('--depths', type=int, nargs='+', default=[0, 2000, 20000], help="0 reads full postings")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    build_start = time.perf_counter()
+    engine = MatchingEngine(
+        generate_freelancer_store(args.pool, args.seed),
+        generate_projects(50, args.seed + 2),
+        SkillsExtract(),
+        collaborative_model=CollaborativeModel(),
+    )
+    engine.train_models()
+    engine.profile_index.impact_index()
+    print(f"pool={args.pool} built in {time.perf_counter() - build_start:.1f}s")
+
+    projects = generate_projects(args.queries, args.seed + 1)
+    # Warm the skill extraction cache so both stages time scoring only
+    for project in projects:
+        engine.skill_extractor.extract_skills(project.description)
+
+    exact_ms, exact = time_queries(lambda p: engine.match_freelancers(p, top_n=args.top_n), projects)
+    exact_ids = [[match['freelancer'].id for match in matches] for matches in exact]
+    print(f"{'mode':<10}{'candidates':>12}{'depth':>8}{'mean ms':>10}{'p95 ms':>10}{'recall@' + str(args.top_n):>12}")
+    print(f"{'exact':<10}{'-':>12}{'-':>8}{exact_ms.mean():>10.2f}{np.percentile(exact_ms, 95):>10.2f}{1.0:>12.3f}")
+
+    for depth in args.depths:
+        for n_candidates in args.candidates:
+            def two_stage(project):
+                rows = engine.retrieve_candidates(project, n_candidates=n_candidates, depth=depth or None)
+                return engine.match_freelancers(project, top_n=args.top_n, rows=rows)
+
+            approx_ms, approx = time_queries(two_stage, projects)
+            recall = np.mean([
+                len(set(ids) & {match['freelancer'].id for match in matches}) / max(len(ids), 1)
+                for ids, matches in zip(exact_ids, approx)
+            ])
+            print(
+                f"{'two-stage':<10}{n_candidates:>12}{depth or 'all':>8}"
+                f"{approx_ms.mean():>10.2f}{np.percentile(approx_ms, 95):>10.2f}{recall:>12.3f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
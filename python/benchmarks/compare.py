@@ -0,0 +1,35 @@
+"""
+Compare two benchmark result files; exits with status 1 on a regression.
+
+    python -m benchmarks.compare results/before.json results/after.json --threshold 0.1
+"""
+import sys
+import argparse
+
+from benchmarks.harness import compare, load_results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--threshold', type=float, default=0.10, help="relative worsening reported as a regression")
+    args = parser.parse_args()
+
+    baseline, current = load_results(args.baseline), load_results(args.current)
+    if baseline['params'] != current['params']:
+        print(f"warning: runs used different parameters: {baseline['params']} vs {current['params']}")
+
+    changes = compare(baseline, current, args.threshold)
+    print(f"{'benchmark':<22}{'metric':<16}{'baseline':>12}{'current':>12}{'change':>10}")
+    for change in changes:
+        flag = '  REGRESSION' if change['regression'] else ''
+        print(
+            f"{change['name']:<22}{change['metric']:<16}{change['baseline']:>12.2f}"
+            f"{change['current']:>12.2f}{change['change']:>+10.1%}{flag}"
+        )
+    return 1 if any(change['regression'] for change in changes) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
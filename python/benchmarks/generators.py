@@ -0,0 +1,182 @@
+"""
+Seeded generators for synthetic freelancer pools and job postings.
+
+Skills are drawn from SkillsExtract's MANUAL_KEYWORDS vocabulary, with a
+job-title-specific core so profiles and descriptions overlap the way real
+ones do. The same seed always produces the same data.
+"""
+import csv
+import uuid
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from sjm import MANUAL_KEYWORDS, FreelancerStore, Project
+
+# Named sizes accepted by the benchmark runner
+SIZES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+# Core skills per job title; every entry is a MANUAL_KEYWORDS keyword
+TITLE_SKILLS = {
+    "Web Developer": ["HTML", "CSS", "JavaScript", "React", "Node.js", "PHP", "WordPress", "Responsive design"],
+    "Full-Stack Developer": ["JavaScript", "TypeScript", "React", "Node.js", "Django", "SQL", "GraphQL", "Docker"],
+    "Data Scientist": ["Python", "data science", "machine learning", "Pandas", "NumPy", "scikit-learn", "statistics", "SQL"],
+    "Machine Learning Engineer": ["Python", "deep learning", "TensorFlow", "PyTorch", "Keras", "NLP", "computer vision"],
+    "Data Engineer": ["Python", "SQL", "data engineering", "Spark", "Hadoop", "Big Data", "AWS"],
+    "Mobile Developer": ["Swift", "Kotlin", "Java", "JavaScript", "React", "UI design"],
+    "DevOps Engineer": ["DevOps", "CI/CD", "Docker", "Kubernetes", "Terraform", "Ansible", "AWS", "Bash"],
+    "Cloud Architect": ["cloud computing", "AWS", "Microsoft Azure", "Google Cloud Platform", "cloud architecture", "serverless architecture"],
+    "Security Analyst": ["cybersecurity", "penetration testing", "network security", "SIEM", "incident response", "threat analysis"],
+    "Graphic Designer": ["graphic design", "Adobe Photoshop", "Adobe Illustrator", "Canva", "branding", "Figma"],
+    "UI/UX Designer": ["UI design", "UX design", "Figma", "Adobe XD", "Sketch", "prototyping", "interaction design"],
+    "Digital Marketer": ["digital marketing", "SEO", "social media marketing", "Google Ads", "Facebook Ads", "email marketing"],
+    "Content Writer": ["content writing", "copywriting", "blogging", "editing", "proofreading", "SEO"],
+    "Technical Writer": ["technical writing", "editing", "writing", "proofreading"],
+    "Project Manager": ["project management", "Agile", "Scrum", "Kanban", "Jira", "Trello", "Asana"],
+    "Game Developer": ["game development", "Unity", "Unreal Engine", "C#", "C++", "3D design", "Blender"],
+    "Virtual Assistant": ["virtual assistant", "data entry", "customer support", "transcription", "business communication"],
+    "Video Editor": ["video editing", "video production", "motion graphics", "audio editing"],
+}
+JOB_TITLES = list(TITLE_SKILLS)
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "Aisha", "Wei", "Carlos", "Priya", "Olusegun", "Yuki", "Fatima", "Ivan", "Sofia", "Mateo",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Okafor", "Chen", "Kumar", "Tanaka", "Haddad", "Petrov", "Rossi", "Silva", "Nguyen", "Kowalski",
+]
+PRODUCTS = [
+    "an online store", "a SaaS dashboard", "a mobile banking app", "a marketing website", "an analytics pipeline",
+    "a booking platform", "an internal CRM", "a recommendation engine", "a brand identity", "a video course",
+]
+OPENERS = ["We need", "Looking for", "Hiring", "Seeking", "Our startup needs"]
+DETAILS = [
+    "Must communicate clearly and meet weekly milestones.",
+    "Long-term collaboration is possible for the right person.",
+    "Please share relevant portfolio work in your proposal.",
+    "The existing codebase needs refactoring and better tests.",
+    "We expect clean documentation and regular progress updates.",
+]
+
+UPWORK_HEADER = [
+    'freelancer_id', 'name', 'job_title', 'location', 'skills', 'hourly_rate', 'total_jobs',
+    'hours_worked', 'success_rate', 'top_rated', 'years_of_experience', 'portfolio_url',
+]
+
+def _skills(rng: np.random.Generator, title: str) -> List[str]:
+    core = TITLE_SKILLS[title]
+    chosen = list(rng.choice(core, size=rng.integers(2, min(len(core), 6) + 1), replace=False))
+    # A few profiles list unrelated extras, as real ones do
+    for keyword in rng.choice(MANUAL_KEYWORDS, size=rng.integers(0, 3)):
+        if keyword not in chosen:
+            chosen.append(str(keyword))
+    return chosen
+
+
+def iter_freelancer_rows(count: int, seed: int = 0, block_size: int = 100_000) -> Iterator[List[Dict]]:
+    """
+    Upwork-style CSV rows (see UPWORK_HEADER) in blocks of block_size.
+    """
+    rng = np.random.default_rng(seed)
+    for start in range(0, count, block_size):
+        size = min(block_size, count - start)
+        titles = rng.choice(JOB_TITLES, size=size)
+        first = rng.choice(FIRST_NAMES, size=size)
+        last = rng.choice(LAST_NAMES, size=size)
+        hourly_rate = np.clip(np.round(rng.lognormal(np.log(35), 0.6, size=size), 2), 5, 250)
+        total_jobs = rng.negative_binomial(1, 0.03, size=size)
+        hours_worked = total_jobs * rng.integers(5, 80, size=size)
+        success_rate = np.clip(np.round(rng.normal(88, 9, size=size)), 40, 100).astype(int)
+        top_rated = (success_rate >= 90) & (rng.random(size) < 0.4)
+        experience = rng.integers(0, 26, size=size)
+        block = []
+        for i in range(size):
+            row_id = start + i
+            block.append({
+                'freelancer_id': str(uuid.UUID(bytes=rng.bytes(16), version=4)),
+                'name': f"{first[i]} {last[i]}",
+                'job_title': str(titles[i]),
+                'location': "Remote",
+                'skills': ", ".join(_skills(rng, titles[i])),
+                'hourly_rate': float(hourly_rate[i]),
+                'total_jobs': int(total_jobs[i]),
+                'hours_worked': int(hours_worked[i]),
+                'success_rate': int(success_rate[i]),
+                'top_rated': bool(top_rated[i]),
+                'years_of_experience': int(experience[i]),
+                'portfolio_url': f"https://portfolio.example.com/{row_id}",
+            })
+        yield block
+
+
+def write_freelancer_csv(path: str, count: int, seed: int = 0) -> str:
+    """
+    Write an Upwork-format freelancer CSV without holding it in memory.
+    """
+    with open(path, 'w', newline='', encoding='utf-8') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=UPWORK_HEADER)
+        writer.writeheader()
+        for block in iter_freelancer_rows(count, seed):
+            writer.writerows(block)
+    return path
+
+
+def generate_freelancer_store(count: int, seed: int = 0) -> FreelancerStore:
+    """
+    The same pool as write_freelancer_csv, built in memory as the Upwork model would load it.
+    """
+    columns: Dict[str, list] = {
+        column: [] for column in FreelancerStore.TEXT_COLUMNS + list(FreelancerStore.NUMERIC_COLUMNS)
+    }
+    skills: List[List[str]] = []
+    for block in iter_freelancer_rows(count, seed):
+        for row in block:
+            columns['id'].append(row['freelancer_id'])
+            columns['username'].append(row['name'])
+            columns['name'].append(row['name'])
+            columns['job_title'].append(row['job_title'])
+            columns['profile_url'].append(row['portfolio_url'])
+            columns['experience'].append(row['years_of_experience'])
+            columns['rating'].append(row['success_rate'])
+            columns['hourly_rate'].append(row['hourly_rate'])
+            columns['availability'].append(row['top_rated'])
+            columns['total_sales'].append(row['total_jobs'])
+            # Same split as the CSV loader
+            skills.append(row['skills'].split(','))
+    return FreelancerStore.from_columns(columns, skills)
+
+
+def generate_descriptions(count: int, seed: int = 1) -> List[Tuple[str, List[str]]]:
+    """
+    Job descriptions with the skills they were written around.
+    """
+    rng = np.random.default_rng(seed)
+    descriptions = []
+    for _ in range(count):
+        title = str(rng.choice(JOB_TITLES))
+        skills = [str(skill) for skill in rng.choice(TITLE_SKILLS[title], size=min(3, len(TITLE_SKILLS[title])), replace=False)]
+        description = (
+            f"{rng.choice(OPENERS)} a {title.lower()} to build {rng.choice(PRODUCTS)}. "
+            f"Experience with {', '.join(skills[:-1])} and {skills[-1]} is required. "
+            f"{rng.choice(DETAILS)}"
+        )
+        descriptions.append((description, skills))
+    return descriptions
+
+
+def generate_projects(count: int, seed: int = 1) -> List[Project]:
+    rng = np.random.default_rng(seed + 1_000)
+    projects = []
+    for i, (description, skills) in enumerate(generate_descriptions(count, seed)):
+        low = float(np.round(rng.uniform(10, 60), 2))
+        projects.append(Project(
+            id=f"p{i}",
+            description=description,
+            required_skills=skills,
+            budget_range=(low, float(np.round(low + rng.uniform(10, 120), 2))),
+            complexity=str(rng.choice(['low', 'medium', 'high'], p=[0.3, 0.5, 0.2])),
+            timeline=int(rng.integers(7, 120)),
+        ))
+    return projects
@@ -0,0 +1,170 @@
+"""
+Timing harness: latency percentiles, throughput and peak memory per benchmark,
+saved as JSON so runs can be compared for regressions.
+"""
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Metrics where a larger value is worse
+LOWER_IS_BETTER = ['p50_ms', 'p90_ms', 'p99_ms', 'mean_ms', 'peak_memory_mb']
+HIGHER_IS_BETTER = ['throughput']
+
+
+def run_benchmark(
+    name: str,
+    func: Callable[[Any], Any],
+    inputs: Sequence,
+    items_per_call: int = 1,
+    warmup: int = 2,
+    memory_calls: int = 5,
+    params: Optional[Dict] = None
+) -> Dict:
+    """
+    Time func over every input.
+
+    Latencies come from a plain pass; peak memory from a separate, shorter
+    pass under tracemalloc, which would otherwise inflate the timings.
+
+    Args:
+        name (str): Benchmark name, the key results are compared by.
+        func (Callable): Called once per input.
+        inputs (Sequence): Inputs of the timed calls.
+        items_per_call (int, optional): Work items one call processes (rows, projects),
+            so throughput is reported in items per second.
+        warmup (int, optional): Untimed calls made first.
+        memory_calls (int, optional): Calls traced for peak memory; 0 skips the memory pass.
+        params (Dict, optional): Parameters recorded with the result, e.g. the pool size.
+
+    Returns:
+        Dict: name, params, calls, latency percentiles in ms, throughput and peak memory in MB.
+    """
+    for value in list(inputs)[:warmup]:
+        func(value)
+
+    latencies = np.empty(len(inputs))
+    total_start = time.perf_counter()
+    for i, value in enumerate(inputs):
+        start = time.perf_counter()
+        func(value)
+        latencies[i] = time.perf_counter() - start
+    total = time.perf_counter() - total_start
+
+    peak_memory_mb = None
+    if memory_calls > 0:
+        tracemalloc.start()
+        try:
+            for value in list(inputs)[:memory_calls]:
+                func(value)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak_memory_mb = peak / 2 ** 20
+
+    latencies_ms = latencies * 1000
+    return {
+        'name': name,
+        'params': params or {},
+        'calls': len(inputs),
+        'p50_ms': float(np.percentile(latencies_ms, 50)),
+        'p90_ms': float(np.percentile(latencies_ms, 90)),
+        'p99_ms': float(np.percentile(latencies_ms, 99)),
+        'mean_ms': float(latencies_ms.mean()),
+        'max_ms': float(latencies_ms.max()),
+        'throughput': len(inputs) * items_per_call / total if total > 0 else float('inf'),
+        'peak_memory_mb': peak_memory_mb,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def environment() -> Dict:
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'git_commit': _git_commit(),
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def save_results(path: str, results: List[Dict], params: Dict):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'environment': environment(), 'params': params, 'results': results}, f, indent=2)
+
+
+def load_results(path: str) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def format_results(results: List[Dict]) -> str:
+    lines = [
+        f"{'benchmark':<22}{'calls':>7}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}"
+        f"{'items/s':>12}{'peak MB':>10}"
+    ]
+    for result in results:
+        peak = result['peak_memory_mb']
+        lines.append(
+            f"{result['name']:<22}{result['calls']:>7}{result['p50_ms']:>10.2f}{result['p90_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['throughput']:>12.1f}{'-' if peak is None else f'{peak:.1f}':>10}"
+        )
+    return '\n'.join(lines)
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = 0.10) -> List[Dict]:
+    """
+    Relative change of every metric between two saved runs.
+
+    Args:
+        baseline (Dict): Results loaded with load_results.
+        current (Dict): Results loaded with load_results.
+        threshold (float, optional): Relative worsening reported as a regression.
+
+    Returns:
+        List[Dict]: One entry per benchmark and metric present in both runs, with
+            'change' (positive means worse) and a 'regression' flag.
+    """
+    baseline_results = {result['name']: result for result in baseline['results']}
+    changes = []
+    for result in current['results']:
+        before = baseline_results.get(result['name'])
+        if before is None:
+            continue
+        for metric in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            changes.append({
+                'name': result['name'],
+                'metric': metric,
+                'baseline': old,
+                'current': new,
+                'change': change,
+                'regression': change > threshold,
+            })
+    return changes
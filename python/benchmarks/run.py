@@ -0,0 +1,126 @@
+"""
+Benchmark the matching pipeline on a seeded synthetic pool.
+
+    python -m benchmarks.run --size 100k --output results/100k.json
+    python -m benchmarks.run --size 1k --only extract_skills match_freelancers
+
+Sizes: 1k, 10k, 100k, 1m (or a plain row count). The generated CSV is
+written to a temporary directory unless --csv names a file to keep.
+"""
+import os
+import sys
+import argparse
+import logging
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from sjm import MatchingEngine, SkillsExtract, normalize_csv
+from upworkModel import UPWORK_CSV_COLUMNS, UpworkIntegrationModel
+from benchmarks.generators import SIZES, generate_descriptions, generate_projects, write_freelancer_csv
+from benchmarks.harness import format_results, run_benchmark, save_results
+
+
+def bench_extract_skills(args, csv_path: str) -> List[Dict]:
+    # Memoization off, so every call does the full extraction
+    extractor = SkillsExtract(cache_size=0)
+    descriptions = [description for description, _ in generate_descriptions(args.queries, args.seed + 1)]
+    return [run_benchmark('extract_skills', extractor.extract_skills, descriptions)]
+
+
+def bench_normalize_csv(args, csv_path: str) -> List[Dict]:
+    return [run_benchmark(
+        'normalize_csv',
+        lambda path: normalize_csv(path, UPWORK_CSV_COLUMNS),
+        [csv_path] * args.repeat,
+        items_per_call=args.rows,
+        warmup=0,
+        memory_calls=1,
+    )]
+
+
+def bench_matching(args, csv_path: str) -> List[Dict]:
+    model = UpworkIntegrationModel(csv_path)
+    model.initialize_matching_engine()
+    engine: MatchingEngine = model.matching_engine
+    projects = generate_projects(args.queries, args.seed + 1)
+    # Warm the extraction cache: these benchmarks time scoring and filtering
+    for project in projects:
+        engine.skill_extractor.extract_skills(project.description)
+
+    results = [
+        run_benchmark(
+            'match_freelancers',
+            lambda project: engine.match_freelancers(project, top_n=args.top_n),
+            projects,
+        ),
+        run_benchmark(
+            'match_projects',
+            lambda batch: engine.match_projects(batch, top_n=args.top_n),
+            [projects] * args.repeat,
+            items_per_call=len(projects),
+            warmup=1,
+            memory_calls=1,
+        ),
+    ]
+
+    # filter_freelancers on a fixed, generous candidate list per project
+    candidates = {project.id: engine.match_freelancers(project, top_n=args.top_n * 20) for project in projects}
+    results.append(run_benchmark(
+        'filter_freelancers',
+        lambda project: model.filter_freelancers(project, candidates[project.id]),
+        projects,
+    ))
+    results.append(run_benchmark(
+        'find_top_matches',
+        lambda project: model.find_top_matches(project, top_n=args.top_n),
+        projects,
+    ))
+    return results
+
+
+SUITES: Dict[str, Callable] = {
+    'extract_skills': bench_extract_skills,
+    'normalize_csv': bench_normalize_csv,
+    'matching': bench_matching,
+}
+
+
+def _parse_size(value: str) -> int:
+    return SIZES[value.lower()] if value.lower() in SIZES else int(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', default='1k', help=f"pool size: {', '.join(SIZES)} or a row count")
+    parser.add_argument('--queries', type=int, default=100, help="projects per benchmark")
+    parser.add_argument('--top-n', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3, help="runs of the whole-file and batch benchmarks")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--csv', help="write the generated pool here and keep it")
+    parser.add_argument('--only', nargs='+', choices=list(SUITES), default=list(SUITES))
+    parser.add_argument('--output', help="save results as JSON for benchmarks.compare")
+    args = parser.parse_args()
+    args.rows = _parse_size(args.size)
+    logging.getLogger().setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        csv_path = args.csv or os.path.join(scratch, f"freelancers_{args.rows}.csv")
+        if not os.path.isfile(csv_path):
+            start = time.perf_counter()
+            write_freelancer_csv(csv_path, args.rows, args.seed)
+            print(f"generated {args.rows} freelancers in {time.perf_counter() - start:.1f}s")
+
+        results = []
+        for suite in args.only:
+            results.extend(SUITES[suite](args, csv_path))
+
+    print(format_results(results))
+    if args.output:
+        params = {'rows': args.rows, 'queries': args.queries, 'top_n': args.top_n, 'seed': args.seed}
+        save_results(args.output, results, params)
+        print(f"results saved to {args.output}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Length-prefixed message framing for the interview socket protocol.
+
+Every message is a 4-byte big-endian payload length followed by that many
+bytes of UTF-8 JSON. A reader always knows how much to expect, so messages
+of any size arrive whole however TCP splits them, and oversized frames are
+refused before anything is allocated for them.
+
+Blocking helpers take a socket (sjm.Server, freelancer.py); the async
+helpers take asyncio streams (interview_server).
+"""
+import json
+import struct
+import asyncio
+import socket
+from typing import Any, Optional
+
+HEADER = struct.Struct('!I')
+# Largest payload accepted from a peer
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+
+def encode_frame(payload: bytes) -> bytes:
+    return HEADER.pack(len(payload)) + payload
+
+
+def _check_size(size: int, max_size: int):
+    if size > max_size:
+        raise ValueError(f"Message of {size} bytes exceeds the {max_size} byte limit")
+
+
+def _recv_exactly(sock: socket.socket, buffer) -> int:
+    """
+    Fill the buffer from the socket; returns how many bytes arrived before EOF.
+    """
+    view = memoryview(buffer)
+    received = 0
+    while received < len(view):
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            break
+        received += count
+    return received
+
+
+def send_frame(sock: socket.socket, payload: bytes):
+    sock.sendall(encode_frame(payload))
+
+
+def recv_frame(sock: socket.socket, max_size: int = MAX_MESSAGE_SIZE) -> Optional[bytearray]:
+    """
+    Read one frame's payload, or None if the peer closed the connection between frames.
+
+    Raises:
+        ValueError: If the announced size exceeds max_size.
+        ConnectionError: If the connection closes in the middle of a frame.
+    """
+    header = bytearray(HEADER.size)
+    received = _recv_exactly(sock, header)
+    if received == 0:
+        return None
+    if received < HEADER.size:
+        raise ConnectionError("Connection closed in the middle of a frame header")
+
+    size, = HEADER.unpack(header)
+    _check_size(size, max_size)
+    # Read straight into the final buffer, however many recv calls it takes
+    payload = bytearray(size)
+    if _recv_exactly(sock, payload) < size:
+        raise ConnectionError("Connection closed in the middle of a frame")
+    return payload
+
+
+def send_message(sock: socket.socket, message: Any):
+    send_frame(sock, json.dumps(message).encode('utf-8'))
+
+
+def recv_message(sock: socket.socket, max_size: int = MAX_MESSAGE_SIZE) -> Any:
+    """
+    Read one JSON message.
+
+    Raises:
+        ConnectionError: If the connection closes before a complete message arrives.
+    """
+    payload = recv_frame(sock, max_size)
+    if payload is None:
+        raise ConnectionError("Connection closed before a message arrived")
+    return json.loads(payload)
+
+
+async def read_frame(reader: asyncio.StreamReader, max_size: int = MAX_MESSAGE_SIZE) -> bytes:
+    """
+    Read one frame's payload from an asyncio stream.
+
+    Raises:
+        ValueError: If the announced size exceeds max_size.
+        ConnectionError: If the connection closes before the frame is complete.
+    """
+    try:
+        size, = HEADER.unpack(await reader.readexactly(HEADER.size))
+        _check_size(size, max_size)
+        return await reader.readexactly(size)
+    except asyncio.IncompleteReadError as e:
+        raise ConnectionError("Connection closed before a complete frame arrived") from e
+
+
+async def write_frame(writer: asyncio.StreamWriter, payload: bytes):
+    writer.write(encode_frame(payload))
+    await writer.drain()
+
+
+async def read_message(reader: asyncio.StreamReader, max_size: int = MAX_MESSAGE_SIZE) -> Any:
+    return json.loads(await read_frame(reader, max_size))
+
+
+async def write_message(writer: asyncio.StreamWriter, message: Any):
+    await write_frame(writer, json.dumps(message).encode('utf-8'))
@@ -4,6 +4,7 @@ import json
 import time
 from typing import List
 from sjm import SkillsExtract
+from framing import recv_message, send_message
 
 # Function to generate professional questions using AI services
 def generate_professional_questions(context: dict) -> List[str]:
@@ -52,7 +53,7 @@ def generate_professional_questions(context: dict) -> List[str]:
     return questions
 
 
-def main(host, port):
+def main(host, port, session_id=None):
     try:
         # Initialize socket
         client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -70,14 +71,16 @@ def main(host, port):
             print("Failed to connect after 3 attempts.")
             return
 
+        # The interview server runs many sessions on one port; say which one this is
+        if session_id:
+            send_message(client_socket, {'session_id': session_id})
+
         # Receive and validate context
-        context_json = client_socket.recv(4096).decode('utf-8')
-        if not context_json:
+        try:
+            context = recv_message(client_socket)
+        except ConnectionError:
             print("No data received from server.")
             return
-        
-        try:
-            context = json.loads(context_json)
         except json.JSONDecodeError:
             print("Invalid JSON received.")
             return
@@ -92,19 +95,13 @@ def main(host, port):
             return
 
         questions = generate_professional_questions(context)
-        client_socket.sendall(json.dumps(questions).encode('utf-8'))
+        send_message(client_socket, questions)
 
         # Handle answers and results
         answers = {q: input(f"Answer to '{q}': ") for q in questions}
-        client_socket.sendall(json.dumps(answers).encode('utf-8'))
+        send_message(client_socket, answers)
 
-        results_json = b""
-        while True:
-            part = client_socket.recv(4096)
-            if not part:
-                break
-            results_json += part
-        results = json.loads(results_json.decode('utf-8'))
+        results = recv_message(client_socket)
 
         print(f"Score: {results.get('score', 'N/A')}")
         print("Details:", results)
@@ -115,7 +112,7 @@ def main(host, port):
         client_socket.close()
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python freelancer.py <host> <port>")
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python freelancer.py <host> <port> [session_id]")
     else:
-        main(sys.argv[1], sys.argv[2])
+        main(*sys.argv[1:])
@@ -0,0 +1,176 @@
+"""
+On-disk freelancer index for fast MatchingEngine start-up.
+
+The index stores everything the engine would otherwise rebuild from the CSV:
+the fitted TF-IDF vocabulary, the CSR profile matrix, the skill index with
+its CSC postings, the trained collaborative features and compact freelancer
+columns. Arrays are saved as .npy files and memory-mapped on load, so worker
+processes start quickly and share the same pages.
+
+Build an index with:
+    python upworkModel.py build-index upwork_freelancers.csv freelancer_index
+"""
+import os
+import json
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from sjm import FreelancerStore, MatchingEngine, ProfileIndex, SkillIndex, SkillsExtract
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 3
+
+
+def _save_sparse(path: str, name: str, matrix, layout=sparse.csr_matrix):
+    matrix = layout(matrix)
+    np.save(os.path.join(path, f'{name}.data.npy'), matrix.data)
+    np.save(os.path.join(path, f'{name}.indices.npy'), matrix.indices)
+    np.save(os.path.join(path, f'{name}.indptr.npy'), matrix.indptr)
+
+
+def _load_sparse(path: str, name: str, shape: tuple, mmap_mode: Optional[str], layout=sparse.csr_matrix):
+    arrays = [
+        np.load(os.path.join(path, f'{name}.{part}.npy'), mmap_mode=mmap_mode)
+        for part in ('data', 'indices', 'indptr')
+    ]
+    return layout(tuple(arrays), shape=tuple(shape), copy=False)
+
+
+def _sales_range(collaborative_model) -> Optional[List[float]]:
+    if collaborative_model.sales_min is None:
+        return None
+    return [float(collaborative_model.sales_min), float(collaborative_model.sales_max)]
+
+
+def save_index(engine: MatchingEngine, path: str):
+    """
+    Write the state of a trained matching engine to an index directory.
+
+    Args:
+        engine (MatchingEngine): Engine whose models have been trained.
+        path (str): Target directory; created if missing.
+    """
+    os.makedirs(path, exist_ok=True)
+    freelancers = engine.freelancers
+    vectorizer = engine.profile_index.vectorizer
+
+    with open(os.path.join(path, 'vocabulary.json'), 'w') as f:
+        json.dump({term: int(column) for term, column in vectorizer.vocabulary_.items()}, f)
+    np.save(os.path.join(path, 'idf.npy'), vectorizer.idf_)
+    _save_sparse(path, 'profiles', engine.profile_index.matrix)
+
+    with open(os.path.join(path, 'skills.json'), 'w') as f:
+        json.dump(engine.skill_index.skills, f)
+    _save_sparse(path, 'freelancer_skills', engine.skill_index.freelancer_skills)
+    # Saved as well, so workers map the inverted index instead of each building a copy
+    _save_sparse(path, 'skill_postings', engine.skill_index.postings, layout=sparse.csc_matrix)
+    _save_sparse(path, 'skill_similarity', engine.skill_index.similarity_table())
+
+    np.save(
+        os.path.join(path, 'collaborative.npy'),
+        np.asarray(engine.collaborative_model.interaction_matrix, dtype=np.float64),
+    )
+
+    # Freelancer store columns: numeric arrays, text lists and the interned skill CSR
+    for column in FreelancerStore.NUMERIC_COLUMNS:
+        np.save(os.path.join(path, f'{column}.npy'), freelancers.column(column))
+    np.save(os.path.join(path, 'store_skills.indptr.npy'), freelancers.skill_indptr)
+    np.save(os.path.join(path, 'store_skills.indices.npy'), freelancers.skill_indices)
+    columns = {column: [str(value) for value in freelancers.columns[column]] for column in FreelancerStore.TEXT_COLUMNS}
+    columns['skill_vocabulary'] = freelancers.skill_vocabulary
+    with open(os.path.join(path, 'freelancers.json'), 'w') as f:
+        json.dump(columns, f)
+
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'num_freelancers': len(freelancers),
+        'vocabulary_size': len(vectorizer.vocabulary_),
+        'num_skills': len(engine.skill_index.skills),
+        'skill_threshold': engine.skill_index.threshold,
+        'sales_range': _sales_range(engine.collaborative_model),
+    }
+    # Written last so a partially written index is never picked up
+    with open(os.path.join(path, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    logger.info(f"Saved freelancer index for {len(freelancers)} freelancers to {path}")
+
+
+def _load_freelancers(path: str, mmap_mode: Optional[str]) -> FreelancerStore:
+    with open(os.path.join(path, 'freelancers.json')) as f:
+        columns = json.load(f)
+    skill_vocabulary = columns.pop('skill_vocabulary')
+    for column in FreelancerStore.NUMERIC_COLUMNS:
+        columns[column] = np.load(os.path.join(path, f'{column}.npy'), mmap_mode=mmap_mode)
+    return FreelancerStore(
+        columns,
+        skill_vocabulary,
+        np.load(os.path.join(path, 'store_skills.indptr.npy'), mmap_mode=mmap_mode),
+        np.load(os.path.join(path, 'store_skills.indices.npy'), mmap_mode=mmap_mode),
+    )
+
+
+def load_index(
+    path: str,
+    skill_extractor: SkillsExtract,
+    collaborative_model,
+    mmap_mode: Optional[str] = 'r'
+) -> MatchingEngine:
+    """
+    Load a matching engine from an index directory without refitting anything.
+
+    Args:
+        path (str): Directory written by save_index().
+        skill_extractor (SkillsExtract): Extractor used for incoming projects.
+        collaborative_model: Untrained collaborative model; its interaction matrix is restored.
+        mmap_mode (str, optional): numpy memory-map mode for the arrays. None loads them into memory.
+
+    Returns:
+        MatchingEngine: Engine ready to match, sharing the mapped arrays.
+    """
+    with open(os.path.join(path, 'manifest.json')) as f:
+        manifest: Dict = json.load(f)
+    if manifest.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported freelancer index version {manifest.get('format_version')} in {path}")
+
+    num_freelancers = manifest['num_freelancers']
+    freelancers = _load_freelancers(path, mmap_mode)
+
+    vectorizer = TfidfVectorizer(stop_words='english')
+    with open(os.path.join(path, 'vocabulary.json')) as f:
+        vectorizer.vocabulary_ = json.load(f)
+    vectorizer.idf_ = np.load(os.path.join(path, 'idf.npy'))
+    profile_matrix = _load_sparse(path, 'profiles', (num_freelancers, manifest['vocabulary_size']), mmap_mode)
+    profile_index = ProfileIndex(vectorizer, profile_matrix)
+
+    with open(os.path.join(path, 'skills.json')) as f:
+        skills = json.load(f)
+    num_skills = manifest['num_skills']
+    skill_index = SkillIndex(
+        skills,
+        _load_sparse(path, 'freelancer_skills', (num_freelancers, num_skills), mmap_mode),
+        threshold=manifest['skill_threshold'],
+        postings=_load_sparse(path, 'skill_postings', (num_freelancers, num_skills), mmap_mode, sparse.csc_matrix),
+    )
+    skill_index.load_similarity_table(_load_sparse(path, 'skill_similarity', (num_skills, num_skills), mmap_mode))
+
+    collaborative_model.load_interactions(
+        freelancers,
+        np.load(os.path.join(path, 'collaborative.npy'), mmap_mode=mmap_mode),
+        sales_range=manifest.get('sales_range'),
+    )
+
+    engine = MatchingEngine(
+        freelancers=freelancers,
+        projects=[],
+        skill_extractor=skill_extractor,
+        collaborative_model=collaborative_model,
+        profile_index=profile_index,
+        skill_index=skill_index,
+    )
+    logger.info(f"Loaded freelancer index for {num_freelancers} freelancers from {path}")
+    return engine
@@ -0,0 +1,32 @@
+"""
+gunicorn settings for the ai.py API:
+
+    gunicorn -c gunicorn.conf.py ai:app
+
+Every setting can be overridden through the environment variables below.
+"""
+import os
+import multiprocessing
+
+bind = os.getenv('AI_BIND', '0.0.0.0:5000')
+
+# Load the models once in the master and fork the workers afterwards, so the
+# freelancer index and TF-IDF matrices are shared copy-on-write
+preload_app = True
+
+workers = int(os.getenv('AI_WORKERS', min(multiprocessing.cpu_count(), 4)))
+# Threads per worker; scoring releases the GIL in NumPy/SciPy kernels.
+# ai.py caps how many of them do model work at once (AI_MAX_CONCURRENT_REQUESTS).
+worker_class = 'gthread'
+threads = int(os.getenv('AI_THREADS', 8))
+
+# With gthread this is only a heartbeat: a worker is restarted when its main loop
+# stalls this long, not when one request does. ai.py answers requests whose model
+# work runs past AI_REQUEST_TIMEOUT with 504; keep that below this value.
+timeout = int(os.getenv('AI_TIMEOUT', 30))
+graceful_timeout = int(os.getenv('AI_GRACEFUL_TIMEOUT', 30))
+keepalive = 5
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.getenv('AI_MAX_REQUESTS', 10_000))
+max_requests_jitter = int(os.getenv('AI_MAX_REQUESTS_JITTER', 1_000))
@@ -0,0 +1,235 @@
+"""
+Asyncio interview server for running many freelancer interviews concurrently.
+
+One listener stays up for the life of the process. Every interview is a
+session keyed by an ID that the freelancer client sends when it connects:
+
+    python freelancer.py <host> <port> <session_id>
+"""
+import uuid
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set
+
+from framing import MAX_MESSAGE_SIZE, read_message, write_message
+from sjm import launch_client_terminal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InterviewSession:
+    """
+    State of one interview, from dispatch until its results are delivered.
+    """
+    session_id: str
+    context: Dict
+    result: Future = field(default_factory=Future)
+    # waiting -> connected -> questioned -> answered -> done (or failed at any point)
+    state: str = 'waiting'
+    questions: Optional[List[str]] = None
+    answers: Optional[Dict[str, str]] = None
+    connect_timer: Optional[asyncio.TimerHandle] = None
+
+
+class InterviewServer:
+    """
+    Long-lived asyncio listener that runs many freelancer interviews at once.
+
+    dispatch() registers a session and returns a Future immediately. The
+    freelancer client connects and introduces itself with {"session_id": ...}.
+    The interview (context -> questions -> answers -> results) then runs on
+    the server's event loop alongside every other session, and the Future
+    resolves with the results.
+    """
+
+    def __init__(
+        self,
+        evaluate: Callable[[Dict, Dict[str, str]], Dict],
+        host: str = '127.0.0.1',
+        port: int = 65432,
+        connect_timeout: float = 120.0,
+        session_timeout: float = 1800.0,
+        launch_client: bool = True,
+        max_message_size: int = MAX_MESSAGE_SIZE
+    ):
+        """
+        Args:
+            evaluate (Callable): Builds the interview results from the context and the freelancer's answers.
+            host (str, optional): Interface to listen on.
+            port (int, optional): Port to listen on; 0 picks a free one.
+            connect_timeout (float, optional): Seconds a dispatched freelancer has to connect.
+            session_timeout (float, optional): Seconds a connected interview may take in total.
+            launch_client (bool, optional): Open a freelancer terminal for every dispatched interview.
+            max_message_size (int, optional): Largest message accepted from a client, in bytes.
+        """
+        self.evaluate = evaluate
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.session_timeout = session_timeout
+        self.launch_client = launch_client
+        self.max_message_size = max_message_size
+        self._sessions: Dict[str, InterviewSession] = {}
+        self._connections: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> 'InterviewServer':
+        """
+        Start listening on a background event-loop thread; returns once connections are accepted.
+        """
+        if self._thread is not None:
+            return self
+
+        started = Future()
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                self._server = loop.run_until_complete(
+                    asyncio.start_server(self._handle_connection, self.host, self.port, reuse_address=True)
+                )
+            except Exception as e:
+                loop.close()
+                started.set_exception(e)
+                return
+            self._loop = loop
+            self.port = self._server.sockets[0].getsockname()[1]
+            started.set_result(None)
+            loop.run_forever()
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name='interview-server', daemon=True)
+        self._thread.start()
+        try:
+            started.result()
+        except Exception:
+            self._thread = None
+            raise
+        logger.info(f"Interview server listening on {self.host}:{self.port}")
+        return self
+
+    def close(self):
+        """
+        Stop listening, fail the interviews still running and stop the loop thread.
+        """
+        if self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = self._loop = self._server = None
+        logger.info("Interview server closed")
+
+    def dispatch(self, context: Dict) -> Future:
+        """
+        Start an interview without waiting for it; safe to call from any thread.
+
+        Args:
+            context (Dict): Interview context sent to the freelancer client.
+
+        Returns:
+            Future: Resolves with the evaluated results, or raises TimeoutError
+            or ConnectionError if the interview cannot complete.
+        """
+        if self._thread is None:
+            raise RuntimeError("Interview server is not running")
+        session = InterviewSession(session_id=uuid.uuid4().hex, context=context)
+        # Registered before the client is launched, so it is known by the time the client connects
+        self._loop.call_soon_threadsafe(self._register, session)
+        if self.launch_client:
+            launch_client_terminal(self.host, str(self.port), session.session_id)
+        logger.info(
+            f"Dispatched interview {session.session_id}; join it with "
+            f"'python upworkModel.py freelancer {session.session_id} {self.host} {self.port}'"
+        )
+        return session.result
+
+    def active_sessions(self) -> int:
+        return len(self._sessions)
+
+    def _register(self, session: InterviewSession):
+        self._sessions[session.session_id] = session
+        session.connect_timer = self._loop.call_later(self.connect_timeout, self._expire, session)
+
+    def _expire(self, session: InterviewSession):
+        if session.state == 'waiting':
+            self._finish(session, error=TimeoutError(
+                f"Freelancer did not connect to interview {session.session_id} within {self.connect_timeout}s"
+            ))
+
+    def _finish(self, session: InterviewSession, results: Optional[Dict] = None, error: Optional[Exception] = None):
+        self._sessions.pop(session.session_id, None)
+        if session.connect_timer is not None:
+            session.connect_timer.cancel()
+        session.state = 'failed' if error is not None else 'done'
+        if session.result.done():
+            return
+        if error is not None:
+            logger.warning(f"Interview {session.session_id} failed: {error}")
+            session.result.set_exception(error)
+        else:
+            session.result.set_result(results)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._connections.add(task)
+        session = None
+        try:
+            hello = await asyncio.wait_for(read_message(reader, self.max_message_size), self.connect_timeout)
+            session_id = hello.get('session_id') if isinstance(hello, dict) else None
+            session = self._sessions.get(session_id)
+            if session is None or session.state != 'waiting':
+                logger.warning(f"Rejected connection for unknown interview {session_id!r}")
+                session = None
+                return
+
+            session.state = 'connected'
+            session.connect_timer.cancel()
+            await asyncio.wait_for(self._interview(session, reader, writer), self.session_timeout)
+        except asyncio.TimeoutError:
+            if session is not None:
+                self._finish(session, error=TimeoutError(
+                    f"Interview {session.session_id} timed out while {session.state}"
+                ))
+        except asyncio.CancelledError:
+            if session is not None:
+                self._finish(session, error=ConnectionAbortedError("Interview server closed"))
+            raise
+        except Exception as e:
+            if session is not None:
+                self._finish(session, error=e)
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _interview(self, session: InterviewSession, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await write_message(writer, session.context)
+
+        session.questions = await read_message(reader, self.max_message_size)
+        session.state = 'questioned'
+        session.answers = await read_message(reader, self.max_message_size)
+        session.state = 'answered'
+
+        results = self.evaluate(session.context, session.answers)
+        await write_message(writer, results)
+        self._finish(session, results)
+
+    async def _shutdown(self):
+        self._server.close()
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        for session in list(self._sessions.values()):
+            self._finish(session, error=ConnectionAbortedError("Interview server closed"))
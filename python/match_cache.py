@@ -0,0 +1,215 @@
+"""
+Cache of find_top_matches results, keyed by a fingerprint of the query.
+
+Reposted jobs and widgets re-querying the same project get their matches
+without skill extraction or scoring. Every entry records the pool token
+(data source and MatchingEngine.pool_digest) it was computed against and
+is ignored once the pool changes. Two backends are available:
+LocalMatchCache keeps entries in the process, and DiskMatchCache keeps them
+in a SQLite file that every worker on the machine shares.
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict
+from typing import Dict, List, Optional
+
+from sjm import Freelancer, LRUCache, Project, SkillIndex, SkillsExtract
+
+
+def project_fingerprint(project: Project, weights: Dict[str, float], top_n: int) -> str:
+    """
+    Stable key of a match query.
+
+    Descriptions are compared after SkillsExtract normalization, so near-identical
+    reposts share a key. Required skills are compared as the skill index matches
+    them: case and order are ignored, but duplicates are kept, since each copy
+    counts towards the overlap filters.
+    """
+    query = {
+        'description': SkillsExtract.normalize_description(project.description),
+        'required_skills': sorted(SkillIndex.normalize(skill) for skill in project.required_skills),
+        'budget_range': [float(bound) for bound in project.budget_range],
+        'complexity': project.complexity,
+        'weights': {name: float(value) for name, value in sorted(weights.items())},
+        'top_n': top_n,
+    }
+    return hashlib.sha256(json.dumps(query, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _copy_matches(matches) -> List[Dict]:
+    # Callers may edit the match dicts they get back
+    return [dict(match) for match in matches]
+
+
+class MatchCache(ABC):
+    """
+    Interface of the match cache backends; all of them are thread-safe.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def get(self, key: str, pool_token: str) -> Optional[List[Dict]]:
+        """
+        Cached matches for the key, or None if missing, expired or computed against another pool.
+        """
+
+    @abstractmethod
+    def put(self, key: str, pool_token: str, matches: List[Dict]):
+        ...
+
+    @abstractmethod
+    def clear(self):
+        ...
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+class LocalMatchCache(MatchCache):
+    """
+    In-process cache with LRU eviction and a time-to-live.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Args:
+            maxsize (int, optional): Entries kept before the least recently used is evicted.
+            ttl (float, optional): Seconds an entry stays valid. Defaults to 300.
+        """
+        super().__init__()
+        self.ttl = ttl
+        self._entries = LRUCache(maxsize)
+        self._pool_token: Optional[str] = None
+
+    def get(self, key: str, pool_token: str) -> Optional[List[Dict]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != pool_token or entry[1] < time.monotonic():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _copy_matches(entry[2])
+
+    def put(self, key: str, pool_token: str, matches: List[Dict]):
+        if pool_token != self._pool_token:
+            # Entries of an earlier pool can never hit again
+            self._entries.clear()
+            self._pool_token = pool_token
+        self._entries.put(key, (pool_token, time.monotonic() + self.ttl, tuple(_copy_matches(matches))))
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {**super().stats(), 'size': len(self._entries), 'maxsize': self._entries.maxsize}
+
+
+class DiskMatchCache(MatchCache):
+    """
+    SQLite-backed cache shared by every process that opens the same file.
+
+    Matches are stored as JSON. Eviction is least recently used, and
+    entries of other pool tokens are left to expire: workers sharing the
+    file may serve different pools for a while during updates.
+    """
+
+    # Stored as the file's user_version; files of another version are recreated
+    SCHEMA_VERSION = 2
+    SCHEMA = f"""
+        BEGIN;
+        DROP TABLE IF EXISTS matches;
+        CREATE TABLE matches (
+            key TEXT NOT NULL,
+            pool_token TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            last_used REAL NOT NULL,
+            matches TEXT NOT NULL,
+            PRIMARY KEY (key, pool_token)
+        );
+        CREATE INDEX matches_last_used ON matches (last_used);
+        PRAGMA user_version = {SCHEMA_VERSION};
+        COMMIT;
+    """
+
+    def __init__(self, path: str, maxsize: int = 10_000, ttl: float = 300.0, timeout: float = 10.0):
+        """
+        Args:
+            path (str): SQLite file; created if missing.
+            maxsize (int, optional): Entries kept before the least recently used are evicted.
+            ttl (float, optional): Seconds an entry stays valid. Defaults to 300.
+            timeout (float, optional): Seconds to wait for another process's write lock.
+        """
+        super().__init__()
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timeout = timeout
+        self._local = threading.local()
+        # Not kept open: a server may create the cache before forking its workers
+        connection = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            if connection.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+                connection.executescript(self.SCHEMA)
+        finally:
+            connection.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections belong to the thread, and the process, that opened them
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            # Readers don't block the writer, so concurrent workers can share the file
+            connection.execute('PRAGMA journal_mode=WAL')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str, pool_token: str) -> Optional[List[Dict]]:
+        now = time.time()
+        with self._connection() as connection:
+            row = connection.execute(
+                'SELECT matches FROM matches WHERE key = ? AND pool_token = ? AND expires_at >= ?',
+                (key, pool_token, now),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            connection.execute(
+                'UPDATE matches SET last_used = ? WHERE key = ? AND pool_token = ?', (now, key, pool_token)
+            )
+        self.hits += 1
+        return [
+            dict(match, freelancer=Freelancer(**match['freelancer']))
+            for match in json.loads(row[0])
+        ]
+
+    def put(self, key: str, pool_token: str, matches: List[Dict]):
+        now = time.time()
+        payload = json.dumps([dict(match, freelancer=asdict(match['freelancer'])) for match in matches])
+        with self._connection() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO matches (key, pool_token, expires_at, last_used, matches) VALUES (?, ?, ?, ?, ?)',
+                (key, pool_token, now + self.ttl, now, payload),
+            )
+            connection.execute('DELETE FROM matches WHERE expires_at < ?', (now,))
+            connection.execute(
+                'DELETE FROM matches WHERE rowid IN ('
+                'SELECT rowid FROM matches ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                (self.maxsize,),
+            )
+
+    def clear(self):
+        with self._connection() as connection:
+            connection.execute('DELETE FROM matches')
+
+    def stats(self) -> Dict[str, int]:
+        with self._connection() as connection:
+            size = connection.execute('SELECT COUNT(*) FROM matches').fetchone()[0]
+        return {**super().stats(), 'size': size, 'maxsize': self.maxsize}
@@ -0,0 +1,276 @@
+"""
+Opt-in instrumentation for the matching pipeline.
+
+Stages are timed with `with metrics.timer('stage'):` and events counted with
+`metrics.increment('name')`. Nothing is recorded until a sink is installed
+with enable(); until then timer() hands back one shared no-op context and
+increment() returns at once, so instrumented code costs a function call.
+
+    sink = metrics.enable()            # in-memory histograms and counters
+    ...
+    print(metrics.prometheus_text(sink))
+"""
+import math
+import time
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence
+
+# Upper bounds in seconds of the stage histograms, as in Prometheus client defaults
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class MetricsSink(ABC):
+    """
+    Receives stage durations and counter increments.
+
+    Subclass it to forward metrics elsewhere (StatsD, OpenTelemetry, ...).
+    Sinks are called from request and worker threads, so they must be thread-safe.
+    """
+
+    @abstractmethod
+    def observe(self, name: str, seconds: float):
+        ...
+
+    @abstractmethod
+    def increment(self, name: str, value: float = 1):
+        ...
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of durations in seconds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        # One count per bucket plus the +Inf overflow bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile by interpolating inside its bucket.
+
+        Values past the last bucket are reported as its upper bound.
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+
+class InMemorySink(MetricsSink):
+    """
+    Keeps a histogram per timed stage and a running total per counter.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def increment(self, name: str, value: float = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def snapshot(self) -> Dict:
+        """
+        Count, total and p50/p90/p99 seconds per stage, and every counter.
+        """
+        with self._lock:
+            return {
+                'stages': {
+                    name: {
+                        'count': histogram.count,
+                        'sum': histogram.sum,
+                        'p50': histogram.quantile(0.5),
+                        'p90': histogram.quantile(0.9),
+                        'p99': histogram.quantile(0.99),
+                    }
+                    for name, histogram in self.histograms.items()
+                },
+                'counters': dict(self.counters),
+            }
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+
+def _sample_value(value: float) -> str:
+    """
+    Exact text of a sample value: integers without an exponent, floats round-trip.
+    """
+    value = float(value)
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def prometheus_text(sink: InMemorySink, namespace: str = 'sjm') -> str:
+    """
+    Render a sink in the Prometheus text exposition format.
+
+    Stage durations form one histogram family labelled by stage; every
+    counter becomes a <namespace>_<name>_total counter.
+    """
+    with sink._lock:
+        histograms = {name: (histogram.buckets, list(histogram.counts), histogram.count, histogram.sum)
+                      for name, histogram in sink.histograms.items()}
+        counters = dict(sink.counters)
+
+    lines: List[str] = []
+    family = f"{namespace}_stage_duration_seconds"
+    if histograms:
+        lines.append(f"# HELP {family} Time spent in each matching pipeline stage.")
+        lines.append(f"# TYPE {family} histogram")
+    for name in sorted(histograms):
+        buckets, counts, count, total = histograms[name]
+        cumulative = 0
+        for bound, bucket_count in zip(buckets, counts):
+            cumulative += bucket_count
+            lines.append(f'{family}_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+        lines.append(f'{family}_bucket{{stage="{name}",le="+Inf"}} {count}')
+        lines.append(f'{family}_sum{{stage="{name}"}} {_sample_value(total)}')
+        lines.append(f'{family}_count{{stage="{name}"}} {_sample_value(count)}')
+    for name in sorted(counters):
+        metric = f"{namespace}_{name}_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {_sample_value(counters[name])}")
+    return '\n'.join(lines) + '\n'
+
+
+class _NullTimer:
+    """
+    Shared stand-in for timers and stopwatches while metrics are disabled.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def record(self):
+        pass
+
+
+class _Timer:
+    __slots__ = ('sink', 'name', 'start')
+
+    def __init__(self, sink: MetricsSink, name: str):
+        self.sink = sink
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.sink.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _Stopwatch:
+    """
+    Accumulates many short timed sections and records their total once.
+    """
+    __slots__ = ('sink', 'name', 'start', 'total')
+
+    def __init__(self, sink: MetricsSink, name: str):
+        self.sink = sink
+        self.name = name
+        self.total = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.total += time.perf_counter() - self.start
+        return False
+
+    def record(self):
+        self.sink.observe(self.name, self.total)
+
+
+_NULL_TIMER = _NullTimer()
+_sink: Optional[MetricsSink] = None
+
+
+def enable(sink: Optional[MetricsSink] = None) -> MetricsSink:
+    """
+    Start recording into sink (a new InMemorySink by default) and return it.
+    """
+    global _sink
+    _sink = sink if sink is not None else InMemorySink()
+    return _sink
+
+
+def disable():
+    global _sink
+    _sink = None
+
+
+def enabled() -> bool:
+    return _sink is not None
+
+
+def get_sink() -> Optional[MetricsSink]:
+    return _sink
+
+
+def timer(name: str):
+    """
+    Context manager recording the duration of its block as one observation of stage name.
+    """
+    sink = _sink
+    if sink is None:
+        return _NULL_TIMER
+    return _Timer(sink, name)
+
+
+def stopwatch(name: str):
+    """
+    Reusable context manager for a stage interleaved with other work; call record() once at the end.
+    """
+    sink = _sink
+    if sink is None:
+        return _NULL_TIMER
+    return _Stopwatch(sink, name)
+
+
+def increment(name: str, value: float = 1):
+    sink = _sink
+    if sink is not None:
+        sink.increment(name, value)
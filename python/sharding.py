@@ -0,0 +1,344 @@
+"""
+Scatter-gather matching over a freelancer pool split across worker processes.
+
+A trained MatchingEngine is cut into contiguous row ranges. Every shard
+process gets its rows of the global TF-IDF matrix, skill postings and
+collaborative features, so scores are the ones the single engine computes.
+The coordinator extracts skills and transforms the description once,
+sends the query to every shard, and merges the per-shard top-k by
+(score desc, row asc), the order of the single engine's ranking.
+"""
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from sjm import CollaborativeModel, MatchingEngine, ProfileIndex, Project, SkillIndex
+
+logger = logging.getLogger(__name__)
+
+
+class ShardError(RuntimeError):
+    """
+    One or more shards timed out or failed while answering a query.
+    """
+
+
+def _shard_main(connection: Connection, payload: Dict):
+    """
+    Worker process: rebuild one shard's engine, then answer queries until told to stop.
+    """
+    skill_index = SkillIndex(payload['skills'], payload['freelancer_skills'], threshold=payload['skill_threshold'])
+    skill_index.load_similarity_table(payload['skill_similarity'])
+    collaborative_model = CollaborativeModel()
+    collaborative_model.load_interactions(
+        payload['freelancers'], payload['interactions'], sales_range=payload['sales_range']
+    )
+    engine = MatchingEngine(
+        freelancers=payload['freelancers'],
+        projects=[],
+        skill_extractor=None,
+        collaborative_model=collaborative_model,
+        profile_index=ProfileIndex(None, payload['profiles']),
+        skill_index=skill_index,
+    )
+    offset = payload['offset']
+    connection.send(('ready', None))
+
+    while True:
+        try:
+            request = connection.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        request_id, project, project_skills, project_tfidf, weights, top_n, constraints = request
+        try:
+            rows = engine.candidate_rows(**constraints) if constraints else None
+            scores = engine.score_top_candidates(
+                project, top_n, weights, rows, project_skills=project_skills, project_tfidf=project_tfidf
+            )
+            indices = engine._top_indices(scores['combined'], top_n)
+            scored_rows = scores['rows']
+            result = [
+                (
+                    offset + int(scored_rows[idx]),
+                    float(scores['combined'][idx]),
+                    float(scores['content'][idx]),
+                    float(scores['collaborative'][idx]),
+                    int(scores['skill_overlap'][idx]),
+                    engine.freelancers[scored_rows[idx]],
+                )
+                for idx in indices
+            ]
+            connection.send((request_id, 'ok', result))
+        except Exception as e:
+            connection.send((request_id, 'error', f"{type(e).__name__}: {e}"))
+    connection.close()
+
+
+class ShardedMatchingEngine:
+    """
+    Coordinator of a freelancer pool split across worker processes.
+
+    Vocabulary, IDF weights, the skill similarity table and collaborative
+    normalization come from the engine it is built from, so every shard
+    scores with the global statistics. A shard that misses the query timeout
+    or dies is terminated and restarted before the next query.
+
+    Shards serve the pool as it was when they started. If the engine's pool
+    has changed since, a restart re-partitions the current pool and restarts
+    every shard, so the shards never cover rows of different pool versions.
+    """
+
+    def __init__(
+        self,
+        engine: MatchingEngine,
+        n_shards: Optional[int] = None,
+        timeout: float = 30.0,
+        startup_timeout: float = 300.0,
+        allow_partial: bool = False,
+        start_method: str = 'spawn'
+    ):
+        """
+        Args:
+            engine (MatchingEngine): Trained engine to shard. It is kept as the source
+                for restarting shards and for skill extraction and TF-IDF transforms.
+            n_shards (int, optional): Worker processes; defaults to the CPU count.
+            timeout (float, optional): Seconds every shard gets to answer a query. Defaults to 30.
+            startup_timeout (float, optional): Seconds a shard may take to load its rows. Defaults to 300.
+            allow_partial (bool, optional): Merge the shards that answered instead of raising
+                ShardError when some did not. Defaults to False.
+            start_method (str, optional): multiprocessing start method. Defaults to 'spawn',
+                which is safe to use from a threaded server.
+
+        Raises:
+            ValueError: If the engine's collaborative model scores depend on the project.
+        """
+        collaborative_model = engine.collaborative_model
+        if collaborative_model is None or type(collaborative_model).predict is not CollaborativeModel.predict:
+            raise ValueError(
+                "Only collaborative models with project-independent scores can be sharded; "
+                f"got {type(collaborative_model).__name__}"
+            )
+
+        self.engine = engine
+        self.n_shards = max(1, min(n_shards or os.cpu_count() or 1, max(len(engine.freelancers), 1)))
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self.allow_partial = allow_partial
+        self._context = multiprocessing.get_context(start_method)
+
+        # Set by _partition() from the pool the shards were started on
+        self.shard_ranges: List[tuple] = []
+        self.pool_version: Optional[int] = None
+        self._profile_index: Optional[ProfileIndex] = None
+        self._processes: List[Optional[multiprocessing.Process]] = [None] * self.n_shards
+        self._connections: List[Optional[Connection]] = [None] * self.n_shards
+        self._request_id = 0
+        # Pipes carry one conversation at a time
+        self._lock = threading.Lock()
+
+        try:
+            self._start_shards(range(self.n_shards))
+        except BaseException:
+            # Don't leave the shards that did start running without an owner
+            for shard in range(self.n_shards):
+                self._stop_shard(shard)
+            raise
+        logger.info(f"Started {self.n_shards} shards over {len(engine.freelancers)} freelancers")
+
+    def _partition(self):
+        """
+        Split the engine's current pool into contiguous shard ranges; call with the engine lock held.
+        """
+        engine = self.engine
+        bounds = np.linspace(0, len(engine.freelancers), self.n_shards + 1).astype(int)
+        self.shard_ranges = list(zip(bounds[:-1], bounds[1:]))
+        self.pool_version = engine.pool_version
+        # Queries are transformed with the vocabulary the shards were given, even after a rebuild
+        self._profile_index = engine.profile_index
+
+    def _payload(self, shard: int) -> Dict:
+        """
+        Copies of one shard's rows; call with the engine lock held.
+        """
+        engine = self.engine
+        start, stop = self.shard_ranges[shard]
+        collaborative_model = engine.collaborative_model
+        sales_min = getattr(collaborative_model, 'sales_min', None)
+        # Copied rather than viewed: updates write the engine's arrays in place, and
+        # spawn only pickles the payload once the process starts, outside the lock
+        return {
+            'offset': int(start),
+            'freelancers': engine.freelancers.slice_rows(start, stop),
+            'profiles': engine.profile_index.matrix[start:stop],
+            'skills': list(engine.skill_index.skills),
+            'freelancer_skills': engine.skill_index.freelancer_skills[start:stop],
+            'skill_similarity': engine.skill_index.similarity_table(),
+            'skill_threshold': engine.skill_index.threshold,
+            'interactions': np.array(collaborative_model.interaction_matrix[start:stop]),
+            'sales_range': None if sales_min is None else (sales_min, collaborative_model.sales_max),
+        }
+
+    def _start_shards(self, shards):
+        """
+        Start the given shards, or every shard on a new partition if the engine's pool has changed.
+        """
+        with self.engine._lock:
+            if self.engine.pool_version != self.pool_version:
+                if self.pool_version is not None:
+                    logger.info(f"Pool changed since the shards started; restarting all {self.n_shards}")
+                for shard in range(self.n_shards):
+                    self._stop_shard(shard)
+                self._partition()
+                shards = range(self.n_shards)
+            payloads = {shard: self._payload(shard) for shard in shards}
+        for shard, payload in payloads.items():
+            self._start_shard(shard, payload)
+
+    def _start_shard(self, shard: int, payload: Dict):
+        parent, child = self._context.Pipe()
+        process = self._context.Process(
+            target=_shard_main, args=(child, payload), name=f"matching-shard-{shard}", daemon=True
+        )
+        process.start()
+        child.close()
+        try:
+            if not parent.poll(self.startup_timeout):
+                raise ShardError(f"Shard {shard} did not start within {self.startup_timeout}s")
+            try:
+                parent.recv()
+            except EOFError as e:
+                raise ShardError(f"Shard {shard} exited while starting (exit code {process.exitcode})") from e
+        except BaseException:
+            parent.close()
+            process.kill()
+            process.join()
+            raise
+        self._processes[shard] = process
+        self._connections[shard] = parent
+
+    def _stop_shard(self, shard: int):
+        process, connection = self._processes[shard], self._connections[shard]
+        self._processes[shard] = self._connections[shard] = None
+        if connection is not None:
+            connection.close()
+        if process is not None and process.is_alive():
+            process.kill()
+            process.join()
+
+    def _ensure_shards(self):
+        stopped = []
+        for shard, process in enumerate(self._processes):
+            if process is None or not process.is_alive():
+                if process is not None:
+                    logger.warning(f"Restarting shard {shard} (exit code {process.exitcode})")
+                self._stop_shard(shard)
+                stopped.append(shard)
+        if stopped:
+            self._start_shards(stopped)
+
+    def match_freelancers(
+        self,
+        project: Project,
+        weights: Dict[str, float] = None,
+        top_n: int = 5,
+        constraints: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        Top matches across all shards; the same matches as MatchingEngine.match_freelancers.
+
+        Args:
+            project (Project): The project to match.
+            weights (Dict[str, float], optional): Hybrid weights.
+            top_n (int, optional): Number of matches. Defaults to 5.
+            constraints (Dict, optional): Keyword arguments of MatchingEngine.candidate_rows,
+                applied by every shard to its own rows before scoring.
+
+        Returns:
+            List[Dict]: Matches in the format of MatchingEngine.match_freelancers.
+
+        Raises:
+            ShardError: If a shard times out or fails and allow_partial is off.
+        """
+        if top_n <= 0:
+            return []
+        project_skills = self.engine.skill_extractor.extract_skills(project.description)
+
+        with self._lock:
+            self._ensure_shards()
+            project_tfidf = self._profile_index.transform([project.description])
+            self._request_id += 1
+            request = (self._request_id, project, project_skills, project_tfidf, weights, top_n, constraints)
+            for connection in self._connections:
+                connection.send(request)
+
+            results, failures = [], []
+            pending = {connection: shard for shard, connection in enumerate(self._connections)}
+            deadline = time.monotonic() + self.timeout
+            while pending:
+                ready = wait(list(pending), timeout=max(deadline - time.monotonic(), 0))
+                if not ready:
+                    break
+                for connection in ready:
+                    shard = pending.pop(connection)
+                    try:
+                        request_id, status, result = connection.recv()
+                    except (EOFError, OSError):
+                        failures.append(f"shard {shard} exited")
+                        self._stop_shard(shard)
+                        continue
+                    if status == 'ok':
+                        results.extend(result)
+                    else:
+                        failures.append(f"shard {shard}: {result}")
+
+            # A shard still working would answer this query during the next one
+            for shard in pending.values():
+                failures.append(f"shard {shard} timed out after {self.timeout}s")
+                self._stop_shard(shard)
+
+        if failures:
+            if not self.allow_partial:
+                raise ShardError(f"Matching project {project.id} failed: {'; '.join(failures)}")
+            logger.warning(f"Partial results for project {project.id}: {'; '.join(failures)}")
+
+        results.sort(key=lambda result: (-result[1], result[0]))
+        return [
+            {
+                'freelancer': freelancer,
+                'combined_score': combined,
+                'content_score': content,
+                'collaborative_score': collaborative,
+                'skill_overlap': skill_overlap,
+            }
+            for _, combined, content, collaborative, skill_overlap, freelancer in results[:top_n]
+        ]
+
+    def close(self):
+        """
+        Stop every shard process.
+        """
+        with self._lock:
+            for connection in self._connections:
+                if connection is not None:
+                    try:
+                        connection.send(None)
+                    except (BrokenPipeError, OSError):
+                        pass
+            for shard, process in enumerate(self._processes):
+                if process is not None:
+                    process.join(timeout=5)
+                self._stop_shard(shard)
+
+    def __enter__(self) -> 'ShardedMatchingEngine':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,9 +1,16 @@
 # testing environment
 import os
 import sys
+import copy
+import json
 import socket
+import hashlib
 import subprocess
-from typing import Dict, List, Optional
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional
 import logging
 
 # models
@@ -13,62 +20,199 @@ from difflib import SequenceMatcher
 from dataclasses import dataclass
 
 import numpy as np
+from scipy import sparse
+
+import metrics
+from framing import recv_frame, send_frame
+
+# sklearn, NLTK and rake_nltk take seconds to import, so they are imported where first used
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import TfidfVectorizer
 
-import nltk
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from rake_nltk import Rake
-
-
-# Import AI services
-import anthropic
-from openai import OpenAI
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s: %(message)s',
-    handlers=[
-        logging.FileHandler('fiverr_integration.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# NLTK data needed by SkillsExtract, by package name and data path.
+# Never downloaded implicitly; run `python upworkModel.py setup-nltk` once per machine.
+NLTK_RESOURCES = {
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'stopwords': 'corpora/stopwords',
+}
 
-# Ensure NLTK resources are downloaded
-nltk.download(['punkt', 'stopwords'], quiet=True)
 
-class SkillsExtract:
-    def __init__(
-        self,
-        claude_api_key: Optional[str] = None,
-        openai_api_key: Optional[str] = None
-    ):
-        # Load API keys securely
-        self.claude_api_key = claude_api_key or os.getenv('CLAUDE_API_KEY')
-        self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
+def missing_nltk_resources() -> List[str]:
+    """
+    Names of the NLTK_RESOURCES packages not installed on this machine.
+    """
+    import nltk
 
-        # Ensure NLTK resources are downloaded
+    missing = []
+    for name, path in NLTK_RESOURCES.items():
         try:
-            nltk.data.find('tokenizers/punkt')
+            nltk.data.find(path)
         except LookupError:
-            nltk.download('punkt', quiet=True)
+            missing.append(name)
+    return missing
 
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords', quiet=True)
 
-        # Initialize vectorization tools
-        self.tfidf_vectorizer = TfidfVectorizer(stop_words='english')
-        self.rake = Rake()
+def download_nltk_resources(quiet: bool = False) -> bool:
+    """
+    Download every NLTK_RESOURCES package; the explicit setup step. Returns whether all succeeded.
+    """
+    import nltk
 
-        # Manual keywords for initial skill extraction
-        self.manual_keywords = [
-            # Web Development
+    return all([nltk.download(name, quiet=quiet) for name in NLTK_RESOURCES])
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with hit/miss counters.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data), 'maxsize': self.maxsize}
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a keyword vocabulary.
+
+    Finds every keyword that occurs as a substring of a text, overlapping
+    occurrences included, in a single pass. Scan time depends on the length
+    of the text, not on the size of the vocabulary.
+    """
+
+    def __init__(self, keywords: Iterable[str] = ()):
+        self.keywords: List[str] = []
+        self._keyword_ids: Dict[str, int] = {}
+        # Trie transitions, keywords ending at each state, failure links and merged outputs
+        self._goto: List[Dict[str, int]] = [{}]
+        self._terminal: List[tuple] = [()]
+        self._fail: List[int] = [0]
+        self._out: List[tuple] = [()]
+        self._dirty = False
+        self.add_all(keywords)
+
+    def add(self, keyword: str):
+        if not keyword or keyword in self._keyword_ids:
+            return
+        keyword_id = len(self.keywords)
+        self._keyword_ids[keyword] = keyword_id
+        self.keywords.append(keyword)
+
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._terminal.append(())
+            state = next_state
+        self._terminal[state] += (keyword_id,)
+        self._dirty = True
+
+    def add_all(self, keywords: Iterable[str]):
+        for keyword in keywords:
+            self.add(keyword)
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self._keyword_ids
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _build(self):
+        """
+        Compute failure links breadth-first and merge outputs along them.
+        """
+        fail = [0] * len(self._goto)
+        out = list(self._terminal)
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                link = fail[state]
+                while link and char not in self._goto[link]:
+                    link = fail[link]
+                link = self._goto[link].get(char, 0)
+                fail[next_state] = link
+                out[next_state] = out[next_state] + out[link]
+        self._fail = fail
+        self._out = out
+        self._dirty = False
+
+    def _scan(self, text: str, first_only: bool) -> List[int]:
+        if self._dirty:
+            self._build()
+        goto, fail, out = self._goto, self._fail, self._out
+        found = {}
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                if first_only:
+                    return [out[state][0]]
+                for keyword_id in out[state]:
+                    found[keyword_id] = None
+        return list(found)
+
+    def find_all(self, text: str) -> List[str]:
+        """
+        Every keyword occurring in the text, in order of first occurrence.
+        """
+        return [self.keywords[keyword_id] for keyword_id in self._scan(text, first_only=False)]
+
+    def contains_any(self, text: str) -> bool:
+        """
+        Whether at least one keyword occurs in the text.
+        """
+        return bool(self._scan(text, first_only=True))
+
+
+# Manual keywords for initial skill extraction
+MANUAL_KEYWORDS = [
+    # Web Development
     "web development", "frontend development", "backend development", "full-stack development", "HTML", "CSS",
     "JavaScript", "React", "Angular", "Vue.js", "Node.js", "Django", "Flask", "PHP", "Ruby on Rails", "ASP.NET",
     "Laravel", "WordPress", "Shopify", "eCommerce", "Web design", "UI/UX design", "Responsive design",
@@ -112,7 +256,72 @@ class SkillsExtract:
     "solidity", "data entry", "virtual assistant", "technical support", "customer support", "sales", "financial analysis",
     "stock trading", "investment analysis", "legal writing", "paralegal", "video production", "podcasting", "music production",
     "audio editing"
-        ]
+]
+
+
+class SkillsExtract:
+    def __init__(
+        self,
+        claude_api_key: Optional[str] = None,
+        openai_api_key: Optional[str] = None,
+        cache_size: int = 1024,
+        keywords: Optional[Iterable[str]] = None
+    ):
+        # Load API keys securely
+        self.claude_api_key = claude_api_key or os.getenv('CLAUDE_API_KEY')
+        self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
+
+        # Ensure NLTK resources are installed
+        missing = missing_nltk_resources()
+        if missing:
+            raise LookupError(
+                f"Missing NLTK data {missing}; run 'python upworkModel.py setup-nltk' once to download it"
+            )
+        from nltk.corpus import stopwords
+        from rake_nltk import Rake
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        # Initialize vectorization tools
+        self.tfidf_vectorizer = TfidfVectorizer(stop_words='english')
+        self.rake = Rake()
+        # Rake keeps the last text's phrases on the instance, so concurrent callers take turns
+        self._rake_lock = threading.Lock()
+
+        # Manual keywords for initial skill extraction
+        self.manual_keywords = list(MANUAL_KEYWORDS)
+
+        # A custom vocabulary replaces the built-in keyword list
+        if keywords is not None:
+            self.manual_keywords = list(keywords)
+
+        # Per-call state computed once: lowercase keyword table, stopwords and the TF-IDF analyzer
+        self.keywords_lower = list(dict.fromkeys(keyword.lower() for keyword in self.manual_keywords))
+        self.keyword_matcher = KeywordMatcher(self.keywords_lower)
+        self.stop_words = set(stopwords.words('english'))
+        self.tfidf_analyzer = self.tfidf_vectorizer.build_analyzer()
+
+        # Extracted skills per normalized description; cache_size=0 disables memoization
+        self.cache = LRUCache(cache_size)
+
+    def add_keywords(self, keywords: Iterable[str]):
+        """
+        Grow the keyword vocabulary without rebuilding the extractor.
+        """
+        for keyword in keywords:
+            keyword_lower = keyword.lower()
+            if keyword_lower not in self.keyword_matcher:
+                self.manual_keywords.append(keyword)
+                self.keywords_lower.append(keyword_lower)
+                self.keyword_matcher.add(keyword_lower)
+        # Earlier results were extracted with the old vocabulary
+        self.cache.clear()
+
+    @staticmethod
+    def normalize_description(project_description: str) -> str:
+        """
+        Lowercase and collapse whitespace so near-identical posts share a cache entry.
+        """
+        return ' '.join(project_description.lower().split())
 
     def extract_skills(self, project_description: str) -> List[str]:
         """
@@ -129,39 +338,46 @@ class SkillsExtract:
             List[str]: Extracted and cleaned skills
         """
         # Normalize project description
-        project_description = project_description.lower()
+        project_description = self.normalize_description(project_description)
 
-        # Step 1: Manual Keyword Matching
-        manual_matched_skills = [
-            keyword for keyword in self.manual_keywords
-            if keyword.lower() in project_description
-        ]
+        cached = self.cache.get(project_description)
+        if cached is None:
+            cached = tuple(self._extract_skills(project_description))
+            self.cache.put(project_description, cached)
+        return list(cached)
+
+    def _extract_skills(self, project_description: str) -> List[str]:
+        # Step 1: Manual Keyword Matching (single pass over the description)
+        manual_matched_skills = self.keyword_matcher.find_all(project_description)
 
         # Step 2: NLTK RAKE Keyword Extraction
-        self.rake.extract_keywords_from_text(project_description)
-        rake_keywords = self.rake.get_ranked_phrases()
+        with self._rake_lock:
+            self.rake.extract_keywords_from_text(project_description)
+            rake_keywords = self.rake.get_ranked_phrases()
 
         # Step 3: NLTK-based text processing
         # Tokenize and remove stopwords
-        stop_words = set(stopwords.words('english'))
+        from nltk.tokenize import word_tokenize
+
         tokens = word_tokenize(project_description)
         nltk_keywords = [
             word for word in tokens
-            if word.lower() not in stop_words
+            if word.lower() not in self.stop_words
             and len(word) > 2
         ]
 
         # Step 4: TF-IDF Skill Extraction
-        try:
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform([project_description])
-            feature_names = self.tfidf_vectorizer.get_feature_names_out()
-            tfidf_scores = tfidf_matrix.toarray()[0]
-
-            # Get top keywords by TF-IDF score
-            top_indices = tfidf_scores.argsort()[-10:][::-1]
-            tfidf_keywords = [feature_names[i] for i in top_indices]
-        except Exception as e:
-            tfidf_keywords = []
+        # With a single document every idf is 1, so ranking by term counts gives
+        # the same top keywords as fitting a vectorizer on the description
+        term_counts = {}
+        for term in self.tfidf_analyzer(project_description):
+            term_counts[term] = term_counts.get(term, 0) + 1
+        feature_names = sorted(term_counts)
+        tfidf_scores = np.array([term_counts[term] for term in feature_names], dtype=float)
+
+        # Get top keywords by TF-IDF score
+        top_indices = tfidf_scores.argsort()[-10:][::-1]
+        tfidf_keywords = [feature_names[i] for i in top_indices]
 
         # Combine all extraction methods
         all_skills = manual_matched_skills + rake_keywords + nltk_keywords + tfidf_keywords
@@ -171,15 +387,61 @@ class SkillsExtract:
         for skill in all_skills:
             skill = skill.lower().strip()
             # Check if skill is in our manual keywords or derives from them
-            if len(skill) > 2 and any(
-                category.lower() in skill
-                for category in self.manual_keywords
-            ):
+            if len(skill) > 2 and self.keyword_matcher.contains_any(skill):
                 filtered_skills.append(skill)
 
         # Remove duplicates and return
         return list(set(filtered_skills))
 
+    def extract_skills_batch(
+        self,
+        descriptions: Iterable[str],
+        workers: Optional[int] = None,
+        chunk_size: int = 256
+    ) -> Iterator[List[str]]:
+        """
+        Extract skills for many descriptions, streaming results in input order.
+
+        Work is spread over a process pool whose workers each build one
+        extractor on start-up, so NLTK data and the keyword automaton load
+        once per worker. Only a bounded number of chunks is in flight at a
+        time, so arbitrarily long inputs are consumed lazily.
+
+        Args:
+            descriptions (Iterable[str]): Project descriptions to process.
+            workers (int, optional): Worker processes; defaults to the CPU count. 1 runs inline.
+            chunk_size (int, optional): Descriptions sent to a worker per task. Defaults to 256.
+
+        Yields:
+            List[str]: Extracted skills, one list per description.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1:
+            for description in descriptions:
+                yield self.extract_skills(description)
+            return
+
+        descriptions = iter(descriptions)
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self.manual_keywords, self.cache.maxsize),
+        )
+        try:
+            pending = deque()
+            while True:
+                # Keep every worker busy with one chunk queued behind it
+                while len(pending) < workers * 2:
+                    chunk = list(islice(descriptions, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(_extract_batch_chunk, chunk))
+                if not pending:
+                    break
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
     @classmethod
     def generate_ai_interview_questions(
         cls,
@@ -198,7 +460,20 @@ class SkillsExtract:
         return fallback_questions
 
 
-@dataclass
+# Per-process extractor used by SkillsExtract.extract_skills_batch workers
+_batch_extractor: Optional[SkillsExtract] = None
+
+
+def _init_batch_worker(keywords: List[str], cache_size: int):
+    global _batch_extractor
+    _batch_extractor = SkillsExtract(cache_size=cache_size, keywords=keywords)
+
+
+def _extract_batch_chunk(descriptions: List[str]) -> List[List[str]]:
+    return [_batch_extractor.extract_skills(description) for description in descriptions]
+
+
+@dataclass(slots=True)
 class Freelancer:
     id: str
     username: str
@@ -213,7 +488,20 @@ class Freelancer:
     total_sales: int
 
     def profile_text(self) -> str:
-        return f"{self.name} - {self.job_title}. Skills: {', '.join(self.skills)}"
+        return _profile_text(self.name, self.job_title, self.skills)
+
+
+def _profile_text(name: str, job_title: str, skills: List[str]) -> str:
+    return f"{name} - {job_title}. Skills: {', '.join(skills)}"
+
+
+# Pool digests are sums of freelancer digests modulo 2**128
+_DIGEST_MODULUS = 1 << 128
+
+
+def _freelancer_digest(freelancer: Freelancer) -> int:
+    payload = json.dumps([getattr(freelancer, name) for name in Freelancer.__slots__])
+    return int.from_bytes(hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest(), 'big')
 
 
 @dataclass
@@ -225,24 +513,660 @@ class Project:
     complexity: str
     timeline: Optional[int] = None
 
+class GrowableArray:
+    """
+    Writable array with spare rows at the end.
+
+    The source array is only read until the first write, which copies it into
+    a private buffer, so a read-only memory map stays shared until a row
+    changes. After that, overwriting a row writes in place, and appending one
+    only copies when the spare rows run out, so a run of appends costs
+    amortized O(1) per row.
+    """
+
+    def __init__(self, array, dtype=None):
+        self.data = np.asarray(array, dtype=dtype)
+        self.size = len(self.data)
+        self._owned = False
+
+    def view(self) -> np.ndarray:
+        return self.data[:self.size]
+
+    def set(self, row: int, value) -> np.ndarray:
+        """
+        Overwrite one row, or append it when row equals the size; returns the updated view.
+        """
+        if not self._owned:
+            self._resize(self.size + max(self.size // 8, 16))
+            self._owned = True
+        elif row == self.size and row == len(self.data):
+            self._resize(len(self.data) + len(self.data) // 2)
+        self.data[row] = value
+        self.size = max(self.size, row + 1)
+        return self.view()
+
+    def _resize(self, capacity: int):
+        data = np.empty((capacity,) + self.data.shape[1:], dtype=self.data.dtype)
+        data[:self.size] = self.data[:self.size]
+        self.data = data
+
+
+class FreelancerStore:
+    """
+    Structure-of-arrays freelancer pool.
+
+    Numeric fields live in NumPy columns, skills are interned integer IDs in a
+    CSR layout (skill_indptr/skill_indices into skill_vocabulary) and text
+    fields in plain lists. Indexing builds a Freelancer view on demand, so
+    full objects only exist for the rows a caller looks at.
+
+    set_row() updates the store in place: skills of changed rows are kept
+    aside and merged into the CSR arrays when those are next read, so an
+    update never copies the pool. delete_row() returns a new store.
+    """
+
+    TEXT_COLUMNS = ['id', 'username', 'name', 'job_title', 'profile_url']
+    NUMERIC_COLUMNS = {
+        'experience': np.int64,
+        'rating': np.float64,
+        'hourly_rate': np.float64,
+        'availability': np.bool_,
+        'total_sales': np.int64,
+    }
+
+    def __init__(self, columns: Dict[str, object], skill_vocabulary: List[str], skill_indptr, skill_indices):
+        """
+        Args:
+            columns (Dict[str, object]): Text columns as lists and numeric columns as arrays.
+            skill_vocabulary (List[str]): Interned skill strings; list position is the skill ID.
+            skill_indptr: Row offsets into skill_indices (length = rows + 1).
+            skill_indices: Skill IDs of every freelancer, row after row.
+        """
+        self.columns = columns
+        self.skill_vocabulary = skill_vocabulary
+        # CSR skill arrays and the skill IDs of rows set since, swapped as one tuple
+        self._skills = (np.asarray(skill_indptr, dtype=np.int64), np.asarray(skill_indices, dtype=np.int32), {})
+        self._skill_ids: Optional[Dict[str, int]] = None
+        self._row_ids: Optional[Dict[str, int]] = None
+        # Writable copies of the numeric columns, made on their first update
+        self._buffers: Dict[str, GrowableArray] = {}
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, list], skills: List[List[str]]) -> 'FreelancerStore':
+        skill_ids: Dict[str, int] = {}
+        skill_indices = np.fromiter(
+            (skill_ids.setdefault(skill, len(skill_ids)) for row_skills in skills for skill in row_skills),
+            dtype=np.int32,
+        )
+        skill_indptr = np.concatenate(([0], np.cumsum([len(row_skills) for row_skills in skills], dtype=np.int64)))
+        store_columns = {column: list(columns[column]) for column in cls.TEXT_COLUMNS}
+        for column, dtype in cls.NUMERIC_COLUMNS.items():
+            store_columns[column] = np.asarray(columns[column], dtype=dtype)
+        return cls(store_columns, list(skill_ids), skill_indptr, skill_indices)
+
+    @classmethod
+    def from_freelancers(cls, freelancers: Iterable[Freelancer]) -> 'FreelancerStore':
+        freelancers = list(freelancers)
+        columns = {
+            column: [getattr(freelancer, column) for freelancer in freelancers]
+            for column in cls.TEXT_COLUMNS + list(cls.NUMERIC_COLUMNS)
+        }
+        return cls.from_columns(columns, [freelancer.skills for freelancer in freelancers])
+
+    @classmethod
+    def from_csv(
+        cls,
+        file_path: str,
+        csv_columns: Optional[Dict[str, str]] = None,
+        chunksize: int = 100_000
+    ) -> 'FreelancerStore':
+        """
+        Load a CSV straight into columns, block by block, without creating Freelancer objects.
+        """
+        columns = {column: [] for column in cls.TEXT_COLUMNS + list(cls.NUMERIC_COLUMNS)}
+        skill_ids: Dict[str, int] = {}
+        index_blocks, length_blocks = [], []
+        for block in _iter_csv_blocks(file_path, csv_columns, chunksize):
+            for column in columns:
+                columns[column].extend(block[column])
+            index_blocks.append(np.fromiter(
+                (skill_ids.setdefault(skill, len(skill_ids)) for row_skills in block['skills'] for skill in row_skills),
+                dtype=np.int32,
+            ))
+            length_blocks.append(np.fromiter(map(len, block['skills']), dtype=np.int64, count=len(block['skills'])))
+
+        lengths = np.concatenate(length_blocks) if length_blocks else np.empty(0, dtype=np.int64)
+        skill_indices = np.concatenate(index_blocks) if index_blocks else np.empty(0, dtype=np.int32)
+        store_columns = {column: columns[column] for column in cls.TEXT_COLUMNS}
+        for column, dtype in cls.NUMERIC_COLUMNS.items():
+            store_columns[column] = np.asarray(columns[column], dtype=dtype)
+        return cls(store_columns, list(skill_ids), np.concatenate(([0], np.cumsum(lengths))), skill_indices)
+
+    def __len__(self) -> int:
+        return len(self.columns['id'])
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[index] for index in range(*row.indices(len(self)))]
+        row = int(row)
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError('freelancer row out of range')
+        columns = self.columns
+        return Freelancer(
+            id=columns['id'][row],
+            username=columns['username'][row],
+            name=columns['name'][row],
+            job_title=columns['job_title'][row],
+            skills=self.skills_of(row),
+            experience=int(columns['experience'][row]),
+            rating=float(columns['rating'][row]),
+            hourly_rate=float(columns['hourly_rate'][row]),
+            profile_url=columns['profile_url'][row],
+            availability=bool(columns['availability'][row]),
+            total_sales=int(columns['total_sales'][row]),
+        )
+
+    def __iter__(self) -> Iterator[Freelancer]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @property
+    def skill_indptr(self) -> np.ndarray:
+        return self._merged_skills()[0]
+
+    @property
+    def skill_indices(self) -> np.ndarray:
+        return self._merged_skills()[1]
+
+    def _merged_skills(self) -> tuple:
+        indptr, indices, changed = self._skills
+        if not changed:
+            return indptr, indices
+        rows = np.array(sorted(changed), dtype=np.int64)
+        lengths = np.zeros(len(self), dtype=np.int64)
+        lengths[:len(indptr) - 1] = np.diff(indptr)
+        lengths[rows] = [len(changed[row]) for row in rows.tolist()]
+        merged_indptr = np.concatenate(([0], np.cumsum(lengths)))
+
+        # Unchanged rows are copied in bulk, then the changed rows are written over their slots
+        merged_indices = np.empty(merged_indptr[-1], dtype=np.int32)
+        owners = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        kept = ~np.isin(owners, rows)
+        kept_owners = owners[kept]
+        merged_indices[merged_indptr[kept_owners] + (np.flatnonzero(kept) - indptr[kept_owners])] = indices[kept]
+        for row in rows.tolist():
+            merged_indices[merged_indptr[row]:merged_indptr[row + 1]] = changed[row]
+        self._skills = (merged_indptr, merged_indices, {})
+        return merged_indptr, merged_indices
+
+    def skills_of(self, row: int) -> List[str]:
+        vocabulary = self.skill_vocabulary
+        indptr, indices, changed = self._skills
+        skill_ids = changed.get(row)
+        if skill_ids is None:
+            skill_ids = indices[indptr[row]:indptr[row + 1]]
+        return [vocabulary[skill_id] for skill_id in skill_ids]
+
+    def profile_texts(self) -> Iterator[str]:
+        names, job_titles = self.columns['name'], self.columns['job_title']
+        for row in range(len(self)):
+            yield _profile_text(names[row], job_titles[row], self.skills_of(row))
+
+    def slice_rows(self, start: int, stop: int) -> 'FreelancerStore':
+        """
+        Rows start:stop as a new store sharing this store's skill vocabulary.
+        """
+        columns = {column: self.columns[column][start:stop] for column in self.TEXT_COLUMNS}
+        for column in self.NUMERIC_COLUMNS:
+            columns[column] = self.columns[column][start:stop].copy()
+        skill_start, skill_stop = self.skill_indptr[start], self.skill_indptr[stop]
+        return FreelancerStore(
+            columns,
+            self.skill_vocabulary,
+            self.skill_indptr[start:stop + 1] - skill_start,
+            self.skill_indices[skill_start:skill_stop].copy(),
+        )
+
+    def row_of(self, freelancer_id: str) -> Optional[int]:
+        if self._row_ids is None:
+            self._row_ids = {freelancer_id: row for row, freelancer_id in enumerate(self.columns['id'])}
+        return self._row_ids.get(freelancer_id)
+
+    def copy(self) -> 'FreelancerStore':
+        """
+        An independent store with the same rows, e.g. a snapshot to rebuild from.
+        """
+        store = self.slice_rows(0, len(self))
+        store.skill_vocabulary = list(self.skill_vocabulary)
+        return store
+
+    def set_row(self, row: int, freelancer: Freelancer):
+        """
+        Replace one row in place, or append it when row equals the pool size.
+        """
+        if self._skill_ids is None:
+            self._skill_ids = {skill: skill_id for skill_id, skill in enumerate(self.skill_vocabulary)}
+        row_skill_ids = []
+        for skill in freelancer.skills:
+            skill_id = self._skill_ids.get(skill)
+            if skill_id is None:
+                skill_id = self._skill_ids[skill] = len(self.skill_vocabulary)
+                self.skill_vocabulary.append(skill)
+            row_skill_ids.append(skill_id)
+        self._skills[2][row] = np.asarray(row_skill_ids, dtype=np.int32)
+        replaced_id = self.columns['id'][row] if row < len(self) else None
+
+        for column, dtype in self.NUMERIC_COLUMNS.items():
+            buffer = self._buffers.get(column)
+            if buffer is None:
+                buffer = self._buffers[column] = GrowableArray(self.columns[column], dtype=dtype)
+            self.columns[column] = buffer.set(row, getattr(freelancer, column))
+        # The id column sets the length, so it is extended last
+        for column in reversed(self.TEXT_COLUMNS):
+            values = self.columns[column]
+            if row == len(values):
+                values.append(getattr(freelancer, column))
+            else:
+                values[row] = getattr(freelancer, column)
+        if self._row_ids is not None:
+            if replaced_id is not None and replaced_id != freelancer.id:
+                del self._row_ids[replaced_id]
+            self._row_ids[freelancer.id] = row
+
+    def delete_row(self, row: int) -> 'FreelancerStore':
+        """
+        A new store without the given row.
+        """
+        start_offset, stop_offset = self.skill_indptr[row], self.skill_indptr[row + 1]
+        skill_indices = np.concatenate((self.skill_indices[:start_offset], self.skill_indices[stop_offset:]))
+        skill_indptr = np.concatenate((
+            self.skill_indptr[:row + 1],
+            self.skill_indptr[row + 2:] - (stop_offset - start_offset),
+        ))
+        columns = {}
+        for column in self.TEXT_COLUMNS:
+            columns[column] = self.columns[column][:row] + self.columns[column][row + 1:]
+        for column in self.NUMERIC_COLUMNS:
+            columns[column] = np.delete(self.columns[column], row)
+        store = FreelancerStore(columns, self.skill_vocabulary, skill_indptr, skill_indices)
+        store._skill_ids = self._skill_ids
+        return store
+
+
+def freelancer_column(freelancers, name: str) -> np.ndarray:
+    """
+    One numeric field of a freelancer pool as an array, for stores and plain lists alike.
+    """
+    if isinstance(freelancers, FreelancerStore):
+        return freelancers.column(name)
+    return np.array([getattr(freelancer, name) for freelancer in freelancers])
+
+
+def _profile_texts(freelancers) -> Iterable[str]:
+    if isinstance(freelancers, FreelancerStore):
+        return freelancers.profile_texts()
+    return [freelancer.profile_text() for freelancer in freelancers]
+
+
+def _splice_rows(matrix, start: int, stop: int, rows=None) -> sparse.csr_matrix:
+    """
+    Replace rows start:stop of a sparse matrix with the given rows (or drop them).
+    """
+    parts = [matrix[:start]] + ([rows] if rows is not None else []) + [matrix[stop:]]
+    return sparse.vstack(parts, format='csr')
+
+
+def _stack_rows(rows: List[sparse.csr_matrix], num_columns: int) -> sparse.csr_matrix:
+    """
+    One-row CSR matrices stacked into a matrix of num_columns columns.
+    """
+    indptr = np.concatenate(([0], np.cumsum([row.nnz for row in rows], dtype=np.int64)))
+    if not rows:
+        return sparse.csr_matrix((0, num_columns))
+    indices = np.concatenate([row.indices for row in rows])
+    data = np.concatenate([row.data for row in rows])
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), num_columns))
+
+
+class DeltaMatrix:
+    """
+    Sparse row matrix whose updates go to a small delta segment.
+
+    Rows replaced or appended since the base CSR matrix was built are kept
+    aside until there are more than max_delta of them, and then merged into
+    a new base. Readers compute on the base and overwrite the results of the
+    delta rows, so an update costs one row instead of a copy of the matrix.
+    """
+
+    def __init__(self, matrix, max_delta: int = 1024):
+        self.base = sparse.csr_matrix(matrix)
+        self.size = self.base.shape[0]
+        # May grow past the base's columns, e.g. when the skill vocabulary is extended
+        self.num_columns = self.base.shape[1]
+        self.max_delta = max_delta
+        self._rows: Dict[int, sparse.csr_matrix] = {}
+        self._stacked: Optional[tuple] = None
+
+    def set_row(self, row: int, vector) -> bool:
+        """
+        Replace one row, or append it when row equals the size.
+
+        Returns:
+            bool: Whether the delta was merged, replacing the base.
+        """
+        self._rows[row] = sparse.csr_matrix(vector)
+        self._stacked = None
+        self.size = max(self.size, row + 1)
+        if len(self._rows) > self.max_delta:
+            return self.merge()
+        return False
+
+    def delete_row(self, row: int):
+        self.merge()
+        self.base = _splice_rows(self.base, row, row + 1)
+        self.size -= 1
+
+    def delta(self) -> tuple:
+        """
+        Sorted rows of the delta and their values as one CSR matrix.
+        """
+        if self._stacked is None:
+            rows = sorted(self._rows)
+            self._stacked = (
+                np.array(rows, dtype=np.int64),
+                _stack_rows([self._rows[row] for row in rows], self.num_columns),
+            )
+        return self._stacked
+
+    def merge(self) -> bool:
+        """
+        Fold the delta into a new base; returns False if there was nothing to fold.
+        """
+        if not self._rows and self.base.shape == (self.size, self.num_columns):
+            return False
+        rows, delta = self.delta()
+        base = self.base
+        lengths = np.zeros(self.size, dtype=np.int64)
+        lengths[:base.shape[0]] = np.diff(base.indptr)
+        lengths[rows] = np.diff(delta.indptr)
+        indptr = np.concatenate(([0], np.cumsum(lengths)))
+
+        # Base entries of unchanged rows and every delta entry, each written at its row's offset
+        owners = np.repeat(np.arange(base.shape[0]), np.diff(base.indptr))
+        kept = np.flatnonzero(~np.isin(owners, rows))
+        delta_owners = np.repeat(rows, np.diff(delta.indptr))
+        positions = np.concatenate((
+            indptr[owners[kept]] + kept - base.indptr[owners[kept]],
+            indptr[delta_owners] + np.arange(delta.nnz) - np.repeat(delta.indptr[:-1], np.diff(delta.indptr)),
+        ))
+        indices = np.empty(indptr[-1], dtype=np.int32)
+        data = np.empty(indptr[-1], dtype=np.result_type(base.data, delta.data))
+        indices[positions] = np.concatenate((base.indices[kept], delta.indices))
+        data[positions] = np.concatenate((base.data[kept], delta.data))
+
+        self.base = sparse.csr_matrix((data, indices, indptr), shape=(self.size, self.num_columns))
+        self._rows = {}
+        self._stacked = None
+        return True
+
+
+class ImpactIndex:
+    """
+    Term-major postings of an L2-normalized TF-IDF matrix, each list sorted by weight.
+
+    A query walks the postings of its own terms only, so its cost depends on
+    how common those terms are rather than on the pool size. Reading just the
+    highest-impact head of every list (depth) and keeping the best partial
+    scores (n_candidates) trades recall for latency.
+    """
+
+    def __init__(self, matrix):
+        postings = sparse.csc_matrix(matrix)
+        terms = np.repeat(np.arange(postings.shape[1]), np.diff(postings.indptr))
+        # Highest weight first within each term
+        order = np.lexsort((-postings.data, terms))
+        self.indptr = postings.indptr
+        self.rows = postings.indices[order]
+        self.weights = postings.data[order]
+        self.num_rows = postings.shape[0]
+
+    def search(
+        self,
+        query,
+        n_candidates: int,
+        depth: Optional[int] = None,
+        rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Rows with the highest (partial) cosine similarity to the query.
+
+        Args:
+            query: 1 x terms TF-IDF vector, L2-normalized like the indexed rows.
+            n_candidates (int): Maximum number of rows to return.
+            depth (int, optional): Postings read per query term. Defaults to all of them.
+            rows (np.ndarray, optional): Sorted rows the result is restricted to.
+
+        Returns:
+            np.ndarray: Candidate rows in ascending order.
+        """
+        return _select_candidates(*self.scores(query, depth), n_candidates, rows)
+
+    def scores(self, query, depth: Optional[int] = None) -> tuple:
+        """
+        Rows sharing a term with the query, ascending, and their (partial) cosine similarities.
+        """
+        query = sparse.csr_matrix(query)
+        hits, impacts = [], []
+        for term, weight in zip(query.indices, query.data):
+            start, stop = self.indptr[term], self.indptr[term + 1]
+            if depth is not None:
+                stop = min(stop, start + depth)
+            hits.append(self.rows[start:stop])
+            impacts.append(self.weights[start:stop] * weight)
+        if not hits:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        candidates, inverse = np.unique(np.concatenate(hits), return_inverse=True)
+        return candidates, np.bincount(inverse, weights=np.concatenate(impacts))
+
+
+def _select_candidates(
+    candidates: np.ndarray,
+    scores: np.ndarray,
+    n_candidates: int,
+    rows: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    The n_candidates best-scoring of the ascending candidates, restricted to rows, in ascending order.
+    """
+    if rows is not None:
+        allowed = np.isin(candidates, rows, assume_unique=True)
+        candidates, scores = candidates[allowed], scores[allowed]
+    if len(candidates) > n_candidates:
+        candidates = np.sort(candidates[np.argpartition(-scores, n_candidates - 1)[:n_candidates]])
+    return candidates
+
+
+class ProfileIndex:
+    """
+    Fitted TF-IDF vocabulary and sparse profile matrix of a freelancer pool.
+    Built once per engine and shared by every component that scores content.
+    """
+
+    def __init__(self, vectorizer: 'TfidfVectorizer', matrix):
+        self.vectorizer = vectorizer
+        # Changed profiles go to a delta segment, so an update doesn't copy the matrix
+        self._rows = DeltaMatrix(matrix)
+        self._analyzer = None
+        # Built over the base matrix on first retrieval and dropped when the base changes
+        self._impact_index: Optional[ImpactIndex] = None
+
+    @classmethod
+    def build(cls, freelancers: List[Freelancer]) -> 'ProfileIndex':
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        vectorizer = TfidfVectorizer(stop_words='english')
+        matrix = vectorizer.fit_transform(_profile_texts(freelancers))
+        return cls(vectorizer, matrix)
+
+    def transform(self, texts: List[str]):
+        return self.vectorizer.transform(texts)
+
+    def unknown_terms(self, text: str) -> int:
+        """
+        Number of terms in the text that the fitted vocabulary does not cover.
+        """
+        if self._analyzer is None:
+            self._analyzer = self.vectorizer.build_analyzer()
+        vocabulary = self.vectorizer.vocabulary_
+        return sum(1 for term in self._analyzer(text) if term not in vocabulary)
+
+    @property
+    def matrix(self) -> sparse.csr_matrix:
+        """
+        Profile matrix with every update merged in.
+        """
+        if self._rows.merge():
+            self._impact_index = None
+        return self._rows.base
+
+    def similarity(self, projects_tfidf, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Cosine similarities of several projects to every profile, or only to the given rows.
+
+        Returns:
+            np.ndarray: projects x profiles similarities.
+        """
+        from sklearn.metrics.pairwise import cosine_similarity
+
+        base = self._rows.base
+        num_profiles = self._rows.size if rows is None else len(rows)
+        if num_profiles == 0:
+            return np.zeros((projects_tfidf.shape[0], 0))
+        delta_rows, delta = self._rows.delta()
+        if rows is None and base.shape[0] == num_profiles:
+            scores = cosine_similarity(projects_tfidf, base)
+        elif rows is None:
+            scores = np.zeros((projects_tfidf.shape[0], num_profiles))
+            if base.shape[0]:
+                scores[:, :base.shape[0]] = cosine_similarity(projects_tfidf, base)
+        elif not len(delta_rows):
+            return cosine_similarity(projects_tfidf, base[rows])
+        else:
+            scores = np.zeros((projects_tfidf.shape[0], num_profiles))
+            in_base = rows < base.shape[0]
+            if in_base.any():
+                scores[:, in_base] = cosine_similarity(projects_tfidf, base[rows[in_base]])
+        if not len(delta_rows):
+            return scores
+
+        # Profiles changed since the base was built
+        if rows is None:
+            scores[:, delta_rows] = cosine_similarity(projects_tfidf, delta)
+        else:
+            changed = np.isin(rows, delta_rows)
+            if changed.any():
+                scores[:, changed] = cosine_similarity(
+                    projects_tfidf, delta[np.searchsorted(delta_rows, rows[changed])]
+                )
+        return scores
+
+    def impact_index(self) -> ImpactIndex:
+        """
+        Impact-ordered postings of the base matrix; search() accounts for the delta.
+        """
+        if self._impact_index is None:
+            self._impact_index = ImpactIndex(self._rows.base)
+        return self._impact_index
+
+    def search(
+        self,
+        query,
+        n_candidates: int,
+        depth: Optional[int] = None,
+        rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        ImpactIndex.search over the current profiles; changed profiles are scored exactly.
+        """
+        candidates, scores = self.impact_index().scores(query, depth)
+        delta_rows, delta = self._rows.delta()
+        if len(delta_rows):
+            current = ~np.isin(candidates, delta_rows)
+            delta_scores = np.asarray((delta @ sparse.csr_matrix(query).T).todense()).ravel()
+            shared = delta_scores > 0
+            candidates = np.concatenate((candidates[current], delta_rows[shared]))
+            scores = np.concatenate((scores[current], delta_scores[shared]))
+            order = np.argsort(candidates, kind='stable')
+            candidates, scores = candidates[order], scores[order]
+        return _select_candidates(candidates, scores, n_candidates, rows)
+
+    def set_row(self, row: int, text: str):
+        """
+        Replace (or append, when row equals the pool size) one profile using the fixed vocabulary.
+        """
+        if self._rows.set_row(row, self.transform([text])):
+            self._impact_index = None
+
+    def delete_row(self, row: int):
+        self._rows.delete_row(row)
+        self._impact_index = None
+
+
 class ContentBasedModel:
-    def __init__(self):
-        self.tfidf_vectorizer = TfidfVectorizer(stop_words='english')
-        self.freelancer_tfidf = None
+    def __init__(self, profile_index: Optional[ProfileIndex] = None):
+        self.profile_index = profile_index
+
+    @property
+    def tfidf_vectorizer(self) -> Optional['TfidfVectorizer']:
+        return self.profile_index.vectorizer if self.profile_index else None
+
+    @property
+    def freelancer_tfidf(self):
+        return self.profile_index.matrix if self.profile_index else None
 
     def train(self, freelancer_data):
-        all_texts = [freelancer.profile_text() for freelancer in freelancer_data]
-        self.freelancer_tfidf = self.tfidf_vectorizer.fit_transform(all_texts)
+        self.profile_index = ProfileIndex.build(freelancer_data)
 
-    def predict(self, project_tfidf):
-        similarities = cosine_similarity(project_tfidf, self.freelancer_tfidf).flatten()
-        return similarities
+    def predict(self, project_tfidf, rows: Optional[np.ndarray] = None):
+        """
+        Cosine similarity of the project to every profile, or only to the given rows.
+        """
+        return self.predict_batch(project_tfidf, rows).flatten()
+
+    def predict_batch(self, projects_tfidf, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Cosine similarities of several projects as one sparse product (projects x profiles).
+        """
+        return self.profile_index.similarity(projects_tfidf, rows)
 
 class CollaborativeModel:
     def __init__(self):
         self.freelancer_data = None
         self.project_data = None
+        self._scores = None
         self.interaction_matrix = None
+        # total_sales range seen by the last train(), reused for incremental updates
+        self.sales_min = None
+        self.sales_max = None
+
+    @property
+    def interaction_matrix(self) -> Optional[np.ndarray]:
+        return self._interaction_matrix
+
+    @interaction_matrix.setter
+    def interaction_matrix(self, matrix: Optional[np.ndarray]):
+        self._interaction_matrix = matrix
+        # Every change of training data goes through here, so the cached scores can't go stale
+        self._scores = None
+        # Writable copies made by the first set_row()
+        self._matrix_rows: Optional[GrowableArray] = None
+        self._score_rows: Optional[GrowableArray] = None
 
     def train(self, project_data: List[Dict], freelancer_data: List[Freelancer]):
         self.freelancer_data = freelancer_data
@@ -251,14 +1175,16 @@ class CollaborativeModel:
         num_freelancers = len(freelancer_data)
         num_projects = len(project_data)
 
+        self.sales_min = self.sales_max = None
         if num_projects == 0 or num_freelancers == 0:
             logger.warning("No freelancers or projects available for training.")
             self.interaction_matrix = np.zeros((num_freelancers, 2))
             return
 
         try:
-            total_sales = np.array([f.total_sales for f in freelancer_data])
-            ratings = np.array([f.rating for f in freelancer_data])
+            total_sales = freelancer_column(freelancer_data, 'total_sales')
+            ratings = freelancer_column(freelancer_data, 'rating')
+            self.sales_min, self.sales_max = total_sales.min(), total_sales.max()
 
             # Handle cases where min == max to avoid division by zero
             if total_sales.max() > total_sales.min():
@@ -273,41 +1199,699 @@ class CollaborativeModel:
             logger.error(f"Error training collaborative model: {e}")
             self.interaction_matrix = np.zeros((num_freelancers, 2))
 
-    def predict(self, project_description: str, project_skills: List[str]) -> List[float]:
+    def load_interactions(
+        self,
+        freelancer_data: List[Freelancer],
+        interaction_matrix: np.ndarray,
+        sales_range: Optional[tuple] = None
+    ):
         """
-        Predict match scores using collaborative filtering.
+        Restore a previously trained interaction matrix instead of retraining.
+        """
+        self.freelancer_data = freelancer_data
+        self.project_data = []
+        self.interaction_matrix = interaction_matrix
+        self.sales_min, self.sales_max = sales_range or (None, None)
+
+    def feature_row(self, freelancer: Freelancer) -> np.ndarray:
+        """
+        Normalized features of one freelancer, using the statistics of the last train().
+        """
+        if self.sales_min is None:
+            return np.zeros(2)
+        if self.sales_max > self.sales_min:
+            total_sales_norm = (freelancer.total_sales - self.sales_min) / (self.sales_max - self.sales_min)
+        else:
+            total_sales_norm = 0.0
+        return np.array([total_sales_norm, freelancer.rating / 5.0])
+
+    def in_range(self, freelancer: Freelancer) -> bool:
+        """
+        Whether the stored statistics still cover this freelancer's values.
+        """
+        return self.sales_min is None or self.sales_min <= freelancer.total_sales <= self.sales_max
+
+    def set_row(self, row: int, freelancer: Freelancer):
+        """
+        Replace (or append, when row equals the pool size) one freelancer's features.
+        """
+        features = self.feature_row(freelancer)
+        if self._matrix_rows is None:
+            # Copy on first write; a loaded matrix may be a read-only memory map
+            matrix = np.asarray(self.interaction_matrix, dtype=float)
+            self._matrix_rows = GrowableArray(matrix.reshape(-1, len(features)))
+        # Written in place, bypassing the setter so the cached scores are patched rather than dropped
+        self._interaction_matrix = self._matrix_rows.set(row, features)
+        if self._score_rows is not None:
+            scores = self._score_rows.set(row, np.nan_to_num(np.nanmean(features)))
+            scores.setflags(write=False)
+            self._scores = scores
+
+    def delete_row(self, row: int):
+        self.interaction_matrix = np.delete(self.interaction_matrix, row, axis=0)
+
+    def scores(self) -> np.ndarray:
+        """
+        Project-independent score of every freelancer, computed once per interaction matrix.
+
+        Returns:
+            np.ndarray: Read-only scores aligned with the freelancer pool.
         """
         if self.interaction_matrix is None or self.interaction_matrix.size == 0:
             logger.warning("Interaction matrix is empty. Returning zero scores.")
-            return [0.0] * len(self.freelancer_data)
+            return np.zeros(len(self.freelancer_data))
+
+        if self._scores is None:
+            # Compute average scores while handling potential NaN values
+            self._score_rows = GrowableArray(
+                np.nan_to_num(np.nanmean(self.interaction_matrix, axis=1))  # Avoid NaN propagation
+            )
+            scores = self._score_rows.view()
+            scores.setflags(write=False)
+            self._scores = scores
+        return self._scores
+
+    def predict(self, project_description: str, project_skills: List[str]) -> np.ndarray:
+        """
+        Predict match scores using collaborative filtering.
+
+        The scores don't depend on the project, so this returns the cached vector.
+        """
+        return self.scores()
+
+    def predict_batch(self, project_descriptions: List[str], project_skills: List[List[str]]) -> np.ndarray:
+        """
+        Scores for several projects at once.
+
+        Returns:
+            np.ndarray: projects x freelancers scores.
+        """
+        scores = self.scores()
+        return np.broadcast_to(scores, (len(project_descriptions), len(scores)))
+
+
+def _project_text(description: str, skills: List[str]) -> str:
+    return f"{description} {' '.join(skills)}"
+
+
+class FactorizedCollaborativeModel(CollaborativeModel):
+    """
+    Collaborative model that also learns from historical project-freelancer interactions.
+
+    A historical project may list the freelancers it hired under 'hired', either
+    as a list of freelancer IDs or as a dict of ID to interaction strength. The
+    project x freelancer matrix is factorized with a truncated SVD. A new project
+    is folded in through its TF-IDF similarity to the historical projects, and its
+    affinity to every freelancer comes from the cached freelancer factors. The
+    affinity is blended with the project-independent score. Projects unlike
+    any seen before fall back to that score alone.
+    """
+
+    def __init__(self, n_factors: int = 16, blend: float = 0.5):
+        """
+        Args:
+            n_factors (int, optional): Rank of the factorization. Defaults to 16.
+            blend (float, optional): Share of the project affinity in the final score. Defaults to 0.5.
+        """
+        super().__init__()
+        self.n_factors = n_factors
+        self.blend = blend
+        self.project_vectorizer: Optional['TfidfVectorizer'] = None
+        self.project_tfidf = None
+        # Historical projects x factors (U * S) and freelancers x factors (V)
+        self.project_factors: Optional[np.ndarray] = None
+        self.freelancer_factors: Optional[np.ndarray] = None
+        # Spare rows for the freelancers appended after fit_factors()
+        self._factor_rows: Optional[GrowableArray] = None
+
+    def train(self, project_data: List[Dict], freelancer_data: List[Freelancer]):
+        super().train(project_data, freelancer_data)
+        self.fit_factors(project_data, freelancer_data)
+
+    def fit_factors(self, project_data: List[Dict], freelancer_data: List[Freelancer]):
+        """
+        Factorize the hires recorded in project_data.
+        """
+        self.project_vectorizer = self.project_tfidf = None
+        self.project_factors = self.freelancer_factors = None
+
+        row_of = {freelancer_id: row for row, freelancer_id in enumerate(freelancer_column(freelancer_data, 'id'))}
+        rows, cols, values = [], [], []
+        for project_row, project in enumerate(project_data):
+            hired = project.get('hired') or {}
+            if not isinstance(hired, dict):
+                hired = {freelancer_id: 1.0 for freelancer_id in hired}
+            for freelancer_id, strength in hired.items():
+                if freelancer_id in row_of:
+                    rows.append(project_row)
+                    cols.append(row_of[freelancer_id])
+                    values.append(float(strength))
+        if not values:
+            logger.info("No historical hires; collaborative scores stay project-independent.")
+            return
+
+        from scipy.sparse.linalg import svds
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        interactions = sparse.csr_matrix((values, (rows, cols)), shape=(len(project_data), len(freelancer_data)))
+        rank = min(self.n_factors, min(interactions.shape))
+        if rank < min(interactions.shape):
+            # Fixed start vector keeps the factorization reproducible
+            u, s, vt = svds(interactions, k=rank, v0=np.ones(min(interactions.shape)))
+        else:
+            u, s, vt = np.linalg.svd(interactions.toarray(), full_matrices=False)
+            u, s, vt = u[:, :rank], s[:rank], vt[:rank]
+
+        self.project_vectorizer = TfidfVectorizer(stop_words='english')
+        self.project_tfidf = self.project_vectorizer.fit_transform(
+            [_project_text(project['description'], project.get('required_skills') or []) for project in project_data]
+        )
+        self.project_factors = u * s
+        self.freelancer_factors = vt.T
+
+    def affinity(self, project_descriptions: List[str], project_skills: List[List[str]]) -> Optional[np.ndarray]:
+        """
+        Project x freelancer affinity scaled to [0, 1] per project, or None without history.
+        """
+        if self.freelancer_factors is None:
+            return None
+        from sklearn.metrics.pairwise import cosine_similarity
+
+        project_tfidf = self.project_vectorizer.transform(
+            [_project_text(description, skills) for description, skills in zip(project_descriptions, project_skills)]
+        )
+        embeddings = cosine_similarity(project_tfidf, self.project_tfidf) @ self.project_factors
+        affinity = np.clip(embeddings @ self.freelancer_factors.T, 0.0, None)
+        peak = affinity.max(axis=1, keepdims=True) if affinity.shape[1] else np.zeros((len(affinity), 1))
+        return np.divide(affinity, peak, out=np.zeros_like(affinity), where=peak > 0)
+
+    def predict_batch(self, project_descriptions: List[str], project_skills: List[List[str]]) -> np.ndarray:
+        scores = super().predict_batch(project_descriptions, project_skills)
+        affinity = self.affinity(project_descriptions, project_skills)
+        if affinity is None:
+            return scores
+        blended = (1 - self.blend) * scores + self.blend * affinity
+        unseen = affinity.max(axis=1, initial=0.0) == 0
+        blended[unseen] = scores[unseen]
+        return blended
+
+    def predict(self, project_description: str, project_skills: List[str]) -> np.ndarray:
+        if self.freelancer_factors is None:
+            return self.scores()
+        return self.predict_batch([project_description], [project_skills])[0]
+
+    def set_row(self, row: int, freelancer: Freelancer):
+        super().set_row(row, freelancer)
+        # A newcomer has no hires yet; a replaced freelancer keeps its history
+        if self.freelancer_factors is not None and row == len(self.freelancer_factors):
+            if self._factor_rows is None or self.freelancer_factors.base is not self._factor_rows.data:
+                self._factor_rows = GrowableArray(self.freelancer_factors)
+            self.freelancer_factors = self._factor_rows.set(row, 0.0)
+
+    def delete_row(self, row: int):
+        super().delete_row(row)
+        if self.freelancer_factors is not None:
+            self.freelancer_factors = np.delete(self.freelancer_factors, row, axis=0)
+
+class SkillIndex:
+    """
+    Normalized skill vocabulary of a freelancer pool.
+
+    Holds canonical skill IDs, a lazily filled table of which vocabulary skills
+    are similar to each other, and an inverted index from skill to the
+    freelancers listing it. Overlap counts follow the same rule as the
+    pairwise comparison: one hit per (required skill, freelancer skill) pair
+    whose similarity exceeds the threshold.
+    """
+
+    def __init__(
+        self,
+        skills: List[str],
+        freelancer_skills,
+        threshold: float = 0.7,
+        cache_size: int = 100_000,
+        postings=None
+    ):
+        """
+        Args:
+            skills (List[str]): Normalized skill vocabulary; list position is the skill ID.
+            freelancer_skills: Sparse freelancer x skill count matrix.
+            threshold (float, optional): Similarity above which two skills match. Defaults to 0.7.
+            cache_size (int, optional): Bound of the pairwise similarity cache.
+            postings (optional): freelancer_skills in CSC form, e.g. memory-mapped from disk.
+                Built from freelancer_skills on first use if omitted.
+        """
+        self.threshold = threshold
+        # (normalized skill, normalized skill) -> similar?, shared by scoring and filtering
+        self.similarity_cache = LRUCache(cache_size)
+
+        self.skills = list(skills)
+        self.skill_ids: Dict[str, int] = {skill: skill_id for skill_id, skill in enumerate(self.skills)}
+
+        # Freelancer x skill counts; repeated skills in a profile count once per entry.
+        # Changed rows go to a delta segment, so an update doesn't copy the matrix.
+        self._rows = DeltaMatrix(freelancer_skills)
+        self._postings = None if postings is None else sparse.csc_matrix(postings)
+
+        # Normalized skill -> IDs of the vocabulary skills similar to it
+        self._similar: Dict[str, np.ndarray] = {}
+        # Character counts of the vocabulary for the quick_ratio prefilter, built on first use
+        self._alphabet: Dict[str, int] = {}
+        self._char_counts: Optional[np.ndarray] = None
+        self._lengths: Optional[np.ndarray] = None
+
+    @classmethod
+    def build(cls, freelancers, threshold: float = 0.7, cache_size: int = 100_000) -> 'SkillIndex':
+        if not isinstance(freelancers, FreelancerStore):
+            freelancers = FreelancerStore.from_freelancers(freelancers)
+
+        # Map the store's interned skills onto normalized skill IDs
+        skill_ids: Dict[str, int] = {}
+        normalized_ids = np.array(
+            [skill_ids.setdefault(cls.normalize(skill), len(skill_ids)) for skill in freelancers.skill_vocabulary],
+            dtype=np.int32,
+        )
+        indices = normalized_ids[freelancers.skill_indices]
+        freelancer_skills = sparse.csr_matrix(
+            (np.ones(len(indices)), indices, freelancers.skill_indptr),
+            shape=(len(freelancers), len(skill_ids)),
+        )
+        freelancer_skills.sum_duplicates()
+        return cls(list(skill_ids), freelancer_skills, threshold, cache_size)
+
+    @staticmethod
+    def normalize(skill: str) -> str:
+        return skill.lower()
+
+    def is_similar(self, a: str, b: str) -> bool:
+        """
+        Whether two normalized skills are more similar than the threshold.
+        Results are memoized per pair in the similarity cache.
+        """
+        key = (a, b)
+        result = self.similarity_cache.get(key)
+        if result is None:
+            result = self._compare(a, b)
+            self.similarity_cache.put(key, result)
+        return result
+
+    def _compare(self, a: str, b: str) -> bool:
+        """
+        Uncached similarity check.
+
+        The quick ratios are cheap upper bounds of ratio(), so most pairs are
+        rejected without computing the full matching blocks. The length bound
+        (real_quick_ratio) is checked before a matcher is even built.
+        """
+        total = len(a) + len(b)
+        if not total or 2.0 * min(len(a), len(b)) / total <= self.threshold:
+            # Two empty strings are identical, ratio() 1.0
+            return not total and self.threshold < 1.0
+        matcher = SequenceMatcher(None, a, b)
+        return (
+            matcher.real_quick_ratio() > self.threshold
+            and matcher.quick_ratio() > self.threshold
+            and matcher.ratio() > self.threshold
+        )
+
+    def _candidate_ids(self, skill: str) -> np.ndarray:
+        """
+        IDs of the vocabulary skills whose quick_ratio() with skill exceeds the threshold.
+
+        quick_ratio() only counts shared characters, so it is computed for the
+        whole vocabulary at once from a skill x character count matrix. It is
+        an upper bound of ratio(), so no similar skill is dropped.
+        """
+        if self._char_counts is None or len(self._lengths) != len(self.skills):
+            self._alphabet = {}
+            for other in self.skills:
+                for char in other:
+                    self._alphabet.setdefault(char, len(self._alphabet))
+            char_counts = np.zeros((len(self.skills), len(self._alphabet)), dtype=np.int32)
+            for skill_id, other in enumerate(self.skills):
+                for char in other:
+                    char_counts[skill_id, self._alphabet[char]] += 1
+            self._char_counts = char_counts
+            self._lengths = np.array([len(other) for other in self.skills], dtype=np.int64)
+
+        counts = np.zeros(len(self._alphabet), dtype=np.int32)
+        for char in skill:
+            column = self._alphabet.get(char)
+            # Characters outside the vocabulary can't be shared
+            if column is not None:
+                counts[column] += 1
+        matches = np.minimum(self._char_counts, counts).sum(axis=1)
+        totals = self._lengths + len(skill)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bounds = np.where(totals > 0, 2.0 * matches / totals, 1.0)
+        return np.flatnonzero(bounds > self.threshold)
+
+    def _similar_row(self, skill: str, compare: Callable[[str, str], bool]) -> np.ndarray:
+        return np.array(
+            [skill_id for skill_id in self._candidate_ids(skill).tolist() if compare(skill, self.skills[skill_id])],
+            dtype=np.intp,
+        )
+
+    def precompute(self):
+        """
+        Build the similarity table for every skill in the vocabulary.
+
+        Rows are otherwise computed on first use by similar_ids(); this is
+        only needed to save or ship the whole table.
+        """
+        for skill in self.skills:
+            if skill in self._similar:
+                continue
+            # The table itself is the cache for vocabulary pairs
+            self._similar[skill] = self._similar_row(skill, self._compare)
+
+    def _skill_id(self, skill: str) -> int:
+        """
+        ID of a normalized skill, extending the vocabulary and similarity table if it is new.
+        """
+        skill_id = self.skill_ids.get(skill)
+        if skill_id is not None:
+            return skill_id
+
+        skill_id = len(self.skills)
+        self.skills.append(skill)
+        self.skill_ids[skill] = skill_id
+        for other, ids in self._similar.items():
+            if self._compare(other, skill):
+                self._similar[other] = np.append(ids, skill_id)
+        self._similar[skill] = self._similar_row(skill, self._compare)
+        self._rows.num_columns = len(self.skills)
+        return skill_id
+
+    def set_row(self, row: int, skills: List[str]):
+        """
+        Replace (or append, when row equals the pool size) one freelancer's skills.
+        """
+        skill_ids = [self._skill_id(self.normalize(skill)) for skill in skills]
+        vector = sparse.csr_matrix(
+            (np.ones(len(skill_ids)), ([0] * len(skill_ids), skill_ids)),
+            shape=(1, len(self.skills)),
+        )
+        if self._rows.set_row(row, vector):
+            self._postings = None
+
+    def delete_row(self, row: int):
+        self._rows.delete_row(row)
+        self._postings = None
+
+    @property
+    def postings(self) -> sparse.csc_matrix:
+        """
+        Inverted index of the base matrix: column slices give the freelancers holding a skill.
+        """
+        if self._postings is None:
+            self._postings = self._rows.base.tocsc()
+        return self._postings
+
+    @property
+    def freelancer_skills(self) -> sparse.csr_matrix:
+        """
+        Freelancer x skill count matrix with every update merged in.
+        """
+        if self._rows.merge():
+            self._postings = None
+        return self._rows.base
+
+    def similarity_table(self) -> sparse.csr_matrix:
+        """
+        The full similarity table as a sparse vocabulary x vocabulary matrix; fills in any missing rows.
+        """
+        self.precompute()
+        rows = [self._similar[skill] for skill in self.skills]
+        indptr = np.concatenate(([0], np.cumsum([len(ids) for ids in rows]))).astype(np.int64)
+        indices = np.concatenate(rows).astype(np.int32) if rows else np.empty(0, dtype=np.int32)
+        data = np.ones(len(indices), dtype=np.int8)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(self.skills), len(self.skills)))
+
+    def load_similarity_table(self, table):
+        """
+        Restore the table produced by similarity_table() instead of recomputing it.
+        """
+        table = sparse.csr_matrix(table)
+        for skill_id, skill in enumerate(self.skills):
+            self._similar[skill] = np.asarray(
+                table.indices[table.indptr[skill_id]:table.indptr[skill_id + 1]], dtype=np.intp
+            )
+
+    def similar_ids(self, skill: str) -> np.ndarray:
+        """
+        IDs of the vocabulary skills similar to the given skill.
+        """
+        key = self.normalize(skill)
+        ids = self._similar.get(key)
+        if ids is None:
+            ids = self._similar_row(key, self.is_similar)
+            # Only vocabulary rows are kept so the table stays bounded
+            if key in self.skill_ids:
+                self._similar[key] = ids
+        return ids
+
+    def overlap_counts(self, required_skills: List[str]) -> np.ndarray:
+        """
+        Skill overlap of every freelancer with the required skills.
+
+        Returns:
+            np.ndarray: Overlap counts aligned with the indexed freelancers.
+        """
+        weights = np.zeros(len(self.skills))
+        for skill in required_skills:
+            weights[self.similar_ids(skill)] += 1
+
+        # Walk only the posting lists of the skills that matched something
+        matched = np.flatnonzero(weights)
+        indexed = matched[matched < self.postings.shape[1]]
+        counts = np.zeros(self._rows.size)
+        counts[:self.postings.shape[0]] = self.postings[:, indexed] @ weights[indexed]
+        delta_rows, delta = self._rows.delta()
+        if len(delta_rows):
+            counts[delta_rows] = delta @ weights
+        return np.rint(counts).astype(np.int64)
+
+    def overlap_counts_batch(self, required_skills: List[List[str]]) -> np.ndarray:
+        """
+        Skill overlap of every freelancer with several required-skill lists, as one sparse product.
+
+        Returns:
+            np.ndarray: projects x freelancers overlap counts.
+        """
+        skill_ids, projects = [], []
+        for project, skills in enumerate(required_skills):
+            for skill in skills:
+                ids = self.similar_ids(skill)
+                skill_ids.append(ids)
+                projects.append(np.full(len(ids), project))
+        if not skill_ids:
+            return np.zeros((len(required_skills), self._rows.size), dtype=np.int64)
+
+        # Duplicate (skill, project) entries are summed, as repeated required skills count twice
+        weights = sparse.csr_matrix(
+            (np.ones(sum(len(ids) for ids in skill_ids)), (np.concatenate(skill_ids), np.concatenate(projects))),
+            shape=(len(self.skills), len(required_skills)),
+        )
+        counts = np.zeros((len(required_skills), self._rows.size))
+        counts[:, :self.postings.shape[0]] = (self.postings @ weights[:self.postings.shape[1]]).T.toarray()
+        delta_rows, delta = self._rows.delta()
+        if len(delta_rows):
+            counts[:, delta_rows] = (delta @ weights).T.toarray()
+        return np.rint(counts).astype(np.int64)
+
+    def count_overlap(self, required_skills: List[str], freelancer_skills: List[str]) -> int:
+        """
+        Skill overlap between one freelancer's skills and the required skills.
+        """
+        freelancer_ids = [self.skill_ids.get(self.normalize(skill)) for skill in freelancer_skills]
+        overlap_count = 0
+        for req_skill in required_skills:
+            similar = set(self.similar_ids(req_skill).tolist())
+            for skill_id, freelancer_skill in zip(freelancer_ids, freelancer_skills):
+                if skill_id is None:
+                    # Skill outside the indexed vocabulary
+                    overlap_count += self.is_similar(self.normalize(req_skill), self.normalize(freelancer_skill))
+                else:
+                    overlap_count += skill_id in similar
+        return overlap_count
+
+
+class ConstraintIndex:
+    """
+    Hard-constraint lookups over a freelancer store.
+
+    Rows are kept sorted by hourly rate so a budget range is two binary
+    searches, and availability is a packed bitmap tested only for the rows
+    that survive the budget check. A changed row is moved to its new place
+    in the rate order instead of re-sorting the pool.
+    """
+
+    def __init__(self, freelancers: FreelancerStore):
+        self.rates = np.array(freelancers.column('hourly_rate'), dtype=float)
+        self.size = len(freelancers)
+        self.rate_order = np.argsort(self.rates, kind='stable')
+        self.sorted_rates = self.rates[self.rate_order]
+        # NaN rates sort last; comparisons with NaN never exclude a row, so they always pass
+        self.num_unrated = int(np.isnan(self.sorted_rates).sum())
+        self.available = np.packbits(np.asarray(freelancers.column('availability'), dtype=bool))
+
+    def _position(self, row: int, rate: float) -> int:
+        """
+        Index of (rate, row) in the rate order, where equal rates are ordered by row as the stable sort leaves them.
+        """
+        start = np.searchsorted(self.sorted_rates, rate, side='left')
+        stop = np.searchsorted(self.sorted_rates, rate, side='right')
+        return int(start + np.searchsorted(self.rate_order[start:stop], row))
+
+    def set_row(self, row: int, freelancer: Freelancer):
+        """
+        Update one row's rate and availability, or append it when row equals the size.
+        """
+        rate = float(freelancer.hourly_rate)
+        target = self._position(row, rate)
+        if row < self.size:
+            current = self._position(row, self.rates[row])
+            self.num_unrated -= int(np.isnan(self.rates[row]))
+            # Shift the entries between the old and new place by one
+            if target > current:
+                target -= 1
+                self.rate_order[current:target] = self.rate_order[current + 1:target + 1]
+                self.sorted_rates[current:target] = self.sorted_rates[current + 1:target + 1]
+            else:
+                self.rate_order[target + 1:current + 1] = self.rate_order[target:current]
+                self.sorted_rates[target + 1:current + 1] = self.sorted_rates[target:current]
+            self.rate_order[target] = row
+            self.sorted_rates[target] = rate
+            self.rates[row] = rate
+        else:
+            self.rate_order = np.insert(self.rate_order, target, row)
+            self.sorted_rates = np.insert(self.sorted_rates, target, rate)
+            self.rates = np.append(self.rates, rate)
+            if self.size % 8 == 0:
+                self.available = np.append(self.available, np.uint8(0))
+            self.size += 1
+        self.num_unrated += int(np.isnan(rate))
+
+        mask = np.uint8(1 << (7 - (row & 7)))
+        if freelancer.availability:
+            self.available[row >> 3] |= mask
+        else:
+            self.available[row >> 3] &= ~mask
+
+    def delete_row(self, row: int):
+        position = self._position(row, self.rates[row])
+        self.num_unrated -= int(np.isnan(self.rates[row]))
+        self.rate_order = np.delete(self.rate_order, position)
+        self.rate_order[self.rate_order > row] -= 1
+        self.sorted_rates = np.delete(self.sorted_rates, position)
+        self.rates = np.delete(self.rates, row)
+        self.available = np.packbits(np.delete(np.unpackbits(self.available)[:self.size], row))
+        self.size -= 1
+
+    def within_budget(self, budget_range: tuple) -> np.ndarray:
+        rated = self.sorted_rates[:self.size - self.num_unrated]
+        start = np.searchsorted(rated, budget_range[0], side='left')
+        stop = np.searchsorted(rated, budget_range[1], side='right')
+        return np.concatenate((self.rate_order[start:stop], self.rate_order[self.size - self.num_unrated:]))
+
+    def is_available(self, rows: np.ndarray) -> np.ndarray:
+        return ((self.available[rows >> 3] >> (7 - (rows & 7))) & 1).astype(bool)
+
+    def candidates(self, budget_range: Optional[tuple] = None, require_available: bool = False) -> np.ndarray:
+        """
+        Rows satisfying the constraints, in ascending row order.
+        """
+        if budget_range is not None:
+            rows = self.within_budget(budget_range)
+            metrics.increment('filtered_budget', self.size - len(rows))
+        else:
+            rows = np.arange(self.size)
+        if require_available:
+            available = rows[self.is_available(rows)]
+            metrics.increment('filtered_availability', len(rows) - len(available))
+            rows = available
+        return np.sort(rows)
 
-        # Compute average scores while handling potential NaN values
-        scores = np.nanmean(self.interaction_matrix, axis=1)  # Avoid NaN propagation
-        return np.nan_to_num(scores).tolist()
 
 class MatchingEngine:
-    def __init__(self, freelancers: List[Freelancer], projects: List[Project], skill_extractor: SkillsExtract, collaborative_model=None):
+    def __init__(
+        self,
+        freelancers: List[Freelancer],
+        projects: List[Project],
+        skill_extractor: SkillsExtract,
+        collaborative_model=None,
+        vectorized: bool = True,
+        profile_index: Optional[ProfileIndex] = None,
+        skill_index: Optional[SkillIndex] = None,
+        rebuild_threshold: float = 0.05,
+        prune: bool = True
+    ):
         """
         Initialize the matching engine with freelancers, projects, and skill extraction tools.
 
         Args:
-            freelancers (List[Freelancer]): List of freelancer objects.
+            freelancers (List[Freelancer] | FreelancerStore): Freelancer pool; lists are converted to a store.
             projects (List[Project]): List of project objects.
             skill_extractor (SkillsExtract): A skill extraction tool for analyzing project descriptions.
+            vectorized (bool, optional): Score the pool with NumPy arrays instead of a per-freelancer loop. Defaults to True.
+            profile_index (ProfileIndex, optional): Prebuilt TF-IDF index, e.g. loaded from disk.
+            skill_index (SkillIndex, optional): Prebuilt skill index, e.g. loaded from disk.
+            rebuild_threshold (float, optional): Drift at which incremental updates schedule a
+                full background rebuild. Defaults to 0.05.
+            prune (bool, optional): Let vectorized top_n queries skip content scoring for rows
+                that provably cannot reach the top_n. Results are unchanged. Defaults to True.
         """
+        if not isinstance(freelancers, FreelancerStore):
+            freelancers = FreelancerStore.from_freelancers(freelancers)
         self.freelancers = freelancers
         self.projects = projects
         self.skill_extractor = skill_extractor
+        self.vectorized = vectorized
+        self.prune = prune
+
+        # Numeric columns aligned with self.freelancers for the vectorized scorer
+        self._experience = GrowableArray(freelancers.column('experience'))
+        self._ratings = GrowableArray(freelancers.column('rating'))
+
+        # Skill vocabulary with its similarity table and inverted index
+        self.skill_index = skill_index or SkillIndex.build(freelancers)
+
+        # One TF-IDF fit over the freelancer profiles, shared with the content model
+        self.profile_index = profile_index or ProfileIndex.build(freelancers)
 
         # Models
-        self.content_model = ContentBasedModel()
+        self.content_model = ContentBasedModel(self.profile_index)
         self.collaborative_model = collaborative_model
 
-        # Precompute TF-IDF vectors for freelancers
-        self.tfidf_vectorizer = TfidfVectorizer(stop_words='english')
-        self.tfidf_matrix = self.tfidf_vectorizer.fit_transform(
-            [freelancer.profile_text() for freelancer in freelancers]
-        )
+        # Incremental update state. Upserts change rows in place and removals build a new
+        # store, so a row of an earlier scoring pass never points at another freelancer.
+        self.rebuild_threshold = rebuild_threshold
+        self.pool_version = 0
+        self._lock = threading.RLock()
+        # Computed by pool_digest() on first use and patched by every update after that
+        self._pool_digest: Optional[int] = None
+        self._drifted_changes = 0
+        self._pending_changes: Optional[List[tuple]] = None
+        self._rebuild_thread: Optional[threading.Thread] = None
+        # Built on first use and patched by every update
+        self._constraint_index: Optional[ConstraintIndex] = None
+
+    @property
+    def experience(self) -> np.ndarray:
+        return self._experience.view()
+
+    @property
+    def ratings(self) -> np.ndarray:
+        return self._ratings.view()
+
+    @property
+    def tfidf_vectorizer(self) -> 'TfidfVectorizer':
+        return self.profile_index.vectorizer
+
+    @property
+    def tfidf_matrix(self):
+        return self.profile_index.matrix
 
     @staticmethod
     def similar(a: str, b: str) -> float:
@@ -321,22 +1905,29 @@ class MatchingEngine:
         Refine skill matching to account for partial matches.
         Returns the number of overlapping or similar skills.
         """
-        overlap_count = sum(
-            1 for req_skill in required_skills
-            for freelancer_skill in freelancer_skills
-            if self.similar(req_skill, freelancer_skill) > 0.7
-        )
-        return overlap_count
+        return self.skill_index.count_overlap(required_skills, freelancer_skills)
+
+    def skill_cache_stats(self) -> Dict[str, int]:
+        """
+        Hit/miss counters of the skill similarity cache.
+        """
+        return self.skill_index.similarity_cache.stats()
 
     def train_models(self):
         """
         Train both content-based and collaborative models.
         """
-        # Train Content-Based Model
-        self.content_model.train(self.freelancers)
+        # Content-Based Model shares the profile index fitted at construction
+        if self.content_model.profile_index is None:
+            self.content_model.train(self.freelancers)
 
-        # Simulate historical project data for Collaborative Filtering
-        simulated_project_data = [
+        self.collaborative_model.train(self._simulated_project_data(), self.freelancers)
+
+    def _simulated_project_data(self) -> List[Dict]:
+        """
+        Simulate historical project data for Collaborative Filtering.
+        """
+        return [
             {
                 "id": project.id,
                 "description": project.description,
@@ -346,54 +1937,509 @@ class MatchingEngine:
             }
             for project in self.projects
         ]
-        self.collaborative_model.train(simulated_project_data, self.freelancers)
 
-    def match_freelancers(self, project: Project, weights: Dict[str, float] = None) -> List[Dict]:
-        """
-        Match freelancers to a given project using a hybrid approach.
-        """
+    @staticmethod
+    def _normalize_weights(weights: Optional[Dict[str, float]]) -> Dict[str, float]:
         weights = weights or {'content': 0.3, 'collaborative': 0.4, 'experience': 0.2, 'rating': 0.1}
         weight_sum = sum(weights.values())
         if weight_sum > 1.0:
             logger.warning("Weights sum exceeds 1.0, normalizing weights.")
             weights = {k: v / weight_sum for k, v in weights.items()}
+        return weights
+
+    def candidate_rows(
+        self,
+        budget_range: Optional[tuple] = None,
+        require_available: bool = False,
+        required_skills: Optional[List[str]] = None,
+        min_overlap: int = 0
+    ) -> np.ndarray:
+        """
+        Rows that satisfy hard constraints, found without scoring anyone.
+
+        Args:
+            budget_range (tuple, optional): Inclusive (min, max) hourly rate.
+            require_available (bool, optional): Keep only freelancers whose availability flag is set.
+            required_skills (List[str], optional): Skills to count overlap against.
+            min_overlap (int, optional): Minimum skill overlap with required_skills.
+
+        Returns:
+            np.ndarray: Matching rows in ascending order.
+        """
+        with self._lock, metrics.timer('constraints'):
+            if self._constraint_index is None:
+                self._constraint_index = ConstraintIndex(self.freelancers)
+            rows = self._constraint_index.candidates(budget_range, require_available)
+            if required_skills is not None and min_overlap > 0:
+                overlap = self.skill_index.overlap_counts(required_skills)
+                passed = rows[overlap[rows] >= min_overlap]
+                metrics.increment('filtered_overlap', len(rows) - len(passed))
+                rows = passed
+            return rows
+
+    def retrieve_candidates(
+        self,
+        project: Project,
+        n_candidates: int = 2000,
+        depth: Optional[int] = None,
+        rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        First retrieval stage: rows whose profiles share the most weight with the project description.
+
+        The hybrid scorer then re-ranks only these rows (pass them as rows= to
+        match_freelancers or iter_matches). Freelancers sharing no term with
+        the description are never retrieved.
+
+        Args:
+            project (Project): The project to retrieve for.
+            n_candidates (int, optional): Number of rows to keep. Defaults to 2000.
+            depth (int, optional): Postings read per query term; lower is faster and less exact.
+            rows (np.ndarray, optional): Sorted rows to restrict retrieval to, e.g. from candidate_rows().
+
+        Returns:
+            np.ndarray: Candidate rows in ascending order.
+        """
+        with metrics.timer('retrieval'):
+            project_tfidf = self.profile_index.transform([project.description])
+            with self._lock:
+                return self.profile_index.search(project_tfidf, n_candidates, depth, rows)
+
+    def score_freelancers(self, project: Project, weights: Dict[str, float] = None, rows: Optional[np.ndarray] = None) -> Dict:
+        """
+        Score every freelancer for a project in one vectorized pass.
+
+        Args:
+            project (Project): The project to score against.
+            weights (Dict[str, float], optional): Hybrid weights; defaults to the engine weights.
+            rows (np.ndarray, optional): Ascending candidate rows; only these are scored.
+
+        Returns:
+            Dict: Arrays keyed by 'combined', 'content', 'collaborative' and
+            'skill_overlap', aligned with 'rows' (None for the whole pool) of the
+            freelancer store under 'freelancers'.
+        """
+        weights = self._normalize_weights(weights)
+
+        # Extract required skills
+        with metrics.timer('skill_extraction'):
+            project_skills = self.skill_extractor.extract_skills(project.description)
+
+        # Hold the lock so incremental updates cannot interleave with one scoring pass
+        with self._lock:
+            # Calculate TF-IDF vector for the project description
+            with metrics.timer('tfidf_transform'):
+                project_tfidf = self.profile_index.transform([project.description])
+
+            with metrics.timer('content_similarity'):
+                content_scores = np.asarray(self.content_model.predict(project_tfidf, rows), dtype=float)
+            with metrics.timer('collaborative_scoring'):
+                collaborative_scores = np.asarray(
+                    self.collaborative_model.predict(project.description, project_skills), dtype=float
+                )
+
+            with metrics.timer('skill_overlap'):
+                skill_overlap = self.skill_index.overlap_counts(project_skills)
+            experience, ratings = self.experience, self.ratings
+            if rows is not None:
+                collaborative_scores = collaborative_scores[rows]
+                skill_overlap = skill_overlap[rows]
+                experience, ratings = experience[rows], ratings[rows]
+            skill_match_scores = skill_overlap / len(project_skills) if project_skills else np.zeros(len(skill_overlap))
+
+            # Same term order as the per-freelancer loop so both modes agree exactly
+            with metrics.timer('combine'):
+                combined_scores = (
+                    weights['content'] * content_scores
+                    + weights['collaborative'] * collaborative_scores
+                    + weights['experience'] * (experience / 10)
+                    + weights['rating'] * (ratings / 5)
+                    + 0.2 * skill_match_scores  # Boost for skill overlap
+                )
+            metrics.increment('candidates_scored', len(combined_scores))
+            return {
+                'combined': combined_scores,
+                'content': content_scores,
+                'collaborative': collaborative_scores,
+                'skill_overlap': skill_overlap,
+                'rows': rows,
+                'freelancers': self.freelancers,
+            }
+
+    def score_top_candidates(
+        self,
+        project: Project,
+        top_n: int,
+        weights: Dict[str, float] = None,
+        rows: Optional[np.ndarray] = None,
+        block_size: int = 1024,
+        project_skills: Optional[List[str]] = None,
+        project_tfidf=None
+    ) -> Dict:
+        """
+        Score only the rows that can still reach the top_n (threshold-pruned top-k).
+
+        Every term except content similarity is cheap and computed for all rows
+        up front. Cosine similarity is at most 1, so the cheap terms plus the
+        content weight bound each row's combined score from above. Rows are
+        scored in blocks of descending bound, and scoring stops once the next
+        bound is below the top_n-th best score found so far. A row that was never
+        scored could at best tie that score, and only with a higher bound than
+        every scored row, so the top_n equals that of score_freelancers, ties
+        included.
+
+        Args:
+            project (Project): The project to score against.
+            top_n (int): Number of best rows that must be exact.
+            weights (Dict[str, float], optional): Hybrid weights; defaults to the engine weights.
+            rows (np.ndarray, optional): Ascending candidate rows; only these are considered.
+            block_size (int, optional): Rows scored per step. Defaults to 1024.
+            project_skills (List[str], optional): Skills already extracted from the description.
+            project_tfidf (optional): Description already transformed with this engine's vocabulary.
+
+        Returns:
+            Dict: The score_freelancers arrays for the scored rows only, in ascending
+            row order; its top_n rows are the exhaustive top_n.
+        """
+        weights = self._normalize_weights(weights)
+
+        if project_skills is None:
+            with metrics.timer('skill_extraction'):
+                project_skills = self.skill_extractor.extract_skills(project.description)
+
+        with self._lock:
+            if project_tfidf is None:
+                with metrics.timer('tfidf_transform'):
+                    project_tfidf = self.profile_index.transform([project.description])
+            with metrics.timer('collaborative_scoring'):
+                collaborative_scores = np.asarray(
+                    self.collaborative_model.predict(project.description, project_skills), dtype=float
+                )
+            with metrics.timer('skill_overlap'):
+                skill_overlap = self.skill_index.overlap_counts(project_skills)
+            experience, ratings = self.experience, self.ratings
+            if rows is not None:
+                collaborative_scores = collaborative_scores[rows]
+                skill_overlap = skill_overlap[rows]
+                experience, ratings = experience[rows], ratings[rows]
+            skill_match_scores = skill_overlap / len(project_skills) if project_skills else np.zeros(len(skill_overlap))
+
+            # Everything but content, plus its largest contribution. The margin absorbs
+            # rounding from adding the terms in a different order than combine does.
+            bounds = (
+                weights['collaborative'] * collaborative_scores
+                + weights['experience'] * (experience / 10)
+                + weights['rating'] * (ratings / 5)
+                + 0.2 * skill_match_scores
+                + max(weights['content'], 0.0)
+                + 1e-9
+            )
+
+            def combine(positions: np.ndarray) -> tuple:
+                content = np.asarray(
+                    self.content_model.predict(project_tfidf, positions if rows is None else rows[positions]),
+                    dtype=float
+                )
+                # Same term order as score_freelancers so scores agree exactly
+                combined = (
+                    weights['content'] * content
+                    + weights['collaborative'] * collaborative_scores[positions]
+                    + weights['experience'] * (experience[positions] / 10)
+                    + weights['rating'] * (ratings[positions] / 5)
+                    + 0.2 * skill_match_scores[positions]
+                )
+                return content, combined
+
+            num_rows = len(bounds)
+            block_size = max(block_size, top_n)
+            with metrics.timer('content_similarity'):
+                if top_n <= 0 or num_rows <= block_size:
+                    scored = np.arange(num_rows) if top_n > 0 else np.empty(0, dtype=np.intp)
+                    blocks = [combine(scored)]
+                else:
+                    # First block: the highest bounds, found without sorting the pool
+                    scored_blocks = [np.argpartition(-bounds, block_size - 1)[:block_size]]
+                    blocks = [combine(scored_blocks[0])]
+                    best = np.partition(blocks[0][1], len(blocks[0][1]) - top_n)[-top_n:]
+                    threshold = best.min()
+
+                    unscored = np.ones(num_rows, dtype=bool)
+                    unscored[scored_blocks[0]] = False
+                    remaining = np.flatnonzero(unscored & (bounds >= threshold))
+                    remaining = remaining[np.argsort(-bounds[remaining], kind='stable')]
+                    for start in range(0, len(remaining), block_size):
+                        block = remaining[start:start + block_size]
+                        block = block[bounds[block] >= threshold]
+                        if len(block) == 0:
+                            break
+                        scored_blocks.append(block)
+                        blocks.append(combine(block))
+                        candidates = np.concatenate((best, blocks[-1][1]))
+                        best = np.partition(candidates, len(candidates) - top_n)[-top_n:]
+                        threshold = best.min()
+                    scored = np.concatenate(scored_blocks)
+
+            content_scores = np.concatenate([content for content, _ in blocks])
+            combined_scores = np.concatenate([combined for _, combined in blocks])
+            metrics.increment('candidates_scored', len(scored))
+            metrics.increment('candidates_pruned', num_rows - len(scored))
+
+            # Ascending row order, so selection breaks ties by row as the exhaustive scorer does
+            order = np.argsort(scored, kind='stable')
+            scored = scored[order]
+            return {
+                'combined': combined_scores[order],
+                'content': content_scores[order],
+                'collaborative': collaborative_scores[scored],
+                'skill_overlap': skill_overlap[scored],
+                'rows': scored if rows is None else rows[scored],
+                'freelancers': self.freelancers,
+            }
+
+    @staticmethod
+    def _top_indices(scores: np.ndarray, top_n: Optional[int]) -> np.ndarray:
+        """
+        Indices of the top_n highest scores, best first.
+
+        Uses a linear-time partial selection instead of sorting the whole pool.
+        Ties are broken by row order, so the result equals the first top_n rows
+        of a stable descending sort.
+        """
+        num_scores = len(scores)
+        if top_n is None or top_n >= num_scores:
+            return np.argsort(-scores, kind='stable')
+        if top_n <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        # Value of the top_n-th best score; every row at or above it is a candidate
+        threshold = np.partition(scores, num_scores - top_n)[num_scores - top_n]
+        candidates = np.flatnonzero(scores >= threshold)
+        order = np.argsort(-scores[candidates], kind='stable')
+        return candidates[order[:top_n]]
+
+    def _build_matches(self, scores: Dict, indices) -> List[Dict]:
+        """
+        Materialize match dicts for the given freelancer rows only.
+        """
+        freelancers, rows = scores['freelancers'], scores['rows']
+        return [
+            {
+                'freelancer': freelancers[idx if rows is None else rows[idx]],
+                'combined_score': float(scores['combined'][idx]),
+                'content_score': float(scores['content'][idx]),
+                'collaborative_score': float(scores['collaborative'][idx]),
+                'skill_overlap': int(scores['skill_overlap'][idx]),
+            }
+            for idx in indices
+        ]
+
+    def match_freelancers(
+        self,
+        project: Project,
+        weights: Dict[str, float] = None,
+        top_n: Optional[int] = None,
+        rows: Optional[np.ndarray] = None
+    ) -> List[Dict]:
+        """
+        Match freelancers to a given project using a hybrid approach.
+
+        Args:
+            project (Project): The project to match.
+            weights (Dict[str, float], optional): Hybrid weights.
+            top_n (int, optional): Only build and return this many matches. Defaults to all.
+            rows (np.ndarray, optional): Ascending candidate rows, e.g. from candidate_rows().
+                Vectorized mode only scores these.
+        """
+        if self.vectorized or rows is not None:
+            if self.prune and top_n is not None:
+                scores = self.score_top_candidates(project, top_n, weights, rows)
+            else:
+                scores = self.score_freelancers(project, weights, rows)
+            with metrics.timer('selection'):
+                indices = self._top_indices(scores['combined'], top_n)
+            return self._build_matches(scores, indices)
+
+        weights = self._normalize_weights(weights)
 
         # Extract required skills
-        project_skills = self.skill_extractor.extract_skills(project.description)
+        with metrics.timer('skill_extraction'):
+            project_skills = self.skill_extractor.extract_skills(project.description)
 
         # Calculate TF-IDF vector for the project description
-        project_tfidf = self.tfidf_vectorizer.transform([project.description])
+        with metrics.timer('tfidf_transform'):
+            project_tfidf = self.profile_index.transform([project.description])
 
         # Compute Content-Based Scores
-        content_scores = self.content_model.predict(project_tfidf)
+        with metrics.timer('content_similarity'):
+            content_scores = self.content_model.predict(project_tfidf)
 
         # Compute Collaborative Scores
-        collaborative_scores = self.collaborative_model.predict(project.description, project_skills)
+        with metrics.timer('collaborative_scoring'):
+            collaborative_scores = self.collaborative_model.predict(project.description, project_skills)
 
         # Combine Scores with boosted weight for skill overlap
         final_scores = []
-        for idx, freelancer in enumerate(self.freelancers):
-            # Use refined skill matching logic
-            skill_overlap_count = self.refine_skill_matching(project_skills, freelancer.skills)
-            skill_match_score = skill_overlap_count / len(project_skills) if project_skills else 0
-
-            combined_score = (
-                weights['content'] * content_scores[idx]
-                + weights['collaborative'] * collaborative_scores[idx]
-                + weights['experience'] * (freelancer.experience / 10)
-                + weights['rating'] * (freelancer.rating / 5)
-                + 0.2 * skill_match_score  # Boost for skill overlap
-            )
-            final_scores.append({
-                'freelancer': freelancer,
-                'combined_score': combined_score,
-                'content_score': content_scores[idx],
-                'collaborative_score': collaborative_scores[idx],
-                'skill_overlap': skill_overlap_count,
-            })
+        with metrics.timer('skill_overlap'):
+            for idx, freelancer in enumerate(self.freelancers):
+                # Use refined skill matching logic
+                skill_overlap_count = self.refine_skill_matching(project_skills, freelancer.skills)
+                skill_match_score = skill_overlap_count / len(project_skills) if project_skills else 0
+
+                combined_score = (
+                    weights['content'] * content_scores[idx]
+                    + weights['collaborative'] * collaborative_scores[idx]
+                    + weights['experience'] * (freelancer.experience / 10)
+                    + weights['rating'] * (freelancer.rating / 5)
+                    + 0.2 * skill_match_score  # Boost for skill overlap
+                )
+                final_scores.append({
+                    'freelancer': freelancer,
+                    'combined_score': combined_score,
+                    'content_score': content_scores[idx],
+                    'collaborative_score': collaborative_scores[idx],
+                    'skill_overlap': skill_overlap_count,
+                })
+        metrics.increment('candidates_scored', len(final_scores))
 
         # Sort and return top matches
-        return sorted(final_scores, key=lambda x: x['combined_score'], reverse=True)
+        with metrics.timer('selection'):
+            final_scores.sort(key=lambda x: x['combined_score'], reverse=True)
+        return final_scores[:top_n]
+
+    def match_projects(
+        self,
+        projects: List[Project],
+        top_n: int = 5,
+        weights: Dict[str, float] = None,
+        block_size: Optional[int] = None,
+        workers: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """
+        Match many projects at once; the batch counterpart of match_freelancers.
+
+        Skills are extracted in one batch and all descriptions are transformed
+        in one call. Projects are then scored in blocks, with one sparse product
+        per block for content similarity and one for skill overlap. Memory
+        stays bounded by block_size x pool size however many projects there
+        are. Each result equals match_freelancers(project, weights, top_n).
+
+        Args:
+            projects (List[Project]): Projects to match.
+            top_n (int, optional): Matches returned per project. Defaults to 5.
+            weights (Dict[str, float], optional): Hybrid weights.
+            block_size (int, optional): Projects scored together; defaults to about four million scores per block.
+            workers (int, optional): Processes for skill extraction and threads for scoring blocks.
+                The sparse and dense kernels release the GIL. Defaults to inline.
+
+        Returns:
+            List[List[Dict]]: Top matches of every project, in input order.
+        """
+        if not projects:
+            return []
+        weights = self._normalize_weights(weights)
+        workers = workers or 1
+
+        descriptions = [project.description for project in projects]
+        extract_batch = getattr(self.skill_extractor, 'extract_skills_batch', None)
+        with metrics.timer('skill_extraction'):
+            if extract_batch is not None:
+                project_skills = list(extract_batch(descriptions, workers=workers))
+            else:
+                project_skills = [self.skill_extractor.extract_skills(description) for description in descriptions]
+
+        # One consistent pool for the whole batch; readers in the worker threads rely on it
+        with self._lock:
+            with metrics.timer('tfidf_transform'):
+                projects_tfidf = self.profile_index.transform(descriptions)
+            if block_size is None:
+                block_size = max(1, (1 << 22) // max(len(self.freelancers), 1))
+            blocks = [slice(start, start + block_size) for start in range(0, len(projects), block_size)]
+
+            def match_block(block: slice) -> List[List[Dict]]:
+                return self._match_block(descriptions[block], project_skills[block], projects_tfidf[block], weights, top_n)
+
+            if workers > 1 and len(blocks) > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(match_block, blocks))
+            else:
+                results = [match_block(block) for block in blocks]
+        return [matches for block_matches in results for matches in block_matches]
+
+    def _match_block(
+        self,
+        descriptions: List[str],
+        project_skills: List[List[str]],
+        projects_tfidf,
+        weights: Dict[str, float],
+        top_n: int
+    ) -> List[List[Dict]]:
+        with metrics.timer('content_similarity'):
+            content_scores = np.asarray(self.content_model.predict_batch(projects_tfidf), dtype=float)
+        with metrics.timer('collaborative_scoring'):
+            collaborative_scores = np.asarray(
+                self.collaborative_model.predict_batch(descriptions, project_skills), dtype=float
+            )
+        with metrics.timer('skill_overlap'):
+            skill_overlap = self.skill_index.overlap_counts_batch(project_skills)
+        num_skills = np.array([len(skills) for skills in project_skills])[:, None]
+        skill_match_scores = np.divide(
+            skill_overlap, num_skills, out=np.zeros(skill_overlap.shape), where=num_skills > 0
+        )
+
+        # Same term order as score_freelancers, row by row
+        with metrics.timer('combine'):
+            combined_scores = (
+                weights['content'] * content_scores
+                + weights['collaborative'] * collaborative_scores
+                + weights['experience'] * (self.experience / 10)
+                + weights['rating'] * (self.ratings / 5)
+                + 0.2 * skill_match_scores  # Boost for skill overlap
+            )
+        metrics.increment('candidates_scored', combined_scores.size)
+        block_matches = []
+        for project in range(len(descriptions)):
+            scores = {
+                'combined': combined_scores[project],
+                'content': content_scores[project],
+                'collaborative': collaborative_scores[project],
+                'skill_overlap': skill_overlap[project],
+                'rows': None,
+                'freelancers': self.freelancers,
+            }
+            with metrics.timer('selection'):
+                indices = self._top_indices(scores['combined'], top_n)
+            block_matches.append(self._build_matches(scores, indices))
+        return block_matches
+
+    def iter_matches(
+        self,
+        project: Project,
+        weights: Dict[str, float] = None,
+        batch_size: int = 32,
+        rows: Optional[np.ndarray] = None
+    ) -> Iterator[Dict]:
+        """
+        Yield matches best first, selecting more candidates only as they are consumed.
+
+        The pool is scored once; each refill selects twice as many rows as the
+        previous one, so a consumer that stops early never pays for a full sort.
+
+        Args:
+            project (Project): The project to match.
+            weights (Dict[str, float], optional): Hybrid weights.
+            batch_size (int, optional): Number of candidates selected on the first pull. Defaults to 32.
+            rows (np.ndarray, optional): Ascending candidate rows; only these are scored.
+        """
+        scores = self.score_freelancers(project, weights, rows)
+        num_freelancers = len(scores['combined'])
+        emitted = 0
+        limit = max(1, batch_size)
+        while emitted < num_freelancers:
+            with metrics.timer('selection'):
+                indices = self._top_indices(scores['combined'], limit)
+            yield from self._build_matches(scores, indices[emitted:])
+            emitted = len(indices)
+            limit *= 2
 
     def get_top_matches(self, project: Project, top_n: int = 5) -> List[Dict]:
         """
@@ -406,9 +2452,171 @@ class MatchingEngine:
         Returns:
             List[Dict]: A list of top N freelancers.
         """
-        all_matches = self.match_freelancers(project)
-        return all_matches[:top_n]
+        return self.match_freelancers(project, top_n=top_n)
+
+
+    def upsert_freelancer(self, freelancer: Freelancer):
+        """
+        Add a freelancer, or replace the one with the same id, without retraining.
+
+        TF-IDF rows use the fixed vocabulary and collaborative features use the
+        normalization statistics of the last full build. Changes those cannot
+        represent exactly (unknown terms, values outside the stored range) add
+        to drift(), and crossing rebuild_threshold schedules a background rebuild.
+        """
+        with self._lock:
+            if self._pending_changes is not None:
+                self._pending_changes.append(('upsert', freelancer))
+
+            row = self.freelancers.row_of(freelancer.id)
+            if row is None:
+                row = len(self.freelancers)
+            else:
+                self._update_digest(self.freelancers[row], -1)
+            self._experience.set(row, freelancer.experience)
+            self._ratings.set(row, freelancer.rating)
+
+            self.profile_index.set_row(row, freelancer.profile_text())
+            self.skill_index.set_row(row, freelancer.skills)
+            drifted = self.profile_index.unknown_terms(freelancer.profile_text()) > 0
+            if self.collaborative_model is not None:
+                self.collaborative_model.set_row(row, freelancer)
+                drifted = drifted or not self.collaborative_model.in_range(freelancer)
+            if self._constraint_index is not None:
+                self._constraint_index.set_row(row, freelancer)
+
+            # Last, so the row only becomes visible once every index covers it
+            self.freelancers.set_row(row, freelancer)
+            # Digested as stored, so the digest matches one computed from the store
+            self._update_digest(self.freelancers[row], 1)
+            self._record_change(drifted)
+
+    def remove_freelancer(self, freelancer_id: str) -> bool:
+        """
+        Remove a freelancer from the pool without retraining.
+
+        Returns:
+            bool: False if no freelancer has this id.
+        """
+        with self._lock:
+            row = self.freelancers.row_of(freelancer_id)
+            if row is None:
+                return False
+            if self._pending_changes is not None:
+                self._pending_changes.append(('remove', freelancer_id))
+
+            removed = self.freelancers[row]
+            self._update_digest(removed, -1)
+            freelancers = self.freelancers.delete_row(row)
+            self._experience = GrowableArray(np.delete(self.experience, row))
+            self._ratings = GrowableArray(np.delete(self.ratings, row))
+            self.profile_index.delete_row(row)
+            self.skill_index.delete_row(row)
+            # Dropping the smallest or largest value leaves the normalization range too wide
+            drifted = False
+            if self.collaborative_model is not None:
+                self.collaborative_model.delete_row(row)
+                self.collaborative_model.freelancer_data = freelancers
+                drifted = self.collaborative_model.sales_min is not None and removed.total_sales in (
+                    self.collaborative_model.sales_min, self.collaborative_model.sales_max
+                )
+
+            self.freelancers = freelancers
+            if self._constraint_index is not None:
+                self._constraint_index.delete_row(row)
+            self._record_change(drifted)
+            return True
+
+    def drift(self) -> float:
+        """
+        Share of the pool changed in ways the fixed vocabulary or statistics do not cover.
+        """
+        return self._drifted_changes / max(len(self.freelancers), 1)
 
+    def pool_digest(self) -> str:
+        """
+        Content hash of the freelancer pool.
+
+        Unlike pool_version, which counts the changes made in this process, it
+        is equal in every process serving the same freelancers, whatever their
+        row order or update history.
+        """
+        with self._lock:
+            if self._pool_digest is None:
+                self._pool_digest = sum(map(_freelancer_digest, self.freelancers)) % _DIGEST_MODULUS
+            return f"{self._pool_digest:032x}"
+
+    def _update_digest(self, freelancer: Freelancer, sign: int):
+        if self._pool_digest is not None:
+            self._pool_digest = (self._pool_digest + sign * _freelancer_digest(freelancer)) % _DIGEST_MODULUS
+
+    def _record_change(self, drifted: bool):
+        self.pool_version += 1
+        if drifted:
+            self._drifted_changes += 1
+        if self.drift() > self.rebuild_threshold:
+            self.schedule_rebuild()
+
+    def schedule_rebuild(self) -> bool:
+        """
+        Start a full rebuild in a background thread unless one is already running.
+        """
+        with self._lock:
+            if self._rebuild_thread is not None and self._rebuild_thread.is_alive():
+                return False
+            self._rebuild_thread = threading.Thread(target=self.rebuild, name='matching-engine-rebuild', daemon=True)
+            self._rebuild_thread.start()
+            return True
+
+    def rebuild(self):
+        """
+        Refit every component from the current pool and swap the result in.
+
+        Updates that arrive while the rebuild runs are replayed on top of it.
+        """
+        with self._lock:
+            # Upserts change the live store in place, so the rebuild works on a copy
+            freelancers = self.freelancers.copy()
+            self._pending_changes = []
+        logger.info(f"Rebuilding matching engine for {len(freelancers)} freelancers (drift {self.drift():.3f})")
+
+        try:
+            profile_index = ProfileIndex.build(freelancers)
+            skill_index = SkillIndex.build(
+                freelancers,
+                threshold=self.skill_index.threshold,
+                cache_size=self.skill_index.similarity_cache.maxsize,
+            )
+            collaborative_model = None
+            if self.collaborative_model is not None:
+                collaborative_model = copy.copy(self.collaborative_model)
+                collaborative_model.train(self._simulated_project_data(), freelancers)
+        except Exception:
+            with self._lock:
+                self._pending_changes = None
+            raise
+
+        with self._lock:
+            pending, self._pending_changes = self._pending_changes, None
+            self.freelancers = freelancers
+            self._experience = GrowableArray(freelancers.column('experience'))
+            self._ratings = GrowableArray(freelancers.column('rating'))
+            self.profile_index = profile_index
+            self.content_model.profile_index = profile_index
+            self.skill_index = skill_index
+            self.collaborative_model = collaborative_model
+            self._constraint_index = None
+            self._drifted_changes = 0
+            self.pool_version += 1
+
+            # The digest already covers the replayed changes
+            digest = self._pool_digest
+            for operation, argument in pending:
+                if operation == 'upsert':
+                    self.upsert_freelancer(argument)
+                else:
+                    self.remove_freelancer(argument)
+            self._pool_digest = digest
 
     def interview_and_evaluate(self, freelancer: Freelancer, project: Project):
         print(f"\n\n Starting interview with {freelancer.username} for project {project.id}...")
@@ -469,44 +2677,156 @@ class MatchingEngine:
     def hire_freelancer(self, freelancer: Freelancer):
         print(f"Notification: {freelancer.username} has been hired!")
 
-def normalize_csv(file_path: str, csv_columns: Optional[Dict[str, str]] = None) -> List[Freelancer]:
+DEFAULT_CSV_COLUMNS = {
+    'id': 'id',
+    'username': 'username',
+    'name': 'name',
+    'job_title': 'job_title',
+    'skills': 'skills',
+    'experience': 'experience',
+    'rating': 'rating',
+    'hourly_rate': 'hourly_rate',
+    'profile_url': 'profile_url',
+    'availability': 'availability',
+    'total_sales': 'total_sales'
+}
+
+# Freelancer fields read as text, and numeric fields with the type they are converted to
+CSV_TEXT_FIELDS = ['id', 'username', 'name', 'job_title', 'skills', 'profile_url', 'availability']
+CSV_NUMERIC_FIELDS = {'experience': int, 'rating': float, 'hourly_rate': float, 'total_sales': int}
+
+
+def _columns_from_frame(df, csv_columns: Dict[str, str]) -> Dict[str, list]:
+    """
+    Convert and validate one block of CSV rows column by column.
+
+    Rows with a missing skills list or a value that cannot be converted are
+    skipped; a missing numeric column defaults to 0.
+    """
     import pandas as pd
-    df = pd.read_csv(file_path)
-    csv_columns = csv_columns or {
-        'id': 'id',
-        'username': 'username',
-        'name': 'name',
-        'job_title': 'job_title',
-        'skills': 'skills',
-        'experience': 'experience',
-        'rating': 'rating',
-        'hourly_rate': 'hourly_rate',
-        'profile_url': 'profile_url',
-        'availability': 'availability',
-        'total_sales': 'total_sales'
-    }
 
+    valid = np.ones(len(df), dtype=bool)
+    columns = {}
+    for field, field_type in CSV_NUMERIC_FIELDS.items():
+        column = csv_columns.get(field)
+        if column not in df.columns:
+            columns[field] = np.zeros(len(df), dtype=np.int64 if field_type is int else float)
+            continue
+        raw = df[column]
+        values = pd.to_numeric(raw, errors='coerce')
+        if field_type is int:
+            valid &= values.notna().to_numpy()
+            columns[field] = np.trunc(values.fillna(0).to_numpy(dtype=float)).astype(np.int64)
+        else:
+            # Blank floats stay NaN; only unparsable text invalidates the row
+            valid &= (values.notna() | raw.isna()).to_numpy()
+            columns[field] = values.to_numpy(dtype=float)
+
+    skills = df[csv_columns['skills']]
+    valid &= skills.notna().to_numpy()
+    columns['skills'] = skills.str.split(',')
+
+    availability = df[csv_columns['availability']]
+    columns['availability'] = availability.fillna('').str.strip().str.lower().isin(['true', '1', 'yes']).to_numpy()
+
+    for field in ('id', 'username', 'name', 'job_title', 'profile_url'):
+        columns[field] = df[csv_columns[field]]
+
+    skipped = len(df) - int(valid.sum())
+    if skipped:
+        logger.warning(f"Skipping {skipped} rows with missing skills or invalid numeric values")
+
+    # Series and arrays both accept the boolean mask; tolist() yields plain Python values
+    return {field: columns[field][valid].tolist() for field in Freelancer.__dataclass_fields__}
+
+
+def _read_csv_columns(file_path: str, csv_columns: Dict[str, str], chunksize: Optional[int] = None):
+    """
+    Read only the mapped columns, all as text, optionally in chunks.
+    """
+    import pandas as pd
+
+    wanted = set(csv_columns.values())
+    return pd.read_csv(
+        file_path,
+        usecols=lambda column: column in wanted,
+        dtype=str,
+        keep_default_na=True,
+        chunksize=chunksize,
+    )
+
+
+def _iter_csv_blocks(
+    file_path: str,
+    csv_columns: Optional[Dict[str, str]],
+    chunksize: int
+) -> Iterator[Dict[str, list]]:
+    """
+    Validated freelancer columns for each block of at most chunksize rows.
+    """
+    csv_columns = csv_columns or DEFAULT_CSV_COLUMNS
+    for chunk in _read_csv_columns(file_path, csv_columns, chunksize=chunksize):
+        missing = [field for field in CSV_TEXT_FIELDS if csv_columns.get(field) not in chunk.columns]
+        if missing:
+            logger.warning(f"Skipping all rows: columns missing from {file_path}: {missing}")
+            return
+        yield _columns_from_frame(chunk, csv_columns)
+
+
+def iter_normalized_csv(
+    file_path: str,
+    csv_columns: Optional[Dict[str, str]] = None,
+    chunksize: int = 100_000
+) -> Iterator[List[Freelancer]]:
+    """
+    Stream freelancers from a CSV in blocks of at most chunksize rows.
+
+    Only one block of raw rows is held in memory at a time, so very large
+    exports can be fed into the engine with bounded memory.
+    """
+    for block in _iter_csv_blocks(file_path, csv_columns, chunksize):
+        yield [Freelancer(*row) for row in zip(*(block[field] for field in Freelancer.__dataclass_fields__))]
+
+
+def normalize_csv(
+    file_path: str,
+    csv_columns: Optional[Dict[str, str]] = None,
+    chunksize: Optional[int] = None
+) -> List[Freelancer]:
+    """
+    Load freelancers from a CSV, converting whole columns at once.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        csv_columns (Dict[str, str], optional): Freelancer field -> CSV column mapping.
+        chunksize (int, optional): Read the file in blocks of this many rows to bound memory.
+
+    Returns:
+        List[Freelancer]: Normalized freelancers; invalid rows are skipped.
+    """
     freelancers = []
-    for _, row in df.iterrows():
-        try:
-            freelancer = Freelancer(
-                id=row[csv_columns['id']],
-                username=row[csv_columns['username']],
-                name=row[csv_columns['name']],
-                job_title=row[csv_columns['job_title']],
-                skills=row[csv_columns['skills']].split(','),
-                experience=int(row.get(csv_columns['experience'], 0)),
-                rating=float(row.get(csv_columns['rating'], 0)),
-                hourly_rate=float(row.get(csv_columns['hourly_rate'], 0)),
-                profile_url=row[csv_columns['profile_url']],
-                availability=row[csv_columns['availability']],
-                total_sales=int(row.get(csv_columns['total_sales'], 0))
-            )
-            freelancers.append(freelancer)
-        except Exception as e:
-            logger.warning(f"Skipping row due to error: {e}")
+    for block in iter_normalized_csv(file_path, csv_columns, chunksize=chunksize or 1_000_000):
+        freelancers.extend(block)
     return freelancers
 
+def launch_client_terminal(*client_args: str):
+    """
+    Open a new terminal running the freelancer client (freelancer.py) with the given arguments.
+    """
+    try:
+        client_command = [sys.executable, "freelancer.py", *client_args]
+
+        # Automatically open a new terminal with the argument
+        if os.name == 'nt':  # Windows
+            subprocess.Popen(["start", "cmd", "/k"] + client_command, shell=True)
+        else:  # macOS/Linux
+            subprocess.Popen(["gnome-terminal", "--"] + client_command)
+
+        print("Client terminal started successfully.")
+    except Exception as e:
+        print(f"Error starting client in a new terminal: {e}")
+
+
 class Server:
     def __init__(self, host='127.0.0.1', port=65432):
         self.host = host
@@ -548,18 +2868,7 @@ class Server:
                 return None
 
     def start_client_in_new_terminal(self):
-        try:
-            client_command = [sys.executable, "freelancer.py", self.host, str(self.port)]
-
-            # Automatically open a new terminal with the argument
-            if os.name == 'nt':  # Windows
-                subprocess.Popen(["start", "cmd", "/k"] + client_command, shell=True)
-            else:  # macOS/Linux
-                subprocess.Popen(["gnome-terminal", "--"] + client_command)
-
-            print("Client terminal started successfully.")
-        except Exception as e:
-            print(f"Error starting client in a new terminal: {e}")
+        launch_client_terminal(self.host, str(self.port))
 
 
     def send_message(self, message, is_server=True):
@@ -570,7 +2879,7 @@ class Server:
         try:
             socket_to_use = self.connection if is_server else self.client_socket
             if socket_to_use:
-                socket_to_use.send(message.encode('utf-8'))
+                send_frame(socket_to_use, message.encode('utf-8'))
                 return True
             else:
                 print("No socket available to send message.")
@@ -586,8 +2895,8 @@ class Server:
         try:
             socket_to_use = self.connection if is_server else self.client_socket
             if socket_to_use:
-                message = socket_to_use.recv(1024).decode('utf-8')
-                return message
+                payload = recv_frame(socket_to_use)
+                return payload.decode('utf-8') if payload is not None else None
             else:
                 print("No socket available to receive message.")
                 return None
@@ -0,0 +1,159 @@
+"""
+The fast paths of the matching engine against their reference versions, on a seeded synthetic pool.
+"""
+import dataclasses
+from difflib import SequenceMatcher
+
+import numpy as np
+import pytest
+from sklearn.metrics.pairwise import cosine_similarity
+
+from benchmarks.generators import generate_freelancer_store, generate_projects
+from sharding import ShardedMatchingEngine
+from sjm import (
+    MANUAL_KEYWORDS, CollaborativeModel, ConstraintIndex, KeywordMatcher, MatchingEngine, SkillIndex
+)
+
+POOL_SIZE = 3000
+TOP_N = 5
+
+
+class KeywordExtractor:
+    """
+    SkillsExtract's manual keyword step alone, so the tests need no NLTK data.
+    """
+
+    def __init__(self):
+        self.matcher = KeywordMatcher(MANUAL_KEYWORDS)
+
+    def extract_skills(self, description):
+        return self.matcher.find_all(description.lower())
+
+
+def summary(matches):
+    return [(match['freelancer'].id, match['combined_score'], match['skill_overlap']) for match in matches]
+
+
+def build_engine(store):
+    engine = MatchingEngine(store, generate_projects(20, seed=5), KeywordExtractor(), CollaborativeModel())
+    engine.train_models()
+    return engine
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return build_engine(generate_freelancer_store(POOL_SIZE, seed=11))
+
+
+@pytest.fixture(scope='module')
+def projects():
+    return generate_projects(12, seed=12)
+
+
+def test_pruned_top_n_equals_exhaustive(engine, projects):
+    for project in projects:
+        rows = engine.candidate_rows(project.budget_range)
+        for candidate_rows in (None, rows):
+            engine.prune = True
+            pruned = engine.match_freelancers(project, top_n=TOP_N, rows=candidate_rows)
+            engine.prune = False
+            exhaustive = engine.match_freelancers(project, top_n=TOP_N, rows=candidate_rows)
+            engine.prune = True
+            assert summary(pruned) == summary(exhaustive)
+
+
+def test_batched_matching_equals_per_project(engine, projects):
+    batched = engine.match_projects(projects, top_n=TOP_N, block_size=5)
+    assert [summary(matches) for matches in batched] == [
+        summary(engine.match_freelancers(project, top_n=TOP_N)) for project in projects
+    ]
+
+
+def test_sharded_matching_equals_single_process(engine, projects):
+    with ShardedMatchingEngine(engine, n_shards=3) as sharded:
+        for project in projects[:4]:
+            assert summary(sharded.match_freelancers(project, top_n=TOP_N)) == summary(
+                engine.match_freelancers(project, top_n=TOP_N)
+            )
+            constrained = sharded.match_freelancers(
+                project, top_n=TOP_N, constraints={'budget_range': project.budget_range}
+            )
+            rows = engine.candidate_rows(project.budget_range)
+            assert summary(constrained) == summary(engine.match_freelancers(project, top_n=TOP_N, rows=rows))
+
+
+def test_restarted_shard_follows_the_updated_pool(projects):
+    engine = build_engine(generate_freelancer_store(600, seed=15))
+    with ShardedMatchingEngine(engine, n_shards=3) as sharded:
+        # A copy of a top match under a new id, and a removal that shifts every later row
+        best = engine.match_freelancers(projects[0], top_n=1)[0]['freelancer']
+        engine.upsert_freelancer(dataclasses.replace(best, id='newcomer'))
+        engine.remove_freelancer(engine.freelancers[0].id)
+
+        process = sharded._processes[1]
+        process.kill()
+        process.join()
+        for project in projects[:4]:
+            assert summary(sharded.match_freelancers(project, top_n=TOP_N)) == summary(
+                engine.match_freelancers(project, top_n=TOP_N)
+            )
+        assert sharded.pool_version == engine.pool_version
+
+
+def test_skill_index_equals_pairwise_sequence_matcher(engine):
+    skill_index = engine.skill_index
+    threshold = skill_index.threshold
+    queries = skill_index.skills + ['Python', 'reactjs', 'graphic desing', 'xyz', '']
+    for query in queries:
+        expected = [
+            skill_id for skill_id, skill in enumerate(skill_index.skills)
+            if SequenceMatcher(None, query.lower(), skill).ratio() > threshold
+        ]
+        assert skill_index.similar_ids(query).tolist() == expected
+
+    required = ['python', 'react', 'ui design', 'seo writing']
+    counts = skill_index.overlap_counts(required)
+    for row in range(0, POOL_SIZE, 7):
+        expected = sum(
+            SequenceMatcher(None, skill.lower(), freelancer_skill.lower()).ratio() > threshold
+            for skill in required
+            for freelancer_skill in engine.freelancers.skills_of(row)
+        )
+        assert counts[row] == expected
+
+
+def test_incremental_updates_equal_fresh_indexes(projects):
+    engine = build_engine(generate_freelancer_store(400, seed=13))
+    engine.candidate_rows((0, 100))
+    original_digest = engine.pool_digest()
+    rng = np.random.default_rng(14)
+    for step in range(60):
+        freelancer = engine.freelancers[int(rng.integers(len(engine.freelancers)))]
+        if step % 7 == 6:
+            engine.remove_freelancer(freelancer.id)
+            continue
+        engine.upsert_freelancer(dataclasses.replace(
+            freelancer,
+            id=freelancer.id if step % 2 else f"new-{step}",
+            skills=freelancer.skills[::-1][:3] + ['rust'],
+            hourly_rate=float(rng.uniform(5, 90)),
+            availability=bool(step % 3),
+        ))
+
+    store = engine.freelancers
+    assert original_digest != engine.pool_digest()
+    assert engine.pool_digest() == MatchingEngine(store.copy(), [], KeywordExtractor()).pool_digest()
+    fresh_constraints = ConstraintIndex(store)
+    fresh_skills = SkillIndex.build(store)
+    profiles = engine.profile_index.transform(list(store.profile_texts()))
+    for project in projects[:4]:
+        assert engine.candidate_rows(project.budget_range, True).tolist() == (
+            fresh_constraints.candidates(project.budget_range, True).tolist()
+        )
+        assert engine.skill_index.overlap_counts(project.required_skills).tolist() == (
+            fresh_skills.overlap_counts(project.required_skills).tolist()
+        )
+        query = engine.profile_index.transform([project.description])
+        similarity = engine.profile_index.similarity(query)
+        # fit_transform and transform round the fitted rows differently in the last ulp
+        np.testing.assert_allclose(similarity, cosine_similarity(query, profiles), rtol=0, atol=1e-12)
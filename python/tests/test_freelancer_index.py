@@ -0,0 +1,42 @@
+import dataclasses
+
+import numpy as np
+
+from benchmarks.generators import generate_freelancer_store, generate_projects
+from freelancer_index import load_index, save_index
+from sjm import CollaborativeModel
+from test_equivalence import TOP_N, KeywordExtractor, build_engine, summary
+
+
+def is_mapped(array) -> bool:
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def test_loaded_index_stays_mapped_until_written(tmp_path):
+    engine = build_engine(generate_freelancer_store(300, seed=21))
+    save_index(engine, str(tmp_path))
+    loaded = load_index(str(tmp_path), KeywordExtractor(), CollaborativeModel())
+
+    # Workers share these pages; nothing may copy them before an update
+    postings = loaded.skill_index.postings
+    for array in (postings.data, postings.indices, postings.indptr, loaded.experience, loaded.ratings):
+        assert is_mapped(array)
+
+    projects = generate_projects(4, seed=22)
+    for project in projects:
+        assert summary(loaded.match_freelancers(project, top_n=TOP_N)) == summary(
+            engine.match_freelancers(project, top_n=TOP_N)
+        )
+
+    freelancer = dataclasses.replace(engine.freelancers[0], experience=25, rating=5.0)
+    for target in (engine, loaded):
+        target.upsert_freelancer(freelancer)
+    assert not is_mapped(loaded.experience)
+    for project in projects:
+        assert summary(loaded.match_freelancers(project, top_n=TOP_N)) == summary(
+            engine.match_freelancers(project, top_n=TOP_N)
+        )
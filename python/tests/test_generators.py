@@ -0,0 +1,8 @@
+from benchmarks.generators import TITLE_SKILLS
+from sjm import MANUAL_KEYWORDS
+
+
+def test_title_skills_are_keywords():
+    # Skills outside the vocabulary would never be extracted from a description
+    unknown = {skill for skills in TITLE_SKILLS.values() for skill in skills} - set(MANUAL_KEYWORDS)
+    assert not unknown
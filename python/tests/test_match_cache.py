@@ -0,0 +1,66 @@
+from dataclasses import replace
+
+import pytest
+
+from match_cache import DiskMatchCache, MatchCache, project_fingerprint
+from sjm import Project
+
+WEIGHTS = {'content': 0.5, 'collaborative': 0.4, 'experience': 0.2, 'rating': 0.1}
+
+
+def make_project(**fields) -> Project:
+    defaults = dict(
+        id='p1',
+        description='Need a Python developer for a data pipeline',
+        required_skills=['Python', 'SQL'],
+        budget_range=(20.0, 80.0),
+        complexity='medium',
+    )
+    return Project(**{**defaults, **fields})
+
+
+def test_fingerprint_ignores_case_order_and_whitespace():
+    project = make_project()
+    repost = replace(
+        project,
+        id='p2',
+        description='  need a PYTHON developer   for a data pipeline ',
+        required_skills=['sql', 'PYTHON'],
+    )
+    assert project_fingerprint(project, WEIGHTS, 5) == project_fingerprint(repost, WEIGHTS, 5)
+
+
+def test_fingerprint_keeps_duplicate_skills():
+    # Every copy of a required skill counts towards the overlap filter
+    single = make_project(required_skills=['python'])
+    duplicated = make_project(required_skills=['python', 'python'])
+    assert project_fingerprint(single, WEIGHTS, 5) != project_fingerprint(duplicated, WEIGHTS, 5)
+
+
+def test_fingerprint_covers_query_parameters():
+    project = make_project()
+    key = project_fingerprint(project, WEIGHTS, 5)
+    assert key != project_fingerprint(project, WEIGHTS, 6)
+    assert key != project_fingerprint(project, {**WEIGHTS, 'content': 0.6}, 5)
+    assert key != project_fingerprint(replace(project, budget_range=(20.0, 90.0)), WEIGHTS, 5)
+    assert key != project_fingerprint(replace(project, complexity='high'), WEIGHTS, 5)
+
+
+def test_incomplete_backend_fails_on_creation():
+    class ReadOnlyCache(MatchCache):
+        def get(self, key, pool_token):
+            return None
+
+    with pytest.raises(TypeError):
+        ReadOnlyCache()
+
+
+def test_disk_cache_keeps_entries_of_other_pools(tmp_path):
+    # Two workers sharing the file while they serve different pools
+    path = str(tmp_path / 'matches.sqlite')
+    first, second = DiskMatchCache(path), DiskMatchCache(path)
+    first.put('key', 'pool-a', [])
+    second.put('key', 'pool-b', [])
+    assert first.get('key', 'pool-a') == []
+    assert second.get('key', 'pool-b') == []
+    assert first.get('key', 'pool-c') is None
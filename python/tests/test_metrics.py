@@ -0,0 +1,33 @@
+import pytest
+
+import metrics
+
+
+def test_prometheus_text_keeps_large_counters_exact():
+    sink = metrics.InMemorySink()
+    sink.increment('candidates_scored', 123_456_789)
+    sink.increment('weighted', 0.1)
+    sink.increment('weighted', 0.2)
+    text = metrics.prometheus_text(sink)
+    assert 'sjm_candidates_scored_total 123456789\n' in text
+    assert f'sjm_weighted_total {0.1 + 0.2!r}\n' in text
+
+
+def test_prometheus_text_histogram_sum_and_count():
+    sink = metrics.InMemorySink()
+    for _ in range(3):
+        sink.observe('selection', 0.25)
+    sink.observe('selection', 1e-7)
+    text = metrics.prometheus_text(sink)
+    assert f'sjm_stage_duration_seconds_sum{{stage="selection"}} {0.75 + 1e-7!r}\n' in text
+    assert 'sjm_stage_duration_seconds_count{stage="selection"} 4\n' in text
+    assert 'sjm_stage_duration_seconds_bucket{stage="selection",le="+Inf"} 4\n' in text
+
+
+def test_incomplete_sink_fails_on_creation():
+    class CountingSink(metrics.MetricsSink):
+        def increment(self, name, value=1):
+            pass
+
+    with pytest.raises(TypeError):
+        CountingSink()
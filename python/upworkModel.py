@@ -3,44 +3,101 @@ import sys
 import uuid
 import json
 import logging
+from concurrent.futures import Future
 from typing import List, Dict, Optional
 import numpy as np
-import nltk
-nltk.download('punkt_tab')
+
+import metrics
+from match_cache import MatchCache, project_fingerprint
 
 from sjm import (
     SkillsExtract, 
+    download_nltk_resources,
     Freelancer, 
+    FreelancerStore,
     Project, 
-    Server, 
-    normalize_csv, 
+    freelancer_column,
     MatchingEngine,
     CollaborativeModel
 )
+from interview_server import InterviewServer
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG, 
-    format='%(asctime)s - %(levelname)s: %(message)s',
-    handlers=[
-        logging.FileHandler('upwork_integration.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Upwork CSV header for each Freelancer field
+UPWORK_CSV_COLUMNS = {
+    'id': 'freelancer_id',
+    'username': 'name',
+    'name': 'name',
+    'job_title': 'job_title',
+    'skills': 'skills',
+    'experience': 'years_of_experience',
+    'rating': 'success_rate',
+    'hourly_rate': 'hourly_rate',
+    'profile_url': 'portfolio_url',
+    'total_sales': 'total_jobs',
+    'availability': 'top_rated',
+    'total_hours': 'hours_worked',
+}
+
+
+def _file_signature(path: str) -> str:
+    """
+    Path, size and modification time of a file, which change whenever it is rewritten.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return os.path.abspath(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def configure_logging(log_file: str = 'upwork_integration.log', level: int = logging.INFO):
+    """
+    Log to a file and stdout; called by entry points, never on import.
+    """
+    logging.basicConfig(
+        level=level, 
+        format='%(asctime)s - %(levelname)s: %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
 class UpworkIntegrationModel:
-    def __init__(self, csv_file_path: str):
+    def __init__(
+        self,
+        csv_file_path: str,
+        index_path: Optional[str] = None,
+        csv_chunksize: int = 100_000,
+        n_candidates: Optional[int] = None,
+        match_cache: Optional[MatchCache] = None
+    ):
         """
         Initialize the Upwork Integration Model
         
         Args:
             csv_file_path (str): Path to the Upwork freelancers CSV file
+            index_path (str, optional): Prebuilt freelancer index directory, used instead of the CSV when present
+            csv_chunksize (int, optional): Rows read per block when loading the CSV
+            n_candidates (int, optional): Re-rank only this many freelancers retrieved by profile
+                similarity instead of scoring the whole pool. Defaults to exact scoring.
+            match_cache (MatchCache, optional): Reuse find_top_matches results for repeated
+                projects until the freelancer pool changes. Defaults to no caching.
         """
         self.csv_file_path = csv_file_path
+        self.index_path = index_path
+        self.csv_chunksize = csv_chunksize
+        self.n_candidates = n_candidates
+        self.match_cache = match_cache
         self.skill_extractor = SkillsExtract()
         self.freelancers = None
         self.matching_engine = None
+        # Data source of the loaded pool, part of the match cache's pool token
+        self.pool_source: Optional[str] = None
+        # Started on the first interview and kept until close()
+        self.interview_server: Optional[InterviewServer] = None
         
         # Upwork-specific weights for the matching system
         self.custom_weights = {
@@ -51,33 +108,16 @@ class UpworkIntegrationModel:
             'top_rated': 0.3, 
         }
 
-    def load_freelancers(self) -> List[Freelancer]:
+    def load_freelancers(self) -> FreelancerStore:
         """
         Load and normalize freelancers from Upwork CSV.
 
         Returns:
-            List[Freelancer]: Normalized freelancer data.
+            FreelancerStore: Normalized freelancer data in columnar form.
         """
         try:
-            upwork_columns = {
-                'id': 'freelancer_id',
-                'username': 'name',
-                'name': 'name',
-                'job_title': 'job_title',
-                'skills': 'skills',
-                'experience': 'years_of_experience',
-                'rating': 'success_rate',
-                'hourly_rate': 'hourly_rate',
-                'profile_url': 'portfolio_url',
-                'total_sales': 'total_jobs',
-                'availability': 'top_rated',
-                'total_hours': 'hours_worked'
-            }
-
-            freelancers = normalize_csv(self.csv_file_path, upwork_columns)
-
-            for freelancer in freelancers:
-                freelancer.availability = freelancer.availability == 'True'
+            # The CSV loader converts the top_rated column to booleans
+            freelancers = FreelancerStore.from_csv(self.csv_file_path, UPWORK_CSV_COLUMNS, chunksize=self.csv_chunksize)
 
             self.freelancers = freelancers
             logger.info(f"Loaded {len(freelancers)} freelancers from {self.csv_file_path}")
@@ -103,27 +143,27 @@ class UpworkIntegrationModel:
 
                 num_freelancers = len(freelancer_data)
                 if num_freelancers == 0:
+                    self.sales_min = self.sales_max = None
                     self.interaction_matrix = np.zeros((num_freelancers, 2))
                     return
 
-                total_jobs = np.array([freelancer.total_sales for freelancer in freelancer_data])
-                success_rates = np.array([freelancer.rating for freelancer in freelancer_data])
+                total_jobs = freelancer_column(freelancer_data, 'total_sales')
+                success_rates = freelancer_column(freelancer_data, 'rating')
+                self.sales_min, self.sales_max = total_jobs.min(), total_jobs.max()
 
                 total_jobs_norm = (total_jobs - total_jobs.min()) / (total_jobs.max() - total_jobs.min())
                 success_rates_norm = success_rates / 100.0
 
                 self.interaction_matrix = np.column_stack((total_jobs_norm, success_rates_norm))
 
-            def predict(self, project_description: str, project_skills: List[str]) -> List[float]:
+            def feature_row(self, freelancer: Freelancer) -> np.ndarray:
                 """
-                Predict match scores based on collaborative metrics.
+                Normalized total_jobs and success_rate of one freelancer, as in train().
                 """
-                if self.interaction_matrix is None or self.interaction_matrix.size == 0:
-                    logger.warning("Interaction matrix is empty. Returning zero scores.")
-                    return [0.0] * len(self.freelancer_data)
-
-                scores = np.nanmean(self.interaction_matrix, axis=1)
-                return np.nan_to_num(scores).tolist()
+                if self.sales_min is None:
+                    return np.zeros(2)
+                total_jobs_norm = (np.float64(freelancer.total_sales) - self.sales_min) / (self.sales_max - self.sales_min)
+                return np.array([total_jobs_norm, freelancer.rating / 100.0])
 
         return UpworkCollaborativeModel()
 
@@ -144,53 +184,102 @@ class UpworkIntegrationModel:
         """
         Filter freelancers based on Upwork-specific constraints.
         """
-        filtered_matches = []
-        for match in matches:
-            freelancer = match['freelancer']
-            
-            # Upwork-specific hard constraints
-            if freelancer.hourly_rate < project.budget_range[0] or freelancer.hourly_rate > project.budget_range[1]:
-                logger.debug(f"Excluded {freelancer.username}: Hourly rate ${freelancer.hourly_rate} out of budget.")
-                continue
-            
-            # Prioritize top-rated freelancers for critical projects
-            if project.complexity == 'high' and not freelancer.availability:
-                logger.debug(f"Excluded {freelancer.username}: Not top-rated for high-complexity project.")
-                continue
-            
-            # Refine skill matching and check overlap
-            overlap_count = self.matching_engine.refine_skill_matching(project.required_skills, freelancer.skills)
-            if overlap_count < 2:  # Require at least 2 overlapping or similar skills
-                logger.debug(f"Excluded {freelancer.username}: Insufficient skill overlap ({overlap_count} matching skills).")
-                continue
-            
-            # Passed all filters
-            filtered_matches.append(match)
-        return filtered_matches
-
-    def find_top_matches(self, project: Project, top_n: int = 5):
-        try:
-            if not self.matching_engine:
-                self.initialize_matching_engine()
+        with metrics.timer('filter'):
+            return [match for match in matches if self._passes_filters(project, match)]
 
-            self.custom_weights = self.adjust_weights_for_project(project)
-
-            all_matches = self.matching_engine.match_freelancers(project, weights=self.custom_weights)
-            filtered_matches = self.filter_freelancers(project, all_matches)
+    def _passes_filters(self, project: Project, match: Dict) -> bool:
+        """
+        Check a single match against the Upwork-specific constraints.
+        """
+        freelancer = match['freelancer']
+
+        # Upwork-specific hard constraints
+        if freelancer.hourly_rate < project.budget_range[0] or freelancer.hourly_rate > project.budget_range[1]:
+            logger.debug(f"Excluded {freelancer.username}: Hourly rate ${freelancer.hourly_rate} out of budget.")
+            metrics.increment('filtered_budget')
+            return False
+
+        # Prioritize top-rated freelancers for critical projects
+        if project.complexity == 'high' and not freelancer.availability:
+            logger.debug(f"Excluded {freelancer.username}: Not top-rated for high-complexity project.")
+            metrics.increment('filtered_availability')
+            return False
+
+        # Refine skill matching and check overlap
+        overlap_count = self.matching_engine.refine_skill_matching(project.required_skills, freelancer.skills)
+        if overlap_count < 2:  # Require at least 2 overlapping or similar skills
+            logger.debug(f"Excluded {freelancer.username}: Insufficient skill overlap ({overlap_count} matching skills).")
+            metrics.increment('filtered_overlap')
+            return False
+
+        # Passed all filters
+        return True
 
-            top_matches = filtered_matches[:top_n]
-            logger.info(f"Found {len(top_matches)} top matches")
-            return top_matches
-        except Exception as e:
-            logger.error(f"Error finding matches: {e}")
-            raise
+    def find_top_matches(self, project: Project, top_n: int = 5):
+        with metrics.timer('find_top_matches'):
+            try:
+                if not self.matching_engine:
+                    self.initialize_matching_engine()
+
+                # Kept local: the model may serve concurrent requests, and adjustments must not compound
+                weights = self.adjust_weights_for_project(project)
+
+                if self.match_cache is not None:
+                    cache_key = project_fingerprint(project, weights, top_n)
+                    pool_token = self.pool_token()
+                    cached = self.match_cache.get(cache_key, pool_token)
+                    if cached is not None:
+                        metrics.increment('match_cache_hits')
+                        logger.info(f"Found {len(cached)} top matches (cached)")
+                        return cached
+                    metrics.increment('match_cache_misses')
+
+                # Push the hard constraints down so only surviving rows are scored
+                candidate_rows = self.matching_engine.candidate_rows(
+                    budget_range=project.budget_range,
+                    require_available=project.complexity == 'high',
+                    required_skills=project.required_skills,
+                    min_overlap=2,
+                )
+                if self.n_candidates is not None:
+                    candidate_rows = self.matching_engine.retrieve_candidates(
+                        project, n_candidates=self.n_candidates, rows=candidate_rows
+                    )
+                logger.debug(
+                    f"{len(candidate_rows)} of {len(self.matching_engine.freelancers)} freelancers pass the hard constraints"
+                )
+
+                # Pull ranked candidates only until enough of them pass the filters
+                top_matches = []
+                filter_clock = metrics.stopwatch('filter')
+                if top_n > 0:
+                    for match in self.matching_engine.iter_matches(
+                        project, weights=weights, batch_size=top_n * 4, rows=candidate_rows
+                    ):
+                        with filter_clock:
+                            passed = self._passes_filters(project, match)
+                        if passed:
+                            top_matches.append(match)
+                            if len(top_matches) == top_n:
+                                break
+                filter_clock.record()
+
+                if self.match_cache is not None:
+                    self.match_cache.put(cache_key, pool_token, top_matches)
+
+                logger.info(f"Found {len(top_matches)} top matches")
+                logger.debug(f"Skill similarity cache: {self.matching_engine.skill_cache_stats()}")
+                return top_matches
+            except Exception as e:
+                logger.error(f"Error finding matches: {e}")
+                raise
         
     def run_upwork_matching(self):
         """
         Main workflow for Upwork freelancer matching.
         """
         try:
-            self.load_freelancers()
+            self.initialize_matching_engine()
             project = self.collect_project_details()
             top_matches = self.find_top_matches(project)
 
@@ -218,90 +307,132 @@ class UpworkIntegrationModel:
         """
         Initialize a Upwork-customized matching engine.
         """
-        if not self.freelancers:
-            self.load_freelancers()
-
-        collaborative_model = self.customize_matching_engine()
-
-        self.matching_engine = MatchingEngine(
-            freelancers=self.freelancers,
-            projects=[],
-            skill_extractor=self.skill_extractor,
-            collaborative_model=collaborative_model,
-        )
-        self.matching_engine.train_models()
-        logger.info("Matching engine initialized with Upwork-specific customization")
+        if self.has_index():
+            from freelancer_index import load_index
+
+            self.matching_engine = load_index(
+                self.index_path, self.skill_extractor, self.customize_matching_engine()
+            )
+            self.freelancers = self.matching_engine.freelancers
+            self.pool_source = _file_signature(os.path.join(self.index_path, 'manifest.json'))
+            logger.info(f"Matching engine loaded from index {self.index_path}")
+        else:
+            if not self.freelancers:
+                self.load_freelancers()
+
+            collaborative_model = self.customize_matching_engine()
+
+            self.matching_engine = MatchingEngine(
+                freelancers=self.freelancers,
+                projects=[],
+                skill_extractor=self.skill_extractor,
+                collaborative_model=collaborative_model,
+            )
+            self.matching_engine.train_models()
+            self.pool_source = _file_signature(self.csv_file_path)
+            logger.info("Matching engine initialized with Upwork-specific customization")
+
+        if self.match_cache is not None:
+            # Hashing the pool takes a moment; better here than in the first request
+            self.matching_engine.pool_digest()
         
         
+    def pool_token(self) -> str:
+        """
+        Identity of the freelancer pool the engine serves: its data source and content digest.
+
+        Every worker serving the same pool computes the same token, so they can share a DiskMatchCache.
+        """
+        return f"{self.pool_source}:{self.matching_engine.pool_digest()}"
+
+    def has_index(self) -> bool:
+        return bool(self.index_path) and os.path.isfile(os.path.join(self.index_path, 'manifest.json'))
+
+    def build_index(self, index_path: str):
+        """
+        Build the matching engine from the CSV and persist it as a freelancer index.
+        """
+        from freelancer_index import save_index
+
+        self.index_path = None
+        self.freelancers = None
+        self.initialize_matching_engine()
+        save_index(self.matching_engine, index_path)
+        self.index_path = index_path
+
     def interview_freelancer(self, freelancer: Freelancer, project: Project):
         """
         Conduct interview with a selected freelancer.
         """
         logger.info(f"Starting interview for {freelancer.username}")
 
-            # Initialize server
-        server = Server()
-        server.start_server()
-
-        try:
-            questions = []
-            # Collect custom client message
-            custom_question = input("Do you want to send a custom question to the freelancer? (yes/no): ")
-            if custom_question.lower() == "yes":
-                cl_questions = input("Enter your question (use commas if you want to ask more than one question): ")
-                
-                client_questions = [ques.strip() for ques in cl_questions.split(',') if cl_questions.strip]
-                
-                questions.extend(client_questions)
-            else:
-                None
-
-            # Create interview context
-            interview_context = {
-                'project_id': project.id,
-                'project_description': project.description,
-                'freelancer_username': freelancer.username,
-                'freelancer_job_title': freelancer.job_title,
-                'freelancer_skills': freelancer.skills,
-                'freelancer_id': freelancer.id,
-                'hourly_rate': freelancer.hourly_rate,
-            }
-
-            # Send context to freelancer
-            server.send_message(json.dumps(interview_context, indent=2))
-
-            # Receive interview questions
-            questions_json = server.receive_message()
-            questions = json.loads(questions_json)
+        questions = []
+        # Collect custom client message
+        custom_question = input("Do you want to send a custom question to the freelancer? (yes/no): ")
+        if custom_question.lower() == "yes":
+            cl_questions = input("Enter your question (use commas if you want to ask more than one question): ")
             
-            print("Currently interviewing user, you will receive a response shortly....")
-
-            # Wait for freelancer's answers
-            answers_json = server.receive_message()
-            answers = json.loads(answers_json)
-
-            # Evaluate answers
-            score = self.evaluate_answers(answers)
-
-            # Prepare interview results
-            interview_results = {
-                'freelancer_username': freelancer.username,
-                'freelancer_job_title': freelancer.job_title,
-                'questions_and_answers': [{"question": q, "answer": a} for q, a in answers.items()],
-                'score': score,
-                'project_id': project.id
-            }
+            client_questions = [ques.strip() for ques in cl_questions.split(',') if cl_questions.strip]
             
-            print(f"\nInterview Evaluation Complete for {freelancer.username}!\n")
-            
-            # Send results back to client
-            server.send_message(json.dumps(interview_results, indent=2))
+            questions.extend(client_questions)
+        else:
+            None
+
+        interview = self.dispatch_interview(freelancer, project)
+        print("Currently interviewing user, you will receive a response shortly....")
+        interview_results = interview.result()
 
-        finally:
-            # Close the connection
-            server.close_connection()
-            print("Server closed after interview.")
+        print(f"\nInterview Evaluation Complete for {freelancer.username}!\n")
         return f"Interview Results:\n{json.dumps(interview_results, indent=2)}"
+
+    def dispatch_interview(self, freelancer: Freelancer, project: Project) -> Future:
+        """
+        Start an interview on the shared interview server without blocking.
+
+        Returns:
+            Future: Resolves with the interview results.
+        """
+        if self.interview_server is None:
+            self.interview_server = InterviewServer(self._interview_results).start()
+
+        # Create interview context
+        interview_context = {
+            'project_id': project.id,
+            'project_description': project.description,
+            'freelancer_username': freelancer.username,
+            'freelancer_job_title': freelancer.job_title,
+            'freelancer_skills': freelancer.skills,
+            'freelancer_id': freelancer.id,
+            'hourly_rate': freelancer.hourly_rate,
+        }
+        return self.interview_server.dispatch(interview_context)
+
+    def close(self):
+        """
+        Stop the interview server, if one was started, and release its port.
+        """
+        if self.interview_server is not None:
+            self.interview_server.close()
+            self.interview_server = None
+
+    def __enter__(self) -> 'UpworkIntegrationModel':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _interview_results(self, interview_context: Dict, answers: Dict[str, str]) -> Dict:
+        # Evaluate answers
+        score = self.evaluate_answers(answers)
+
+        # Prepare interview results
+        return {
+            'freelancer_username': interview_context['freelancer_username'],
+            'freelancer_job_title': interview_context['freelancer_job_title'],
+            'questions_and_answers': [{"question": q, "answer": a} for q, a in answers.items()],
+            'score': score,
+            'project_id': interview_context['project_id']
+        }
      
     def collect_project_details(self) -> Project:
         try:
@@ -359,12 +490,41 @@ class UpworkIntegrationModel:
                 return choice
             print(f"Invalid choice. Please select from {', '.join(choices)}.")
 
+DEFAULT_INDEX_PATH = "freelancer_index"
+
+
 def main():
+    configure_logging()
+
+    if len(sys.argv) > 1 and sys.argv[1] == "setup-nltk":
+        # python upworkModel.py setup-nltk
+        if not download_nltk_resources():
+            print("Some NLTK resources could not be downloaded.")
+            sys.exit(1)
+        print("NLTK resources installed.")
+        return
+
+    if len(sys.argv) > 1 and sys.argv[1] == "build-index":
+        # python upworkModel.py build-index [csv_path] [index_path]
+        csv_path = sys.argv[2] if len(sys.argv) > 2 else "upwork_freelancers.csv"
+        index_path = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_INDEX_PATH
+        UpworkIntegrationModel(csv_path).build_index(index_path)
+        print(f"Freelancer index written to '{index_path}'.")
+        return
+
+    if len(sys.argv) > 1 and sys.argv[1] == "freelancer" and len(sys.argv) not in (3, 5):
+        # The interview server only talks to clients that name their session
+        print("Usage: python upworkModel.py freelancer <session_id> [host port]")
+        sys.exit(1)
+
     while True: 
         if len(sys.argv) > 1 and sys.argv[1] == "freelancer":
             # Run the freelancer logic
+            # python upworkModel.py freelancer <session_id> [host port]
             from freelancer import main as freelancer_main
-            freelancer_main("127.0.0.1", "65432")  # Use appropriate host/port
+            session_id = sys.argv[2]
+            host, port = sys.argv[3:5] if len(sys.argv) == 5 else ("127.0.0.1", "65432")
+            freelancer_main(host, port, session_id)
         else:
             print("Starting Upwork Model....")
                 # Entering the CSV file path manually
@@ -379,11 +539,10 @@ def main():
                 return
 
             try:
-                # Initialize the Upwork integration model
-                upwork_model = UpworkIntegrationModel(csv_path)
-                
-                # Run the Upwork matching process
-                upwork_model.run_upwork_matching()
+                # Initialize the Upwork integration model; closing it frees the interview port for the next run
+                with UpworkIntegrationModel(csv_path, index_path=DEFAULT_INDEX_PATH) as upwork_model:
+                    # Run the Upwork matching process
+                    upwork_model.run_upwork_matching()
             except Exception as e:
                 logger.error(f"Upwork integration failed: {e}") 
                   